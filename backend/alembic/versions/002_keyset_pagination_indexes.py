@@ -0,0 +1,38 @@
+"""Keyset pagination indexes on (created_at DESC, id DESC).
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cursor pages seek on (created_at, id) and read `limit` rows in index order
+    op.create_index(
+        "idx_eval_runs_created_id",
+        "eval_runs",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "idx_agent_configs_created_id",
+        "agent_configs",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    # Superseded by idx_eval_runs_created_id (same leading column)
+    op.drop_index("idx_eval_runs_created", table_name="eval_runs")
+
+
+def downgrade() -> None:
+    op.create_index("idx_eval_runs_created", "eval_runs", [sa.text("created_at DESC")])
+    op.drop_index("idx_agent_configs_created_id", table_name="agent_configs")
+    op.drop_index("idx_eval_runs_created_id", table_name="eval_runs")
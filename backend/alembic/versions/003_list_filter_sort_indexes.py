@@ -0,0 +1,91 @@
+"""Composite indexes matching the list endpoints' filter + sort shapes.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Listing sort key shared by eval_runs and agent_configs (see migration 002)
+_NEWEST_FIRST = [sa.text("created_at DESC"), sa.text("id DESC")]
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # list_eval_runs: WHERE <filter> ORDER BY created_at DESC, id DESC
+        op.create_index(
+            "idx_eval_runs_status_created", "eval_runs",
+            ["status", *_NEWEST_FIRST], postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_eval_runs_agent_created", "eval_runs",
+            ["agent_config_id", *_NEWEST_FIRST], postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_eval_runs_scenario_created", "eval_runs",
+            ["scenario_id", *_NEWEST_FIRST], postgresql_concurrently=True,
+        )
+
+        # list_conversations: WHERE eval_run_id = ? ORDER BY sequence_num
+        op.create_index(
+            "idx_conversations_run_seq", "conversations",
+            ["eval_run_id", "sequence_num"], postgresql_concurrently=True,
+        )
+
+        # list_agent_configs?is_active=true — the common case, kept small as a partial index
+        op.create_index(
+            "idx_agent_configs_active_created", "agent_configs",
+            _NEWEST_FIRST, postgresql_concurrently=True,
+            postgresql_where=sa.text("is_active = true"),
+        )
+
+        # Single-column indexes now served by the leading column of the composites above
+        op.drop_index("idx_eval_runs_status", table_name="eval_runs", postgresql_concurrently=True)
+        op.drop_index(
+            "idx_eval_runs_agent_config", table_name="eval_runs", postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_conversations_eval_run", table_name="conversations", postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_conversations_eval_run", "conversations", ["eval_run_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_eval_runs_agent_config", "eval_runs", ["agent_config_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_eval_runs_status", "eval_runs", ["status"], postgresql_concurrently=True,
+        )
+
+        op.drop_index(
+            "idx_agent_configs_active_created", table_name="agent_configs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_conversations_run_seq", table_name="conversations", postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_eval_runs_scenario_created", table_name="eval_runs", postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_eval_runs_agent_created", table_name="eval_runs", postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_eval_runs_status_created", table_name="eval_runs", postgresql_concurrently=True,
+        )
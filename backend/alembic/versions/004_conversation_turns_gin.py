@@ -0,0 +1,38 @@
+"""GIN jsonb_path_ops index on conversations.turns.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Turns are written once when a conversation completes, so the array stays in
+    # place; the index serves containment filters like turns @> '[{"role": "tool"}]'
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_conversations_turns_gin",
+            "conversations",
+            ["turns"],
+            postgresql_using="gin",
+            postgresql_ops={"turns": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_conversations_turns_gin",
+            table_name="conversations",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,56 @@
+"""GIN jsonb_path_ops indexes on filterable JSONB columns.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column) — jsonb_path_ops only supports @> but is smaller and faster for it
+_GIN_INDEXES = [
+    ("idx_agent_configs_tools_gin", "agent_configs", "tools"),
+    ("idx_scenarios_constraints_gin", "scenarios", "constraints"),
+    ("idx_eval_runs_config_gin", "eval_runs", "config"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in _GIN_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=True,
+            )
+
+        # Pairwise verdicts are paired up by metadata->>'match_id'
+        op.create_index(
+            "idx_evaluations_pairwise_match",
+            "evaluations",
+            [sa.text("(metadata->>'match_id')")],
+            postgresql_where=sa.text("evaluator_type = 'pairwise_judge'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_evaluations_pairwise_match",
+            table_name="evaluations",
+            postgresql_concurrently=True,
+        )
+        for name, table, _ in reversed(_GIN_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,124 @@
+"""Hash-partition evaluations and metrics by conversation_id.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+# conversations stays unpartitioned: its id is the FK target of both tables here,
+# and a partitioned table can only be referenced through its partition key.
+
+
+def upgrade() -> None:
+    _swap(partitioned=True)
+
+
+def downgrade() -> None:
+    _swap(partitioned=False)
+
+
+def _swap(partitioned: bool) -> None:
+    """Rebuild both tables in the requested layout and copy rows across."""
+    for table in ("evaluations", "metrics"):
+        old = f"{table}_old"
+        op.rename_table(table, old)
+        # PK/unique/index names are schema-wide, so free them before recreating
+        for index in _INDEXES[table]:
+            op.drop_index(index[0], table_name=old)
+        for constraint, kind in _NAMED_CONSTRAINTS[table]:
+            op.drop_constraint(constraint, old, type_=kind)
+
+        _CREATE[table](partitioned)
+        if partitioned:
+            for i in range(PARTITIONS):
+                op.execute(
+                    f"CREATE TABLE {table}_p{i} PARTITION OF {table} "
+                    f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {i})"
+                )
+        for name, columns, kw in _INDEXES[table]:
+            op.create_index(name, table, columns, **kw)
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+        op.drop_table(old)
+
+
+def _create_evaluations(partitioned: bool) -> None:
+    op.create_table(
+        "evaluations",
+        sa.Column("id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("conversation_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("evaluator_type", sa.String(30), nullable=False),
+        sa.Column("evaluator_id", sa.String(255), nullable=True),
+        sa.Column("rubric_id", postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column("scores", postgresql.JSONB(), nullable=False),
+        sa.Column("overall_score", sa.Float(), nullable=True),
+        sa.Column("reasoning", sa.Text(), nullable=True),
+        sa.Column("per_turn_scores", postgresql.JSONB(), nullable=True),
+        sa.Column("metadata", postgresql.JSONB(), server_default="{}"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        # A partitioned table's primary key must include the partition key
+        sa.PrimaryKeyConstraint(
+            *(["id", "conversation_id"] if partitioned else ["id"]), name="pk_evaluations"
+        ),
+        sa.ForeignKeyConstraint(["conversation_id"], ["conversations.id"], name="fk_evaluations_conversation_id_conversations", ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["rubric_id"], ["rubrics.id"], name="fk_evaluations_rubric_id_rubrics"),
+        postgresql_partition_by="HASH (conversation_id)" if partitioned else None,
+    )
+
+
+def _create_metrics(partitioned: bool) -> None:
+    op.create_table(
+        "metrics",
+        sa.Column("id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("conversation_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("metric_name", sa.String(100), nullable=False),
+        sa.Column("value", sa.Float(), nullable=False),
+        sa.Column("unit", sa.String(50), nullable=True),
+        sa.Column("metadata", postgresql.JSONB(), server_default="{}"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint(
+            *(["id", "conversation_id"] if partitioned else ["id"]), name="pk_metrics"
+        ),
+        sa.ForeignKeyConstraint(["conversation_id"], ["conversations.id"], name="fk_metrics_conversation_id_conversations", ondelete="CASCADE"),
+        sa.UniqueConstraint("conversation_id", "metric_name", name="uq_metrics_conv_name"),
+        postgresql_partition_by="HASH (conversation_id)" if partitioned else None,
+    )
+
+
+_CREATE = {"evaluations": _create_evaluations, "metrics": _create_metrics}
+
+_NAMED_CONSTRAINTS = {
+    "evaluations": [("pk_evaluations", "primary")],
+    "metrics": [("pk_metrics", "primary"), ("uq_metrics_conv_name", "unique")],
+}
+
+# (name, columns, kwargs) as left by migrations 001 and 005
+_INDEXES = {
+    "evaluations": [
+        ("idx_evaluations_conversation", ["conversation_id"], {}),
+        ("idx_evaluations_type", ["evaluator_type"], {}),
+        ("idx_evaluations_overall", ["overall_score"], {}),
+        (
+            "idx_evaluations_pairwise_match",
+            [sa.text("(metadata->>'match_id')")],
+            {"postgresql_where": sa.text("evaluator_type = 'pairwise_judge'")},
+        ),
+    ],
+    "metrics": [
+        ("idx_metrics_conversation", ["conversation_id"], {}),
+        ("idx_metrics_name", ["metric_name"], {}),
+    ],
+}
@@ -0,0 +1,59 @@
+"""Covering indexes for the rankings join and the rubric/scenario list filters.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, kwargs) for the plain tables, built CONCURRENTLY
+_INDEXES = [
+    # get_rankings: conversations -> eval_runs join, answered from the index alone
+    (
+        "idx_conversations_run_covering", "conversations", ["eval_run_id"],
+        {"postgresql_include": ["id"]},
+    ),
+    (
+        "idx_eval_runs_scenario_agent", "eval_runs", ["scenario_id", "agent_config_id"], {},
+    ),
+    # list_scenarios: WHERE is_active/category/difficulty ORDER BY created_at DESC
+    (
+        "idx_scenarios_listing", "scenarios",
+        ["is_active", "category", "difficulty", sa.text("created_at DESC")], {},
+    ),
+    # list_rubrics: WHERE is_active ORDER BY created_at DESC
+    ("idx_rubrics_listing", "rubrics", ["is_active", sa.text("created_at DESC")], {}),
+]
+
+
+def upgrade() -> None:
+    # evaluations is partitioned (migration 006) and Postgres cannot build an index
+    # CONCURRENTLY on a partitioned parent, so this one runs in the transaction
+    op.create_index(
+        "idx_evaluations_pairwise_covering",
+        "evaluations",
+        ["evaluator_type"],
+        postgresql_include=["conversation_id", "metadata"],
+        postgresql_where=sa.text("evaluator_type = 'pairwise_judge'"),
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, kw in _INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, **kw)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+    op.drop_index("idx_evaluations_pairwise_covering", table_name="evaluations")
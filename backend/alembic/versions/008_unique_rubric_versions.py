@@ -0,0 +1,63 @@
+"""Make (name, version) unique on rubrics.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The old update_rubric wrote old.version + 1, so updating anything but the
+    # newest version could duplicate a (name, version). Renumber the names that
+    # have duplicates 1..n in (version, created_at) order so the index can build
+    op.execute(
+        """
+        UPDATE rubrics AS r
+        SET version = ranked.rn
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY name ORDER BY version, created_at, id
+            ) AS rn
+            FROM rubrics
+            WHERE name IN (
+                SELECT name FROM rubrics GROUP BY name, version HAVING count(*) > 1
+            )
+        ) AS ranked
+        WHERE r.id = ranked.id AND r.version <> ranked.rn
+        """
+    )
+
+    # update_rubric computes the next version in its INSERT; the unique index turns
+    # two concurrent updates claiming the same version into a conflict
+    with op.get_context().autocommit_block():
+        # A failed CONCURRENTLY build leaves an INVALID index behind; clear it on rerun
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_rubrics_name_version")
+        op.create_index(
+            "uq_rubrics_name_version", "rubrics", ["name", sa.text("version DESC")],
+            unique=True, postgresql_concurrently=True,
+        )
+        # Same key order, so the unique index serves the version listing too
+        op.drop_index(
+            "idx_rubrics_name_version", table_name="rubrics", postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_rubrics_name_version", "rubrics", ["name", sa.text("version DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "uq_rubrics_name_version", table_name="rubrics", postgresql_concurrently=True,
+        )
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from functools import partial
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, DateTime, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.etag import not_modified, weak_etag
 from app.core.exceptions import NotFoundError
-from app.db.session import get_db
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.response_cache import cache_key, get_cached, invalidate, set_cached
+from app.db.session import get_db, on_commit
 from app.models.agent_config import AgentConfig
 from app.schemas.agent_config import (
     AgentConfigCreate,
@@ -14,32 +20,64 @@ from app.schemas.agent_config import (
 
 router = APIRouter(prefix="/agent-configs", tags=["agent-configs"])
 
+_AGENT_CONFIG_LIST_ADAPTER = TypeAdapter(list[AgentConfigResponse])
+
+# Base statements are built once at import; handlers only add WHERE/LIMIT/OFFSET
+_ORDER = (AgentConfig.created_at.desc(), AgentConfig.id.desc())
+_PAGE_STMT = select(AgentConfig).order_by(*_ORDER)
+_WINDOWED_PAGE_STMT = select(AgentConfig, func.count().over().label("total")).order_by(*_ORDER)
+_COUNT_STMT = select(func.count()).select_from(AgentConfig)
+
+# Configs change rarely and every write path below invalidates the entry
+_CACHE_TTL_S = 60
+
 
 @router.get("", response_model=AgentConfigListResponse)
 async def list_agent_configs(
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
     is_active: bool | None = None,
     model: str | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> AgentConfigListResponse:
-    query = select(AgentConfig)
-    count_query = select(func.count(AgentConfig.id))
-
+    filters: list[ColumnElement[bool]] = []
     if is_active is not None:
-        query = query.where(AgentConfig.is_active == is_active)
-        count_query = count_query.where(AgentConfig.is_active == is_active)
+        filters.append(AgentConfig.is_active == is_active)
     if model:
-        query = query.where(AgentConfig.model == model)
-        count_query = count_query.where(AgentConfig.model == model)
-
-    total = (await db.execute(count_query)).scalar_one()
-    result = await db.execute(
-        query.order_by(AgentConfig.created_at.desc()).offset(offset).limit(limit)
+        filters.append(AgentConfig.model == model)
+
+    total: int | None
+    if cursor:
+        # Keyset page: an index range scan of `limit` rows, so no total is computed
+        created_at, last_id = decode_cursor(cursor)
+        keyset = tuple_(AgentConfig.created_at, AgentConfig.id) < tuple_(
+            created_at, last_id, types=[DateTime(timezone=True), AgentConfig.id.type]
+        )
+        result = await db.execute(_PAGE_STMT.where(*filters, keyset).limit(limit))
+        page = list(result.scalars().all())
+        total = None
+    else:
+        # Total rides along as a window column so the page and its count share one scan
+        result = await db.execute(
+            _WINDOWED_PAGE_STMT.where(*filters).offset(offset).limit(limit)
+        )
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end: no rows to carry the window count
+            total = (await db.execute(_COUNT_STMT.where(*filters))).scalar_one()
+        else:
+            total = 0
+        page = [r.AgentConfig for r in rows]
+
+    items = _AGENT_CONFIG_LIST_ADAPTER.validate_python(page, from_attributes=True)
+    next_cursor = encode_cursor(page[-1].created_at, page[-1].id) if len(page) == limit else None
+
+    return AgentConfigListResponse(
+        total=total, offset=offset, limit=limit, items=items, next_cursor=next_cursor
     )
-    items = [AgentConfigResponse.model_validate(r) for r in result.scalars().all()]
-
-    return AgentConfigListResponse(total=total, offset=offset, limit=limit, items=items)
 
 
 @router.post("", response_model=AgentConfigResponse, status_code=201)
@@ -47,32 +85,44 @@ async def create_agent_config(
     body: AgentConfigCreate,
     db: AsyncSession = Depends(get_db),
 ) -> AgentConfigResponse:
-    agent_config = AgentConfig(
-        name=body.name,
-        description=body.description,
-        system_prompt=body.system_prompt,
-        model=body.model,
-        temperature=body.temperature,
-        max_tokens=body.max_tokens,
-        tools=body.tools,
-        metadata_=body.metadata,
+    # RETURNING hydrates server defaults (created_at, updated_at) without a refresh SELECT
+    stmt = (
+        insert(AgentConfig)
+        .values(
+            name=body.name,
+            description=body.description,
+            system_prompt=body.system_prompt,
+            model=body.model,
+            temperature=body.temperature,
+            max_tokens=body.max_tokens,
+            tools=body.tools,
+            metadata_=body.metadata_,
+        )
+        .returning(AgentConfig)
     )
-    db.add(agent_config)
-    await db.flush()
-    await db.refresh(agent_config)
+    agent_config = (await db.execute(stmt)).scalar_one()
     return AgentConfigResponse.model_validate(agent_config)
 
 
 @router.get("/{config_id}", response_model=AgentConfigResponse)
 async def get_agent_config(
     config_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-) -> AgentConfigResponse:
-    result = await db.execute(select(AgentConfig).where(AgentConfig.id == config_id))
-    agent_config = result.scalar_one_or_none()
-    if not agent_config:
-        raise NotFoundError("AgentConfig", config_id)
-    return AgentConfigResponse.model_validate(agent_config)
+) -> AgentConfigResponse | Response:
+    key = cache_key("agentconfig", config_id)
+    body = await get_cached(key, AgentConfigResponse)
+    if body is None:
+        result = await db.execute(select(AgentConfig).where(AgentConfig.id == config_id))
+        agent_config = result.scalar_one_or_none()
+        if not agent_config:
+            raise NotFoundError("AgentConfig", config_id)
+        body = AgentConfigResponse.model_validate(agent_config)
+        await set_cached(key, body, _CACHE_TTL_S)
+
+    unchanged = not_modified(request, response, weak_etag(body.id, body.updated_at))
+    return unchanged if unchanged is not None else body
 
 
 @router.put("/{config_id}", response_model=AgentConfigResponse)
@@ -81,19 +131,21 @@ async def update_agent_config(
     body: AgentConfigUpdate,
     db: AsyncSession = Depends(get_db),
 ) -> AgentConfigResponse:
-    result = await db.execute(select(AgentConfig).where(AgentConfig.id == config_id))
-    agent_config = result.scalar_one_or_none()
+    update_data = body.model_dump(exclude_unset=True)
+    if update_data:
+        stmt = (
+            update(AgentConfig)
+            .where(AgentConfig.id == config_id)
+            .values(**update_data)
+            .returning(AgentConfig)
+        )
+        agent_config = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        by_id = select(AgentConfig).where(AgentConfig.id == config_id)
+        agent_config = (await db.execute(by_id)).scalar_one_or_none()
     if not agent_config:
         raise NotFoundError("AgentConfig", config_id)
-
-    update_data = body.model_dump(exclude_unset=True)
-    if "metadata" in update_data:
-        update_data["metadata_"] = update_data.pop("metadata")
-    for key, value in update_data.items():
-        setattr(agent_config, key, value)
-
-    await db.flush()
-    await db.refresh(agent_config)
+    on_commit(db, partial(invalidate, cache_key("agentconfig", config_id)))
     return AgentConfigResponse.model_validate(agent_config)
 
 
@@ -102,9 +154,12 @@ async def delete_agent_config(
     config_id: str,
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    result = await db.execute(select(AgentConfig).where(AgentConfig.id == config_id))
-    agent_config = result.scalar_one_or_none()
-    if not agent_config:
+    result = await db.execute(
+        update(AgentConfig)
+        .where(AgentConfig.id == config_id)
+        .values(is_active=False)
+        .returning(AgentConfig.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise NotFoundError("AgentConfig", config_id)
-    agent_config.is_active = False
-    await db.flush()
+    on_commit(db, partial(invalidate, cache_key("agentconfig", config_id)))
@@ -1,5 +1,8 @@
+from typing import Literal
+
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
@@ -13,6 +16,24 @@ from app.schemas.metric import MetricListResponse, MetricResponse
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
+_CONVERSATION_LIST_ADAPTER = TypeAdapter(list[ConversationResponse])
+_EVALUATION_LIST_ADAPTER = TypeAdapter(list[EvaluationResponse])
+_METRIC_LIST_ADAPTER = TypeAdapter(list[MetricResponse])
+
+# Rows are read as plain columns and validated straight from the row mapping. The
+# turns JSONB is the bulk of a conversation and is only de-TOASTed when asked for
+_ALL_COLUMNS = list(Conversation.__table__.c)
+_SUMMARY_COLUMNS = [c for c in _ALL_COLUMNS if c.name != "turns"]
+
+# Base statements are built once at import; handlers only add WHERE/LIMIT/OFFSET
+_TOTAL = func.count().over().label("total")
+_WINDOWED_PAGE_STMTS = {
+    include_turns: select(*columns, _TOTAL).order_by(Conversation.sequence_num)
+    for include_turns, columns in ((True, _ALL_COLUMNS), (False, _SUMMARY_COLUMNS))
+}
+_DETAIL_STMTS = {True: select(*_ALL_COLUMNS), False: select(*_SUMMARY_COLUMNS)}
+_COUNT_STMT = select(func.count()).select_from(Conversation)
+
 
 @router.get("", response_model=ConversationListResponse)
 async def list_conversations(
@@ -20,23 +41,28 @@ async def list_conversations(
     status: str | None = None,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    include: Literal["turns"] | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> ConversationListResponse:
-    query = select(Conversation)
-    count_query = select(func.count(Conversation.id))
-
+    filters: list[ColumnElement[bool]] = []
     if eval_run_id:
-        query = query.where(Conversation.eval_run_id == eval_run_id)
-        count_query = count_query.where(Conversation.eval_run_id == eval_run_id)
+        filters.append(Conversation.eval_run_id == eval_run_id)
     if status:
-        query = query.where(Conversation.status == status)
-        count_query = count_query.where(Conversation.status == status)
+        filters.append(Conversation.status == status)
 
-    total = (await db.execute(count_query)).scalar_one()
+    # Total rides along as a window column so the page and its count share one scan
     result = await db.execute(
-        query.order_by(Conversation.sequence_num).offset(offset).limit(limit)
+        _WINDOWED_PAGE_STMTS[include == "turns"].where(*filters).offset(offset).limit(limit)
     )
-    items = [ConversationResponse.model_validate(r) for r in result.scalars().all()]
+    rows = result.all()
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Page past the end: no rows to carry the window count
+        total = (await db.execute(_COUNT_STMT.where(*filters))).scalar_one()
+    else:
+        total = 0
+    items = _CONVERSATION_LIST_ADAPTER.validate_python([r._mapping for r in rows])
 
     return ConversationListResponse(total=total, offset=offset, limit=limit, items=items)
 
@@ -44,13 +70,16 @@ async def list_conversations(
 @router.get("/{conv_id}", response_model=ConversationResponse)
 async def get_conversation(
     conv_id: str,
+    include: Literal["turns"] | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> ConversationResponse:
-    result = await db.execute(select(Conversation).where(Conversation.id == conv_id))
-    conv = result.scalar_one_or_none()
-    if not conv:
+    result = await db.execute(
+        _DETAIL_STMTS[include == "turns"].where(Conversation.id == conv_id)
+    )
+    row = result.one_or_none()
+    if row is None:
         raise NotFoundError("Conversation", conv_id)
-    return ConversationResponse.model_validate(conv)
+    return ConversationResponse.model_validate(row._mapping)
 
 
 @router.get("/{conv_id}/evaluations", response_model=EvaluationListResponse)
@@ -63,7 +92,7 @@ async def get_conversation_evaluations(
         .where(Evaluation.conversation_id == conv_id)
         .order_by(Evaluation.created_at)
     )
-    items = [EvaluationResponse.model_validate(r) for r in result.scalars().all()]
+    items = _EVALUATION_LIST_ADAPTER.validate_python(result.scalars().all(), from_attributes=True)
     return EvaluationListResponse(total=len(items), items=items)
 
 
@@ -77,5 +106,6 @@ async def get_conversation_metrics(
         .where(Metric.conversation_id == conv_id)
         .order_by(Metric.metric_name)
     )
-    items = [MetricResponse.model_validate(r) for r in result.scalars().all()]
+    items = _METRIC_LIST_ADAPTER.validate_python(result.scalars().all(), from_attributes=True)
     return MetricListResponse(total=len(items), items=items)
+
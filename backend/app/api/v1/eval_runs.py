@@ -1,45 +1,85 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from functools import partial
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, DateTime, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.etag import not_modified, weak_etag
 from app.core.exceptions import NotFoundError
-from app.db.session import get_db
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.response_cache import cache_key, get_cached, invalidate, set_cached
+from app.db.session import get_db, on_commit
 from app.models.eval_run import EvalRun
 from app.schemas.eval_run import EvalRunCreate, EvalRunListResponse, EvalRunResponse
 from app.workers.simulation_tasks import run_simulation
 
 router = APIRouter(prefix="/eval-runs", tags=["eval-runs"])
 
+_EVAL_RUN_LIST_ADAPTER = TypeAdapter(list[EvalRunResponse])
+
+# Base statements are built once at import; handlers only add WHERE/LIMIT/OFFSET
+_ORDER = (EvalRun.created_at.desc(), EvalRun.id.desc())
+_PAGE_STMT = select(EvalRun).order_by(*_ORDER)
+_WINDOWED_PAGE_STMT = select(EvalRun, func.count().over().label("total")).order_by(*_ORDER)
+_COUNT_STMT = select(func.count()).select_from(EvalRun)
+
+_CANCELLABLE_STATUSES = ("pending", "running_simulation", "running_evaluation")
+
+# Absorbs status polling. Workers invalidate after committing a status change
+# (simulation service, simulation task, metrics consumer); the TTL is a backstop
+_CACHE_TTL_S = 2
+
 
 @router.get("", response_model=EvalRunListResponse)
 async def list_eval_runs(
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
     status: str | None = None,
     agent_config_id: str | None = None,
     scenario_id: str | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> EvalRunListResponse:
-    query = select(EvalRun)
-    count_query = select(func.count(EvalRun.id))
-
+    filters: list[ColumnElement[bool]] = []
     if status:
-        query = query.where(EvalRun.status == status)
-        count_query = count_query.where(EvalRun.status == status)
+        filters.append(EvalRun.status == status)
     if agent_config_id:
-        query = query.where(EvalRun.agent_config_id == agent_config_id)
-        count_query = count_query.where(EvalRun.agent_config_id == agent_config_id)
+        filters.append(EvalRun.agent_config_id == agent_config_id)
     if scenario_id:
-        query = query.where(EvalRun.scenario_id == scenario_id)
-        count_query = count_query.where(EvalRun.scenario_id == scenario_id)
-
-    total = (await db.execute(count_query)).scalar_one()
-    result = await db.execute(
-        query.order_by(EvalRun.created_at.desc()).offset(offset).limit(limit)
+        filters.append(EvalRun.scenario_id == scenario_id)
+
+    total: int | None
+    if cursor:
+        # Keyset page: an index range scan of `limit` rows, so no total is computed
+        created_at, last_id = decode_cursor(cursor)
+        keyset = tuple_(EvalRun.created_at, EvalRun.id) < tuple_(
+            created_at, last_id, types=[DateTime(timezone=True), EvalRun.id.type]
+        )
+        result = await db.execute(_PAGE_STMT.where(*filters, keyset).limit(limit))
+        page = list(result.scalars().all())
+        total = None
+    else:
+        # Total rides along as a window column so the page and its count share one scan
+        result = await db.execute(
+            _WINDOWED_PAGE_STMT.where(*filters).offset(offset).limit(limit)
+        )
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end: no rows to carry the window count
+            total = (await db.execute(_COUNT_STMT.where(*filters))).scalar_one()
+        else:
+            total = 0
+        page = [r.EvalRun for r in rows]
+
+    items = _EVAL_RUN_LIST_ADAPTER.validate_python(page, from_attributes=True)
+    next_cursor = encode_cursor(page[-1].created_at, page[-1].id) if len(page) == limit else None
+
+    return EvalRunListResponse(
+        total=total, offset=offset, limit=limit, items=items, next_cursor=next_cursor
     )
-    items = [EvalRunResponse.model_validate(r) for r in result.scalars().all()]
-
-    return EvalRunListResponse(total=total, offset=offset, limit=limit, items=items)
 
 
 @router.post("", response_model=EvalRunResponse, status_code=202)
@@ -52,21 +92,24 @@ async def create_eval_run(
     Returns immediately with status=pending. The simulation runs
     asynchronously via a Celery worker.
     """
-    eval_run = EvalRun(
-        name=body.name,
-        agent_config_id=body.agent_config_id,
-        scenario_id=body.scenario_id,
-        rubric_id=body.rubric_id,
-        num_conversations=body.num_conversations,
-        config=body.config,
-        status="pending",
+    stmt = (
+        insert(EvalRun)
+        .values(
+            name=body.name,
+            agent_config_id=body.agent_config_id,
+            scenario_id=body.scenario_id,
+            rubric_id=body.rubric_id,
+            num_conversations=body.num_conversations,
+            config=body.config,
+            status="pending",
+        )
+        .returning(EvalRun)
     )
-    db.add(eval_run)
-    await db.flush()
-    await db.refresh(eval_run)
+    eval_run = (await db.execute(stmt)).scalar_one()
 
-    # Trigger async simulation task
-    run_simulation.delay(eval_run.id)
+    # Enqueue only once the row is committed, so the worker can't race the insert
+    # and a rolled-back create never dispatches a task
+    on_commit(db, partial(run_simulation.delay, eval_run.id))
 
     return EvalRunResponse.model_validate(eval_run)
 
@@ -74,13 +117,24 @@ async def create_eval_run(
 @router.get("/{run_id}", response_model=EvalRunResponse)
 async def get_eval_run(
     run_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-) -> EvalRunResponse:
-    result = await db.execute(select(EvalRun).where(EvalRun.id == run_id))
-    eval_run = result.scalar_one_or_none()
-    if not eval_run:
-        raise NotFoundError("EvalRun", run_id)
-    return EvalRunResponse.model_validate(eval_run)
+) -> EvalRunResponse | Response:
+    key = cache_key("evalrun", run_id)
+    body = await get_cached(key, EvalRunResponse)
+    if body is None:
+        result = await db.execute(select(EvalRun).where(EvalRun.id == run_id))
+        eval_run = result.scalar_one_or_none()
+        if not eval_run:
+            raise NotFoundError("EvalRun", run_id)
+        body = EvalRunResponse.model_validate(eval_run)
+        await set_cached(key, body, _CACHE_TTL_S)
+
+    # No updated_at on eval runs; these are the fields a run's lifecycle changes
+    etag = weak_etag(body.id, body.status, body.started_at, body.completed_at)
+    unchanged = not_modified(request, response, etag)
+    return unchanged if unchanged is not None else body
 
 
 @router.post("/{run_id}/cancel", status_code=200)
@@ -88,13 +142,21 @@ async def cancel_eval_run(
     run_id: str,
     db: AsyncSession = Depends(get_db),
 ) -> EvalRunResponse:
-    result = await db.execute(select(EvalRun).where(EvalRun.id == run_id))
+    # Status check and transition in one statement, so a worker can't race past it
+    result = await db.execute(
+        update(EvalRun)
+        .where(EvalRun.id == run_id, EvalRun.status.in_(_CANCELLABLE_STATUSES))
+        .values(status="cancelled")
+        .returning(EvalRun)
+    )
     eval_run = result.scalar_one_or_none()
-    if not eval_run:
-        raise NotFoundError("EvalRun", run_id)
-
-    if eval_run.status in ("pending", "running_simulation", "running_evaluation"):
-        eval_run.status = "cancelled"
-        await db.flush()
+    if eval_run is None:
+        # Either missing or already finished; the latter is returned unchanged
+        result = await db.execute(select(EvalRun).where(EvalRun.id == run_id))
+        eval_run = result.scalar_one_or_none()
+        if not eval_run:
+            raise NotFoundError("EvalRun", run_id)
+    else:
+        on_commit(db, partial(invalidate, cache_key("evalrun", run_id)))
 
     return EvalRunResponse.model_validate(eval_run)
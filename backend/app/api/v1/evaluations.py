@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import contextlib
 from collections import defaultdict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from sqlalchemy import Row, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -20,16 +23,24 @@ from app.schemas.evaluation import (
     CalibrationResponse,
     EvaluationResponse,
     HumanEvaluationCreate,
+    PairwiseBatchRequest,
     PairwiseComparisonRequest,
     PairwiseComparisonResponse,
     RankingsResponse,
     ReliabilityResponse,
 )
 
+if TYPE_CHECKING:
+    from app.evaluation.pairwise_judge import PairwiseResult
+    from app.evaluation.types import RubricDimension
+
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/evaluations", tags=["evaluations"])
 
+# Rows fetched per round-trip when streaming a run's evaluations
+_EVAL_STREAM_BATCH = 500
+
 
 # ---------------------------------------------------------------
 # Existing: POST /evaluations/human
@@ -47,29 +58,30 @@ async def create_human_evaluation(
 ) -> Evaluation:
     """Submit a human evaluation for a conversation."""
     result = await db.execute(
-        select(Conversation).where(Conversation.id == payload.conversation_id)
+        select(Conversation.id).where(Conversation.id == payload.conversation_id)
     )
-    conversation = result.scalar_one_or_none()
-    if not conversation:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Conversation {payload.conversation_id} not found",
         )
 
-    evaluation = Evaluation(
-        conversation_id=payload.conversation_id,
-        evaluator_type="human",
-        evaluator_id=payload.evaluator_id,
-        rubric_id=payload.rubric_id,
-        scores=payload.scores,
-        overall_score=payload.overall_score,
-        reasoning=payload.reasoning,
-        per_turn_scores=payload.per_turn_scores,
+    # RETURNING hydrates server defaults (created_at) without a refresh SELECT
+    stmt = (
+        insert(Evaluation)
+        .values(
+            conversation_id=payload.conversation_id,
+            evaluator_type="human",
+            evaluator_id=payload.evaluator_id,
+            rubric_id=payload.rubric_id,
+            scores=payload.scores,
+            overall_score=payload.overall_score,
+            reasoning=payload.reasoning,
+            per_turn_scores=payload.per_turn_scores,
+        )
+        .returning(Evaluation)
     )
-    db.add(evaluation)
-    await db.flush()
-    await db.refresh(evaluation)
-    return evaluation
+    return (await db.execute(stmt)).scalar_one()
 
 
 # ---------------------------------------------------------------
@@ -89,8 +101,6 @@ async def create_pairwise_comparison(
     """Run a pairwise comparison between two conversations."""
     from app.engine.llm_client import LLMClient
     from app.evaluation.pairwise_judge import PairwiseJudgeEvaluator
-    from app.evaluation.types import DEFAULT_DIMENSIONS, RubricDimension
-    from app.models.rubric import Rubric
 
     # Load conversations
     result_a = await db.execute(
@@ -107,19 +117,7 @@ async def create_pairwise_comparison(
     if not conv_b:
         raise HTTPException(status_code=404, detail=f"Conversation {payload.conversation_id_b} not found")
 
-    # Load dimensions
-    dimensions = DEFAULT_DIMENSIONS
-    if payload.rubric_id:
-        result = await db.execute(select(Rubric).where(Rubric.id == payload.rubric_id))
-        rubric = result.scalar_one_or_none()
-        if rubric and rubric.dimensions:
-            dimensions = [
-                RubricDimension(
-                    name=d["name"], description=d.get("description", ""),
-                    weight=d.get("weight", 1.0), criteria=d.get("criteria", []),
-                )
-                for d in rubric.dimensions
-            ]
+    dimensions = await _load_dimensions(db, payload.rubric_id)
 
     # Run comparison
     evaluator = PairwiseJudgeEvaluator(llm_client=LLMClient())
@@ -127,36 +125,13 @@ async def create_pairwise_comparison(
         conv_a.turns or [], conv_b.turns or [], dimensions,
     )
 
-    # Map winner to per-conversation result
-    result_map = {
-        "a": ("win", "loss"),
-        "b": ("loss", "win"),
-        "draw": ("draw", "draw"),
-    }
-    result_a_str, result_b_str = result_map.get(comparison.winner, ("draw", "draw"))
-
-    # Store Evaluation on both conversations
-    eval_records = []
-    for conv, result_str in [(conv_a, result_a_str), (conv_b, result_b_str)]:
-        opponent_id = payload.conversation_id_b if conv.id == payload.conversation_id_a else payload.conversation_id_a
-        eval_record = Evaluation(
-            conversation_id=conv.id,
-            evaluator_type="pairwise_judge",
-            rubric_id=payload.rubric_id,
-            scores=comparison.dimension_preferences,
-            overall_score=comparison.confidence * 10.0 if result_str == "win" else (5.0 if result_str == "draw" else (1.0 - comparison.confidence) * 10.0),
-            reasoning=comparison.reasoning,
-            metadata_={
-                "match_id": comparison.match_id,
-                "opponent_conversation_id": opponent_id,
-                "result": result_str,
-                "winner": comparison.winner,
-            },
+    # Store Evaluation on both conversations in one INSERT ... RETURNING
+    rows = _pairwise_evaluation_rows(comparison, conv_a.id, conv_b.id, payload.rubric_id)
+    eval_records = (
+        await db.scalars(
+            insert(Evaluation).returning(Evaluation, sort_by_parameter_order=True), rows
         )
-        db.add(eval_record)
-        await db.flush()
-        await db.refresh(eval_record)
-        eval_records.append(eval_record)
+    ).all()
 
     return PairwiseComparisonResponse(
         match_id=comparison.match_id,
@@ -170,11 +145,156 @@ async def create_pairwise_comparison(
     )
 
 
+# ---------------------------------------------------------------
+# POST /evaluations/pairwise/batch
+# ---------------------------------------------------------------
+
+
+@router.post(
+    "/pairwise/batch",
+    response_model=list[PairwiseComparisonResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_pairwise_comparisons(
+    payload: PairwiseBatchRequest,
+    db: AsyncSession = Depends(get_db),
+) -> list[PairwiseComparisonResponse]:
+    """Run many pairwise comparisons, several pairs per judge call."""
+    from app.engine.llm_client import LLMClient
+    from app.evaluation.pairwise_judge import PairwiseJudgeEvaluator
+
+    conv_ids = {
+        conv_id
+        for pair in payload.pairs
+        for conv_id in (pair.conversation_id_a, pair.conversation_id_b)
+    }
+    result = await db.execute(
+        select(Conversation.id, Conversation.turns).where(Conversation.id.in_(conv_ids))
+    )
+    turns_by_id = {row.id: row.turns or [] for row in result}
+    missing = conv_ids - turns_by_id.keys()
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Conversation {sorted(missing)[0]} not found")
+
+    dimensions = await _load_dimensions(db, payload.rubric_id)
+
+    evaluator = PairwiseJudgeEvaluator(llm_client=LLMClient())
+    comparisons = await evaluator.compare_batch(
+        [
+            (turns_by_id[pair.conversation_id_a], turns_by_id[pair.conversation_id_b])
+            for pair in payload.pairs
+        ],
+        dimensions,
+        batch_size=payload.batch_size,
+    )
+
+    # Every verdict's two rows go out in one executemany; RETURNING hydrates id/created_at
+    rows = [
+        row
+        for pair, comparison in zip(payload.pairs, comparisons, strict=True)
+        for row in _pairwise_evaluation_rows(
+            comparison, pair.conversation_id_a, pair.conversation_id_b, payload.rubric_id,
+        )
+    ]
+    records = (
+        await db.scalars(
+            insert(Evaluation).returning(Evaluation, sort_by_parameter_order=True), rows
+        )
+    ).all()
+
+    return [
+        PairwiseComparisonResponse(
+            match_id=comparison.match_id,
+            winner=comparison.winner,
+            conversation_id_a=pair.conversation_id_a,
+            conversation_id_b=pair.conversation_id_b,
+            reasoning=comparison.reasoning,
+            dimension_preferences=comparison.dimension_preferences,
+            confidence=comparison.confidence,
+            evaluations=[EvaluationResponse.model_validate(e) for e in records[2 * i:2 * i + 2]],
+        )
+        for i, (pair, comparison) in enumerate(zip(payload.pairs, comparisons, strict=True))
+    ]
+
+
+async def _load_dimensions(db: AsyncSession, rubric_id: str | None) -> list[RubricDimension]:
+    """Rubric dimensions for a comparison, falling back to the defaults."""
+    from app.evaluation.types import DEFAULT_DIMENSIONS, RubricDimension
+    from app.models.rubric import Rubric
+
+    if rubric_id:
+        result = await db.execute(select(Rubric.dimensions).where(Rubric.id == rubric_id))
+        rubric_dimensions = result.scalar_one_or_none()
+        if rubric_dimensions:
+            return [
+                RubricDimension(
+                    name=d["name"], description=d.get("description", ""),
+                    weight=d.get("weight", 1.0), criteria=d.get("criteria", []),
+                )
+                for d in rubric_dimensions
+            ]
+    return DEFAULT_DIMENSIONS
+
+
+# Winner label -> (result for conversation A, result for conversation B)
+_PAIRWISE_RESULTS = {
+    "a": ("win", "loss"),
+    "b": ("loss", "win"),
+    "draw": ("draw", "draw"),
+}
+
+
+def _pairwise_evaluation_rows(
+    comparison: PairwiseResult,
+    conversation_id_a: str,
+    conversation_id_b: str,
+    rubric_id: str | None,
+) -> list[dict[str, Any]]:
+    """Evaluation column values for both sides of one pairwise verdict."""
+    result_a, result_b = _PAIRWISE_RESULTS.get(comparison.winner, ("draw", "draw"))
+    rows = []
+    for conv_id, opponent_id, result_str in [
+        (conversation_id_a, conversation_id_b, result_a),
+        (conversation_id_b, conversation_id_a, result_b),
+    ]:
+        if result_str == "win":
+            overall = comparison.confidence * 10.0
+        elif result_str == "draw":
+            overall = 5.0
+        else:
+            overall = (1.0 - comparison.confidence) * 10.0
+        rows.append({
+            "conversation_id": conv_id,
+            "evaluator_type": "pairwise_judge",
+            "rubric_id": rubric_id,
+            "scores": comparison.dimension_preferences,
+            "overall_score": overall,
+            "reasoning": comparison.reasoning,
+            "metadata_": {
+                "match_id": comparison.match_id,
+                "opponent_conversation_id": opponent_id,
+                "result": result_str,
+                "winner": comparison.winner,
+            },
+        })
+    return rows
+
+
 # ---------------------------------------------------------------
 # GET /evaluations/rankings
 # ---------------------------------------------------------------
 
 
+# A pairwise verdict's "result" is from its own conversation's side
+_RESULT_FROM_A = {"win": "a_wins", "loss": "b_wins"}
+# Match outcome -> (stat counted for side A, stat counted for side B)
+_OUTCOME_STATS = {
+    "a_wins": ("wins", "losses"),
+    "b_wins": ("losses", "wins"),
+    "draw": ("draws", "draws"),
+}
+
+
 @router.get("/rankings", response_model=RankingsResponse)
 async def get_rankings(
     scenario_id: str | None = None,
@@ -183,106 +303,61 @@ async def get_rankings(
     """Compute ELO rankings from all pairwise evaluations."""
     from app.evaluation.elo import compute_rankings
 
-    # Load all pairwise evaluations
-    query = select(Evaluation).where(Evaluation.evaluator_type == "pairwise_judge")
-    result = await db.execute(query)
-    all_evals = result.scalars().all()
+    # One query resolves every pairwise verdict to its agent (and the agent's name)
+    match_id = Evaluation.metadata_["match_id"].astext
+    stmt = (
+        select(
+            match_id.label("match_id"),
+            Evaluation.metadata_["result"].astext.label("result"),
+            EvalRun.agent_config_id,
+            AgentConfig.name,
+        )
+        .join(Conversation, Conversation.id == Evaluation.conversation_id)
+        .join(EvalRun, EvalRun.id == Conversation.eval_run_id)
+        .join(AgentConfig, AgentConfig.id == EvalRun.agent_config_id)
+        .where(Evaluation.evaluator_type == "pairwise_judge", match_id.is_not(None))
+    )
+    if scenario_id:
+        # Both sides must come from the scenario; a half-filtered match drops out below
+        stmt = stmt.where(EvalRun.scenario_id == scenario_id)
+    result = await db.execute(stmt)
 
     # Group by match_id, build match results
-    matches_by_id: dict[str, list[Evaluation]] = defaultdict(list)
-    for ev in all_evals:
-        meta = ev.metadata_ or {}
-        match_id = meta.get("match_id")
-        if match_id:
-            matches_by_id[match_id].append(ev)
-
-    # Resolve agent_config_id for each conversation
-    conv_to_agent: dict[str, str] = {}
-    match_results: list[dict] = []
-
-    for match_id, evals in matches_by_id.items():
-        if len(evals) != 2:
-            continue
+    sides_by_match: dict[str, list[Row[Any]]] = defaultdict(list)
+    agent_names: dict[str, str] = {}
+    for row in result:
+        sides_by_match[row.match_id].append(row)
+        agent_names[row.agent_config_id] = row.name
 
-        for ev in evals:
-            cid = ev.conversation_id
-            if cid not in conv_to_agent:
-                conv_result = await db.execute(
-                    select(Conversation.eval_run_id).where(Conversation.id == cid)
-                )
-                eval_run_id = conv_result.scalar_one_or_none()
-                if eval_run_id:
-                    run_result = await db.execute(
-                        select(EvalRun.agent_config_id).where(EvalRun.id == eval_run_id)
-                    )
-                    agent_id = run_result.scalar_one_or_none()
-                    if agent_id:
-                        conv_to_agent[cid] = agent_id
-
-        # Determine agents for this match
-        ev_a, ev_b = evals[0], evals[1]
-        agent_a = conv_to_agent.get(ev_a.conversation_id)
-        agent_b = conv_to_agent.get(ev_b.conversation_id)
-        if not agent_a or not agent_b:
+    # Win/loss/draw counts are tallied in the same pass that pairs the sides up
+    match_results: list[dict] = []
+    stats: dict[str, dict[str, int]] = defaultdict(lambda: {"wins": 0, "losses": 0, "draws": 0})
+    for sides in sides_by_match.values():
+        if len(sides) != 2:
             continue
-
-        # Filter by scenario if requested
-        if scenario_id:
-            run_a = await db.execute(
-                select(EvalRun.scenario_id).where(
-                    EvalRun.id == (
-                        select(Conversation.eval_run_id).where(
-                            Conversation.id == ev_a.conversation_id
-                        ).scalar_subquery()
-                    )
-                )
-            )
-            s_id = run_a.scalar_one_or_none()
-            if s_id != scenario_id:
-                continue
-
-        meta_a = ev_a.metadata_ or {}
-        result_a = meta_a.get("result", "draw")
-
-        if result_a == "win":
-            match_results.append({"agent_config_id_a": agent_a, "agent_config_id_b": agent_b, "result": "a_wins"})
-        elif result_a == "loss":
-            match_results.append({"agent_config_id_a": agent_a, "agent_config_id_b": agent_b, "result": "b_wins"})
-        else:
-            match_results.append({"agent_config_id_a": agent_a, "agent_config_id_b": agent_b, "result": "draw"})
+        side_a, side_b = sides
+        outcome = _RESULT_FROM_A.get(side_a.result, "draw")
+        match_results.append({
+            "agent_config_id_a": side_a.agent_config_id,
+            "agent_config_id_b": side_b.agent_config_id,
+            "result": outcome,
+        })
+        stat_a, stat_b = _OUTCOME_STATS[outcome]
+        stats[side_a.agent_config_id][stat_a] += 1
+        stats[side_b.agent_config_id][stat_b] += 1
 
     # Compute ELO
     ratings = compute_rankings(match_results)
 
-    # Count stats and get names
-    stats: dict[str, dict[str, int]] = defaultdict(lambda: {"wins": 0, "losses": 0, "draws": 0, "total": 0})
-    for mr in match_results:
-        a, b, r = mr["agent_config_id_a"], mr["agent_config_id_b"], mr["result"]
-        stats[a]["total"] += 1
-        stats[b]["total"] += 1
-        if r == "a_wins":
-            stats[a]["wins"] += 1
-            stats[b]["losses"] += 1
-        elif r == "b_wins":
-            stats[b]["wins"] += 1
-            stats[a]["losses"] += 1
-        else:
-            stats[a]["draws"] += 1
-            stats[b]["draws"] += 1
-
-    # Get agent names
+    # Build rankings, best first
     rankings = []
     for agent_id, rating in sorted(ratings.items(), key=lambda x: -x[1]):
-        name_result = await db.execute(
-            select(AgentConfig.name).where(AgentConfig.id == agent_id)
-        )
-        name = name_result.scalar_one_or_none()
         s = stats[agent_id]
         rankings.append(AgentRanking(
             agent_config_id=agent_id,
-            agent_name=name,
+            agent_name=agent_names.get(agent_id),
             elo_rating=rating,
-            matches_played=s["total"],
+            matches_played=s["wins"] + s["losses"] + s["draws"],
             wins=s["wins"],
             losses=s["losses"],
             draws=s["draws"],
@@ -317,28 +392,32 @@ async def get_reliability(
     if not conv_ids:
         raise HTTPException(status_code=404, detail="No conversations found for this run")
 
-    # Load human evaluations
-    eval_result = await db.execute(
-        select(Evaluation)
+    # Postgres groups the human scores: one row per conversation, raters in submission order
+    eval_result = await db.stream(
+        select(
+            Evaluation.conversation_id,
+            func.jsonb_agg(
+                aggregate_order_by(
+                    func.coalesce(Evaluation.scores, literal({}, JSONB)), Evaluation.created_at,
+                ),
+                type_=JSONB,
+            ).label("scores_list"),
+        )
         .where(Evaluation.conversation_id.in_(conv_ids))
         .where(Evaluation.evaluator_type == "human")
-        .order_by(Evaluation.created_at)
+        .group_by(Evaluation.conversation_id)
+        .execution_options(yield_per=_EVAL_STREAM_BATCH)
     )
-    evaluations = eval_result.scalars().all()
-
-    # Group by conversation
-    by_conv: dict[str, list[dict[str, float]]] = defaultdict(list)
-    all_dims: set[str] = set()
-    for ev in evaluations:
-        scores = ev.scores or {}
-        by_conv[ev.conversation_id].append(scores)
-        all_dims.update(scores.keys())
+    by_conv: dict[str, list[dict[str, float]]] = {
+        row.conversation_id: row.scores_list async for row in eval_result
+    }
+    all_dims: set[str] = set().union(*(s for scores_list in by_conv.values() for s in scores_list))
 
     if not by_conv:
         raise HTTPException(status_code=404, detail="No human evaluations found for this run")
 
     dimensions = sorted(all_dims)
-    result = compute_reliability(dict(by_conv), dimensions)
+    result = compute_reliability(by_conv, dimensions)
 
     return ReliabilityResponse(
         alpha=result.alpha,
@@ -370,50 +449,58 @@ async def get_calibration(
     if not conv_ids:
         raise HTTPException(status_code=404, detail="No conversations found for this run")
 
-    # Load all evaluations
-    eval_result = await db.execute(
-        select(Evaluation)
+    # Stream just the scored columns, grouping by conversation → type as rows arrive
+    eval_result = await db.stream(
+        select(
+            Evaluation.conversation_id,
+            Evaluation.evaluator_type,
+            Evaluation.overall_score,
+            Evaluation.scores,
+        )
         .where(Evaluation.conversation_id.in_(conv_ids))
         .where(Evaluation.evaluator_type.in_(["human", "model_judge"]))
+        .order_by(Evaluation.created_at)
+        .execution_options(yield_per=_EVAL_STREAM_BATCH)
     )
-    evaluations = eval_result.scalars().all()
-
-    # Group by conversation → type
-    by_conv: dict[str, dict[str, Evaluation]] = defaultdict(dict)
-    for ev in evaluations:
+    by_conv: dict[str, dict[str, Row[Any]]] = defaultdict(dict)
+    async for ev in eval_result:
         # If multiple of same type, keep the latest
         by_conv[ev.conversation_id][ev.evaluator_type] = ev
 
-    # Build paired lists
-    human_scores: list[float] = []
-    model_scores: list[float] = []
-    all_dims: set[str] = set()
-    dim_human: dict[str, list[float]] = defaultdict(list)
-    dim_model: dict[str, list[float]] = defaultdict(list)
-
-    for conv_id, evals_map in by_conv.items():
-        if "human" in evals_map and "model_judge" in evals_map:
-            h = evals_map["human"]
-            m = evals_map["model_judge"]
-            if h.overall_score is not None and m.overall_score is not None:
-                human_scores.append(h.overall_score)
-                model_scores.append(m.overall_score)
-
-            # Per-dimension
-            h_scores = h.scores or {}
-            m_scores = m.scores or {}
-            for dim in set(h_scores.keys()) & set(m_scores.keys()):
-                try:
-                    dim_human[dim].append(float(h_scores[dim]))
-                    dim_model[dim].append(float(m_scores[dim]))
-                    all_dims.add(dim)
-                except (ValueError, TypeError):
-                    pass
-
-    if len(human_scores) < 2:
+    # Pair up once; overall scores go straight into preallocated arrays
+    pairs = [
+        (evals_map["human"], evals_map["model_judge"])
+        for evals_map in by_conv.values()
+        if "human" in evals_map and "model_judge" in evals_map
+    ]
+    n_pairs = len(pairs)
+    human_arr = np.empty(n_pairs, dtype=np.float64)
+    model_arr = np.empty(n_pairs, dtype=np.float64)
+    n_overall = 0
+    # Raw per-dimension values, paired by position; coerced to floats in bulk below
+    dim_human: dict[str, list[Any]] = defaultdict(list)
+    dim_model: dict[str, list[Any]] = defaultdict(list)
+
+    for h, m in pairs:
+        if h.overall_score is not None and m.overall_score is not None:
+            human_arr[n_overall] = h.overall_score
+            model_arr[n_overall] = m.overall_score
+            n_overall += 1
+
+        # Per-dimension
+        h_scores = h.scores or {}
+        m_scores = m.scores or {}
+        for dim in h_scores.keys() & m_scores.keys():
+            dim_human[dim].append(h_scores[dim])
+            dim_model[dim].append(m_scores[dim])
+
+    human_scores = human_arr[:n_overall].tolist()
+    model_scores = model_arr[:n_overall].tolist()
+
+    if n_overall < 2:
         raise HTTPException(
             status_code=400,
-            detail=f"Need at least 2 paired human+model evaluations, found {len(human_scores)}",
+            detail=f"Need at least 2 paired human+model evaluations, found {n_overall}",
         )
 
     # Overall metrics
@@ -422,9 +509,13 @@ async def get_calibration(
 
     # Per-dimension metrics
     per_dim: dict[str, dict[str, float]] = {}
-    for dim in sorted(all_dims):
-        if len(dim_human[dim]) >= 2:
-            dm = calibration_metrics(dim_human[dim], dim_model[dim])
+    for dim in sorted(dim_human):
+        dim_h = _as_float_array(dim_human[dim])
+        dim_m = _as_float_array(dim_model[dim])
+        # Non-numeric scores came through as NaN; drop the pair if either side is one
+        valid = np.isfinite(dim_h) & np.isfinite(dim_m)
+        if np.count_nonzero(valid) >= 2:
+            dm = calibration_metrics(dim_h[valid].tolist(), dim_m[valid].tolist())
             per_dim[dim] = {
                 "pearson_r": dm.pearson_r,
                 "spearman_rho": dm.spearman_rho,
@@ -440,8 +531,27 @@ async def get_calibration(
         bias=metrics.bias,
         n=metrics.n,
         calibration_curve=[
-            {"bin_center": b.bin_center, "avg_human": b.avg_human, "avg_model": b.avg_model, "count": b.count}
+            {
+                "bin_center": b.bin_center,
+                "avg_human": b.avg_human,
+                "avg_model": b.avg_model,
+                "count": b.count,
+            }
             for b in curve
         ],
         per_dimension=per_dim,
     )
+
+
+def _as_float_array(values: list[Any]) -> np.ndarray:
+    """Coerce raw JSON scores to float64, with NaN for anything non-numeric."""
+    with contextlib.suppress(TypeError, ValueError):
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim == 1:
+            return array
+    # Some value isn't a number: fall back to converting one at a time
+    array = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
+        with contextlib.suppress(TypeError, ValueError):
+            array[i] = float(value)
+    return array
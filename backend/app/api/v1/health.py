@@ -1,47 +1,74 @@
+import asyncio
+import time
+
 import structlog
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Response
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.redis_client import get_redis
-from app.db.session import get_db
+from app.db.session import engine
 
 router = APIRouter(tags=["health"])
 logger = structlog.get_logger()
 
+_LIVENESS_BODY = b'{"status":"ok"}'
+
+# Probes arriving within this window share one round of backend checks
+_READINESS_TTL_S = 1.0
+_readiness_result: tuple[float, dict[str, object]] | None = None
+_readiness_inflight: asyncio.Future[dict[str, object]] | None = None
+
 
-@router.get("/health")
-async def liveness() -> dict[str, str]:
+@router.get("/health", response_class=Response)
+async def liveness() -> Response:
     """Basic liveness check."""
-    return {"status": "ok"}
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
 
 
 @router.get("/health/ready")
-async def readiness(
-    db: AsyncSession = Depends(get_db),
-) -> dict[str, object]:
+async def readiness() -> dict[str, object]:
     """Readiness check verifying all dependencies."""
-    checks: dict[str, object] = {}
-
-    # PostgreSQL
-    try:
-        await db.execute(text("SELECT 1"))
-        checks["postgres"] = "ok"
-    except Exception as e:
-        logger.error("postgres_health_check_failed", error=str(e))
-        checks["postgres"] = f"error: {e}"
-
-    # Redis
-    try:
-        redis = await get_redis()
-        await redis.ping()
-        checks["redis"] = "ok"
-    except Exception as e:
-        logger.error("redis_health_check_failed", error=str(e))
-        checks["redis"] = f"error: {e}"
+    global _readiness_inflight
+
+    if _readiness_result is not None and _readiness_result[0] > time.monotonic():
+        return _readiness_result[1]
+    # Concurrent probes join the in-flight check rather than starting their own
+    if _readiness_inflight is None or _readiness_inflight.done():
+        _readiness_inflight = asyncio.ensure_future(_check_dependencies())
+    # A disconnecting prober must not cancel the check other probes are awaiting
+    return await asyncio.shield(_readiness_inflight)
+
+
+async def _check_dependencies() -> dict[str, object]:
+    """Run the backend checks and cache the outcome for _READINESS_TTL_S."""
+    global _readiness_result
+
+    async def check_postgres() -> str:
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return "ok"
+        except Exception as e:
+            logger.error("postgres_health_check_failed", error=str(e))
+            return f"error: {e}"
+
+    async def check_redis() -> str:
+        try:
+            redis = await get_redis()
+            await redis.ping()
+            return "ok"
+        except Exception as e:
+            logger.error("redis_health_check_failed", error=str(e))
+            return f"error: {e}"
+
+    # Independent probes: latency is the slower of the two, not their sum
+    postgres, redis = await asyncio.gather(check_postgres(), check_redis())
+    checks: dict[str, object] = {"postgres": postgres, "redis": redis}
 
     all_ok = all(v == "ok" for v in checks.values())
-    return {
+    result: dict[str, object] = {
         "status": "ready" if all_ok else "degraded",
         "checks": checks,
     }
+    _readiness_result = (time.monotonic() + _READINESS_TTL_S, result)
+    return result
@@ -1,8 +1,24 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    ScalarSelect,
+    String,
+    Text,
+    bindparam,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
 
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
 from app.db.session import get_db
 from app.models.rubric import Rubric
 from app.schemas.rubric import (
@@ -14,6 +30,31 @@ from app.schemas.rubric import (
 
 router = APIRouter(prefix="/rubrics", tags=["rubrics"])
 
+_RUBRIC_LIST_ADAPTER = TypeAdapter(list[RubricResponse])
+
+# Base statements are built once at import; handlers only add WHERE/LIMIT/OFFSET
+_WINDOWED_PAGE_STMT = (
+    select(Rubric, func.count().over().label("total")).order_by(Rubric.created_at.desc())
+)
+_COUNT_STMT = select(func.count()).select_from(Rubric)
+# By-id lookups bind the id at execute time, so every call sends identical SQL and
+# reuses the connection's prepared statement
+_BY_ID_STMT = select(Rubric).where(Rubric.id == bindparam("id"))
+_VERSIONS_STMT = (
+    select(Rubric)
+    .where(Rubric.name == select(Rubric.name).where(Rubric.id == bindparam("id")).scalar_subquery())
+    .order_by(Rubric.version.desc())
+)
+
+
+def _next_version(name: ColumnElement[str]) -> ScalarSelect[int]:
+    """One past the highest version already taken under `name`."""
+    return (
+        select(func.coalesce(func.max(Rubric.version), 0) + 1)
+        .where(Rubric.name == name)
+        .scalar_subquery()
+    )
+
 
 @router.get("", response_model=RubricListResponse)
 async def list_rubrics(
@@ -22,18 +63,23 @@ async def list_rubrics(
     is_active: bool | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> RubricListResponse:
-    query = select(Rubric)
-    count_query = select(func.count(Rubric.id))
-
+    filters: list[ColumnElement[bool]] = []
     if is_active is not None:
-        query = query.where(Rubric.is_active == is_active)
-        count_query = count_query.where(Rubric.is_active == is_active)
-
-    total = (await db.execute(count_query)).scalar_one()
-    result = await db.execute(
-        query.order_by(Rubric.created_at.desc()).offset(offset).limit(limit)
+        filters.append(Rubric.is_active == is_active)
+
+    # Total rides along as a window column so the page and its count share one scan
+    result = await db.execute(_WINDOWED_PAGE_STMT.where(*filters).offset(offset).limit(limit))
+    rows = result.all()
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Page past the end: no rows to carry the window count
+        total = (await db.execute(_COUNT_STMT.where(*filters))).scalar_one()
+    else:
+        total = 0
+    items = _RUBRIC_LIST_ADAPTER.validate_python(
+        [r.Rubric for r in rows], from_attributes=True
     )
-    items = [RubricResponse.model_validate(r) for r in result.scalars().all()]
 
     return RubricListResponse(total=total, offset=offset, limit=limit, items=items)
 
@@ -42,29 +88,36 @@ async def list_rubrics(
 async def create_rubric(
     body: RubricCreate,
     db: AsyncSession = Depends(get_db),
-) -> RubricResponse:
-    rubric = Rubric(
-        name=body.name,
-        description=body.description,
-        dimensions=body.dimensions,
-        version=1,
+) -> Rubric:
+    """Create a rubric. Reusing an existing name adds the next version under it."""
+    stmt = (
+        insert(Rubric)
+        .values(
+            name=body.name,
+            description=body.description,
+            dimensions=body.dimensions,
+            version=_next_version(literal(body.name, String)),
+        )
+        .returning(Rubric)
     )
-    db.add(rubric)
-    await db.flush()
-    await db.refresh(rubric)
-    return RubricResponse.model_validate(rubric)
+    try:
+        rubric = (await db.execute(stmt)).scalar_one()
+    except IntegrityError:
+        # uq_rubrics_name_version: a concurrent create or update took the same version
+        raise ConflictError(f"Rubric '{body.name}' was changed concurrently, retry") from None
+    return rubric
 
 
 @router.get("/{rubric_id}", response_model=RubricResponse)
 async def get_rubric(
     rubric_id: str,
     db: AsyncSession = Depends(get_db),
-) -> RubricResponse:
-    result = await db.execute(select(Rubric).where(Rubric.id == rubric_id))
+) -> Rubric:
+    result = await db.execute(_BY_ID_STMT, {"id": rubric_id})
     rubric = result.scalar_one_or_none()
     if not rubric:
         raise NotFoundError("Rubric", rubric_id)
-    return RubricResponse.model_validate(rubric)
+    return rubric
 
 
 @router.put("/{rubric_id}", response_model=RubricResponse)
@@ -72,46 +125,55 @@ async def update_rubric(
     rubric_id: str,
     body: RubricUpdate,
     db: AsyncSession = Depends(get_db),
-) -> RubricResponse:
+) -> Rubric:
     """Creates a new version of the rubric. Rubrics are immutable once created."""
-    result = await db.execute(select(Rubric).where(Rubric.id == rubric_id))
-    old_rubric = result.scalar_one_or_none()
-    if not old_rubric:
-        raise NotFoundError("Rubric", rubric_id)
-
-    # Create new version
-    new_rubric = Rubric(
-        name=body.name or old_rubric.name,
-        description=body.description if body.description is not None else old_rubric.description,
-        dimensions=body.dimensions or old_rubric.dimensions,
-        version=old_rubric.version + 1,
-        parent_id=old_rubric.id,
+    # One INSERT ... SELECT: the new row inherits unset fields from the old one, and its
+    # version follows the highest already taken under its name
+    old = (
+        select(Rubric.name, Rubric.description, Rubric.dimensions)
+        .where(Rubric.id == rubric_id)
+        .cte("old")
+    )
+    name = func.coalesce(literal(body.name, String), old.c.name)
+    stmt = (
+        insert(Rubric)
+        .from_select(
+            ["id", "name", "description", "dimensions", "version", "parent_id", "is_active"],
+            select(
+                literal(str(uuid7()), UUID(as_uuid=False)),
+                name,
+                func.coalesce(literal(body.description, Text), old.c.description),
+                func.coalesce(literal(body.dimensions or None, JSONB), old.c.dimensions),
+                _next_version(name),
+                literal(rubric_id, UUID(as_uuid=False)),
+                true(),
+            ),
+        )
+        .returning(Rubric)
     )
-    db.add(new_rubric)
-    await db.flush()
-    await db.refresh(new_rubric)
-    return RubricResponse.model_validate(new_rubric)
+    try:
+        new_rubric = (await db.execute(stmt)).scalar_one_or_none()
+    except IntegrityError:
+        # uq_rubrics_name_version: another update claimed the same version first
+        raise ConflictError(
+            f"Rubric '{rubric_id}' was updated concurrently, retry the update"
+        ) from None
+    if new_rubric is None:
+        raise NotFoundError("Rubric", rubric_id)
+    return new_rubric
 
 
 @router.get("/{rubric_id}/versions", response_model=list[RubricResponse])
 async def list_rubric_versions(
     rubric_id: str,
     db: AsyncSession = Depends(get_db),
-) -> list[RubricResponse]:
+) -> list[Rubric]:
     """List all versions of a rubric by tracing the parent chain."""
-    result = await db.execute(select(Rubric).where(Rubric.id == rubric_id))
-    rubric = result.scalar_one_or_none()
-    if not rubric:
+    # Versions share a name; a rubric always matches its own, so no rows means no rubric
+    versions = (await db.execute(_VERSIONS_STMT, {"id": rubric_id})).scalars().all()
+    if not versions:
         raise NotFoundError("Rubric", rubric_id)
-
-    # Collect all versions with the same name
-    result = await db.execute(
-        select(Rubric)
-        .where(Rubric.name == rubric.name)
-        .order_by(Rubric.version.desc())
-    )
-    versions = [RubricResponse.model_validate(r) for r in result.scalars().all()]
-    return versions
+    return list(versions)
 
 
 @router.delete("/{rubric_id}", status_code=204)
@@ -119,9 +181,11 @@ async def delete_rubric(
     rubric_id: str,
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    result = await db.execute(select(Rubric).where(Rubric.id == rubric_id))
-    rubric = result.scalar_one_or_none()
-    if not rubric:
+    result = await db.execute(
+        update(Rubric)
+        .where(Rubric.id == rubric_id)
+        .values(is_active=False)
+        .returning(Rubric.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise NotFoundError("Rubric", rubric_id)
-    rubric.is_active = False
-    await db.flush()
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, bindparam, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
@@ -14,6 +15,16 @@ from app.schemas.scenario import (
 
 router = APIRouter(prefix="/scenarios", tags=["scenarios"])
 
+_SCENARIO_LIST_ADAPTER = TypeAdapter(list[ScenarioResponse])
+
+# Base statements are built once at import; handlers only add WHERE/LIMIT/OFFSET
+_WINDOWED_PAGE_STMT = (
+    select(Scenario, func.count().over().label("total")).order_by(Scenario.created_at.desc())
+)
+_COUNT_STMT = select(func.count()).select_from(Scenario)
+# Id bound at execute time: identical SQL on every call reuses the prepared statement
+_BY_ID_STMT = select(Scenario).where(Scenario.id == bindparam("id"))
+
 
 @router.get("", response_model=ScenarioListResponse)
 async def list_scenarios(
@@ -24,24 +35,27 @@ async def list_scenarios(
     difficulty: str | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> ScenarioListResponse:
-    query = select(Scenario)
-    count_query = select(func.count(Scenario.id))
-
+    filters: list[ColumnElement[bool]] = []
     if is_active is not None:
-        query = query.where(Scenario.is_active == is_active)
-        count_query = count_query.where(Scenario.is_active == is_active)
+        filters.append(Scenario.is_active == is_active)
     if category:
-        query = query.where(Scenario.category == category)
-        count_query = count_query.where(Scenario.category == category)
+        filters.append(Scenario.category == category)
     if difficulty:
-        query = query.where(Scenario.difficulty == difficulty)
-        count_query = count_query.where(Scenario.difficulty == difficulty)
-
-    total = (await db.execute(count_query)).scalar_one()
-    result = await db.execute(
-        query.order_by(Scenario.created_at.desc()).offset(offset).limit(limit)
+        filters.append(Scenario.difficulty == difficulty)
+
+    # Total rides along as a window column so the page and its count share one scan
+    result = await db.execute(_WINDOWED_PAGE_STMT.where(*filters).offset(offset).limit(limit))
+    rows = result.all()
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Page past the end: no rows to carry the window count
+        total = (await db.execute(_COUNT_STMT.where(*filters))).scalar_one()
+    else:
+        total = 0
+    items = _SCENARIO_LIST_ADAPTER.validate_python(
+        [r.Scenario for r in rows], from_attributes=True
     )
-    items = [ScenarioResponse.model_validate(r) for r in result.scalars().all()]
 
     return ScenarioListResponse(total=total, offset=offset, limit=limit, items=items)
 
@@ -50,33 +64,35 @@ async def list_scenarios(
 async def create_scenario(
     body: ScenarioCreate,
     db: AsyncSession = Depends(get_db),
-) -> ScenarioResponse:
-    scenario = Scenario(
-        name=body.name,
-        description=body.description,
-        category=body.category,
-        turns_template=body.turns_template,
-        user_persona=body.user_persona,
-        constraints=body.constraints,
-        difficulty=body.difficulty,
-        tags=body.tags,
+) -> Scenario:
+    stmt = (
+        insert(Scenario)
+        .values(
+            name=body.name,
+            description=body.description,
+            category=body.category,
+            turns_template=body.turns_template,
+            user_persona=body.user_persona,
+            constraints=body.constraints,
+            difficulty=body.difficulty,
+            tags=body.tags,
+        )
+        .returning(Scenario)
     )
-    db.add(scenario)
-    await db.flush()
-    await db.refresh(scenario)
-    return ScenarioResponse.model_validate(scenario)
+    scenario = (await db.execute(stmt)).scalar_one()
+    return scenario
 
 
 @router.get("/{scenario_id}", response_model=ScenarioResponse)
 async def get_scenario(
     scenario_id: str,
     db: AsyncSession = Depends(get_db),
-) -> ScenarioResponse:
-    result = await db.execute(select(Scenario).where(Scenario.id == scenario_id))
+) -> Scenario:
+    result = await db.execute(_BY_ID_STMT, {"id": scenario_id})
     scenario = result.scalar_one_or_none()
     if not scenario:
         raise NotFoundError("Scenario", scenario_id)
-    return ScenarioResponse.model_validate(scenario)
+    return scenario
 
 
 @router.put("/{scenario_id}", response_model=ScenarioResponse)
@@ -84,18 +100,21 @@ async def update_scenario(
     scenario_id: str,
     body: ScenarioUpdate,
     db: AsyncSession = Depends(get_db),
-) -> ScenarioResponse:
-    result = await db.execute(select(Scenario).where(Scenario.id == scenario_id))
-    scenario = result.scalar_one_or_none()
+) -> Scenario:
+    update_data = body.model_dump(exclude_unset=True)
+    if update_data:
+        stmt = (
+            update(Scenario)
+            .where(Scenario.id == scenario_id)
+            .values(**update_data)
+            .returning(Scenario)
+        )
+        scenario = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        scenario = (await db.execute(_BY_ID_STMT, {"id": scenario_id})).scalar_one_or_none()
     if not scenario:
         raise NotFoundError("Scenario", scenario_id)
-
-    for key, value in body.model_dump(exclude_unset=True).items():
-        setattr(scenario, key, value)
-
-    await db.flush()
-    await db.refresh(scenario)
-    return ScenarioResponse.model_validate(scenario)
+    return scenario
 
 
 @router.delete("/{scenario_id}", status_code=204)
@@ -103,9 +122,11 @@ async def delete_scenario(
     scenario_id: str,
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    result = await db.execute(select(Scenario).where(Scenario.id == scenario_id))
-    scenario = result.scalar_one_or_none()
-    if not scenario:
+    result = await db.execute(
+        update(Scenario)
+        .where(Scenario.id == scenario_id)
+        .values(is_active=False)
+        .returning(Scenario.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise NotFoundError("Scenario", scenario_id)
-    scenario.is_active = False
-    await db.flush()
@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -13,23 +15,36 @@ class Settings(BaseSettings):
     postgres_user: str = "agentprobe"
     postgres_password: str = "agentprobe"
     postgres_db: str = "agentprobe"
+    # Prepared statements kept per connection; set to 0 behind pgbouncer in transaction mode
+    postgres_statement_cache_size: int = 500
+    # Connections held per process; size against max_connections x worker count
+    postgres_pool_size: int = 20
+    postgres_max_overflow: int = 10
+    postgres_pool_recycle_s: int = 1800
 
-    @property
+    # Built on first access and kept; settings are not mutated after startup
+    @cached_property
     def database_url(self) -> str:
         return (
             f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
         return (
             f"postgresql://{self.postgres_user}:{self.postgres_password}"
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    # Worker threads for sync work offloaded by the event loop; unset sizes it from the DB pool
+    threadpool_tokens: int | None = None
+
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 20
+    # How long a caller waits for a free pooled connection before erroring
+    redis_pool_timeout_s: float = 5.0
 
     # Kafka
     kafka_bootstrap_servers: str = "localhost:9092"
@@ -38,6 +53,10 @@ class Settings(BaseSettings):
     # ChromaDB
     chromadb_host: str = "localhost"
     chromadb_port: int = 8000
+    # HNSW graph parameters, applied when the collection is first created
+    chromadb_hnsw_m: int = 32
+    chromadb_hnsw_construction_ef: int = 200
+    chromadb_hnsw_search_ef: int = 64
 
     # LLM Provider (model-agnostic via LiteLLM)
     # Provider: "ollama", "anthropic", "openai"
@@ -51,6 +70,13 @@ class Settings(BaseSettings):
     default_model: str = "ollama/mistral:7b-instruct"
     judge_model: str = "ollama/mistral:7b-instruct"
     user_simulator_model: str = "ollama/llama3:8b-instruct-q4_K_M"
+    # Conversations of one eval run simulated at the same time
+    simulation_concurrency: int = 10
+    # Master switch for replaying identical completions from Redis. Only calls that
+    # opt in with chat(cache=True) use it (the judges); sampled agent and
+    # user-simulator turns never do, so seeded runs still differ
+    llm_cache_enabled: bool = False
+    llm_cache_ttl_s: int = 3600
 
     # Celery
     celery_broker_url: str = "redis://localhost:6379/1"
@@ -59,4 +85,10 @@ class Settings(BaseSettings):
     model_config = {"env_prefix": "AGENTPROBE_", "env_file": ".env"}
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings, parsed from the environment once."""
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,27 @@
+"""Weak ETags and If-None-Match handling for polled detail GETs."""
+
+from datetime import datetime
+
+from fastapi import Request, Response
+
+
+def weak_etag(*parts: str | datetime | None) -> str:
+    """Build a weak ETag from the fields that change whenever the resource does."""
+    tokens = [
+        str(int(p.timestamp() * 1000)) if isinstance(p, datetime) else (p or "-")
+        for p in parts
+    ]
+    return f'W/"{":".join(tokens)}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """Tag the response, returning a bodiless 304 if the client already has this version."""
+    response.headers["ETag"] = etag
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+    # Weak comparison (RFC 9110 §13.1.2): the W/ prefix is ignored on both sides
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -20,13 +20,17 @@ def setup_logging(debug: bool = False) -> None:
     else:
         renderer = structlog.processors.JSONRenderer()
 
+    level = logging.DEBUG if debug else logging.INFO
+
     structlog.configure(
         processors=[
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the level return before any processor runs; the stdlib
+        # BoundLogger ran the whole chain and let logging drop the result
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
@@ -43,7 +47,7 @@ def setup_logging(debug: bool = False) -> None:
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.addHandler(handler)
-    root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    root_logger.setLevel(level)
 
     # Quiet noisy libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
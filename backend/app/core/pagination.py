@@ -0,0 +1,22 @@
+"""Opaque keyset cursors for ``created_at DESC, id DESC`` listings."""
+
+import base64
+from datetime import datetime
+
+from app.core.exceptions import ValidationError
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor into (created_at, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except ValueError as e:
+        raise ValidationError(f"Invalid pagination cursor: {cursor!r}") from e
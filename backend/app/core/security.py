@@ -1,3 +1,5 @@
+import hmac
+
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import APIKeyHeader
 
@@ -5,12 +7,18 @@ from app.config import settings
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# None when no key is configured (auth disabled)
+_API_KEY_BYTES = (
+    settings.api_key.encode() if settings.api_key and settings.api_key != "changeme" else None
+)
+
 
 async def verify_api_key(api_key: str | None = Security(api_key_header)) -> str:
     """Verify API key from request header. Skip if no key configured."""
-    if not settings.api_key or settings.api_key == "changeme":
+    if _API_KEY_BYTES is None:
         return "anonymous"
-    if not api_key or api_key != settings.api_key:
+    # Constant-time compare so response timing doesn't leak a matching prefix
+    if not api_key or not hmac.compare_digest(api_key.encode(), _API_KEY_BYTES):
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
     return api_key
 
@@ -0,0 +1,28 @@
+"""Bulk row writes for worker-side result tables (evaluation metrics)."""
+
+from typing import Any
+
+from sqlalchemy import Table
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def bulk_upsert(
+    session: AsyncSession,
+    table: Table,
+    rows: list[dict[str, Any]],
+    conflict_columns: list[str],
+    update_columns: list[str],
+) -> None:
+    """Insert rows, overwriting update_columns where conflict_columns already match.
+
+    Resolved server-side with ON CONFLICT, so retried writers need no pre-SELECT.
+    """
+    if not rows:
+        return
+    stmt = pg_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={name: stmt.excluded[name] for name in update_columns},
+    )
+    await session.execute(stmt, rows)
@@ -5,6 +5,7 @@ from app.config import settings
 
 class ChromaDBClient:
     _client: chromadb.HttpClient | None = None
+    _conversations: chromadb.Collection | None = None
 
     @classmethod
     def get_client(cls) -> chromadb.HttpClient:
@@ -17,8 +18,17 @@ class ChromaDBClient:
 
     @classmethod
     def get_conversations_collection(cls) -> chromadb.Collection:
-        client = cls.get_client()
-        return client.get_or_create_collection(
-            name="conversations",
-            metadata={"hnsw:space": "cosine"},
-        )
+        if cls._conversations is None:
+            client = cls.get_client()
+            # Chroma only reads hnsw:* metadata when it creates the collection;
+            # an existing collection keeps the parameters it was built with
+            cls._conversations = client.get_or_create_collection(
+                name="conversations",
+                metadata={
+                    "hnsw:space": "cosine",
+                    "hnsw:M": settings.chromadb_hnsw_m,
+                    "hnsw:construction_ef": settings.chromadb_hnsw_construction_ef,
+                    "hnsw:search_ef": settings.chromadb_hnsw_search_ef,
+                },
+            )
+        return cls._conversations
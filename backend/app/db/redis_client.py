@@ -2,12 +2,24 @@ import redis.asyncio as redis
 
 from app.config import settings
 
-redis_pool = redis.from_url(
+# Blocking pool: bursts past max_connections queue for a free connection instead of
+# failing outright; idle connections are pinged before reuse
+_pool = redis.BlockingConnectionPool.from_url(
     settings.redis_url,
     decode_responses=True,
-    max_connections=20,
+    max_connections=settings.redis_max_connections,
+    timeout=settings.redis_pool_timeout_s,
+    socket_keepalive=True,
+    health_check_interval=30,
 )
+redis_pool = redis.Redis(connection_pool=_pool)
 
 
 async def get_redis() -> redis.Redis:  # type: ignore[type-arg]
     return redis_pool
+
+
+async def aclose_redis() -> None:
+    """Drop pooled connections opened on the running loop (Celery task end, shutdown)."""
+    await _pool.disconnect()
+
@@ -0,0 +1,42 @@
+"""Short-TTL Redis cache for single-resource GET responses.
+
+Best-effort throughout: a Redis failure is logged and the caller falls back
+to Postgres, so the cache can never fail a request.
+"""
+
+import structlog
+from pydantic import BaseModel
+
+from app.db.redis_client import redis_pool
+
+logger = structlog.get_logger()
+
+
+def cache_key(resource: str, resource_id: str) -> str:
+    return f"{resource}:{resource_id}"
+
+
+async def get_cached[ModelT: BaseModel](key: str, model: type[ModelT]) -> ModelT | None:
+    """Return the cached response for key, or None on a miss."""
+    try:
+        raw = await redis_pool.get(key)
+    except Exception as e:
+        logger.warning("response_cache_get_failed", key=key, error=str(e))
+        return None
+    return model.model_validate_json(raw) if raw is not None else None
+
+
+async def set_cached(key: str, value: BaseModel, ttl_s: int) -> None:
+    """Store a response under key for ttl_s seconds."""
+    try:
+        await redis_pool.set(key, value.model_dump_json(by_alias=True), ex=ttl_s)
+    except Exception as e:
+        logger.warning("response_cache_set_failed", key=key, error=str(e))
+
+
+async def invalidate(key: str) -> None:
+    """Drop a cached response after the row behind it changed."""
+    try:
+        await redis_pool.delete(key)
+    except Exception as e:
+        logger.warning("response_cache_invalidate_failed", key=key, error=str(e))
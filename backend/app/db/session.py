@@ -1,15 +1,33 @@
-from collections.abc import AsyncGenerator
+import inspect
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_size=20,
-    max_overflow=10,
+    # Connections stay open across requests; recycling caps per-backend memory growth
+    # and replaces connections before a proxy's idle timeout can cut them
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.postgres_pool_size,
+    max_overflow=settings.postgres_max_overflow,
+    pool_recycle=settings.postgres_pool_recycle_s,
     pool_pre_ping=True,
+    # executemany INSERTs are rewritten as multi-row VALUES, this many rows per statement
+    insertmanyvalues_page_size=1000,
+    # Compiled SQL per distinct statement shape (filter combinations x endpoints)
+    query_cache_size=1200,
+    # Repeat executions of the same SQL skip parse/plan: SQLAlchemy's adapter keeps
+    # the prepared statements, asyncpg caches their type info
+    connect_args={
+        "prepared_statement_cache_size": settings.postgres_statement_cache_size,
+        "statement_cache_size": settings.postgres_statement_cache_size,
+        # Short OLTP queries only; JIT compile time would dominate their runtime
+        "server_settings": {"jit": "off"},
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -19,6 +37,14 @@ async_session_factory = async_sessionmaker(
 )
 
 
+def on_commit(session: AsyncSession, callback: Callable[[], Awaitable[None] | object]) -> None:
+    """Run callback once get_db has committed the request's transaction.
+
+    Callbacks may be sync or async and are dropped if the transaction rolls back.
+    """
+    session.info.setdefault("after_commit", []).append(callback)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
@@ -27,3 +53,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+        for callback in session.info.pop("after_commit", []):
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
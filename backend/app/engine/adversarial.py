@@ -43,20 +43,27 @@ ALL_ADVERSARIAL: list[list[str]] = [
     EMOTIONAL_MESSAGES,
 ]
 
+# Flattened once so a pick is a single draw, uniform over messages
+_FLAT_ADVERSARIAL: tuple[str, ...] = tuple(msg for category in ALL_ADVERSARIAL for msg in category)
+
 
 class AdversarialStrategy:
     """Injects adversarial user messages at configured turn indices."""
 
-    def __init__(self, environment: SimulationEnvironment) -> None:
-        self.adversarial_turns = set(environment.adversarial_turns)
+    def __init__(
+        self,
+        environment: SimulationEnvironment,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.adversarial_turns = frozenset(environment.adversarial_turns)
+        self._rng = rng or random.Random(environment.seed)
 
     def should_inject(self, turn_index: int) -> bool:
         return turn_index in self.adversarial_turns
 
     def generate_adversarial_input(self, turn_index: int) -> str:
-        """Pick a random adversarial message from a random category."""
-        category = random.choice(ALL_ADVERSARIAL)
-        return random.choice(category)
+        """Pick a random adversarial message across all categories."""
+        return self._rng.choice(_FLAT_ADVERSARIAL)
 
 
 class NoOpAdversarial:
@@ -67,3 +74,7 @@ class NoOpAdversarial:
 
     def generate_adversarial_input(self, turn_index: int) -> str:
         return ""
+
+
+# Stateless, so every runner without adversarial turns shares this one
+NO_ADVERSARIAL = NoOpAdversarial()
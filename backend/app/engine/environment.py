@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationEnvironment:
     """Defines constraints and conditions for a simulation run."""
 
@@ -25,6 +25,9 @@ class SimulationEnvironment:
     # Adversarial injection
     adversarial_turns: list[int] = field(default_factory=list)
 
+    # Seeds tool failures and adversarial picks so a run can be replayed; None is random
+    seed: int | None = None
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SimulationEnvironment:
         return cls(
@@ -34,4 +37,5 @@ class SimulationEnvironment:
             tool_failure_rate=data.get("tool_failure_rate", 0.0),
             tool_latency_ms=data.get("tool_latency_ms", 0),
             adversarial_turns=data.get("adversarial_turns", []),
+            seed=data.get("seed"),
         )
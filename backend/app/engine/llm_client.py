@@ -8,17 +8,60 @@ This is the ONLY file that talks to LLM APIs. Mock this for tests.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+from dataclasses import asdict
 from typing import Any
 
+import httpx
+import litellm
+import orjson
 import structlog
 from litellm import acompletion
 
 from app.config import settings
+from app.db.redis_client import redis_pool
 from app.engine.types import LLMResponse, ToolCall
 
 logger = structlog.get_logger()
 
+# Keep-alive connections for LiteLLM's OpenAI-compatible transport (OpenAI, Azure),
+# shared by every LLMClient on the loop. Other providers, Ollama and Anthropic
+# included, keep their own cached httpx clients and never read this session
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _install_http_client() -> None:
+    """Point litellm.aclient_session at the running loop's pooled client.
+
+    httpx connections belong to the loop that opened them, and Celery tasks
+    each run their own loop via asyncio.run(), so there is one client per loop.
+    The global is only reassigned when the loop's client changes.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        # Drop clients whose loop has finished (previous Celery tasks)
+        for stale in [lp for lp in _http_clients if lp.is_closed()]:
+            del _http_clients[stale]
+        client = _http_clients[loop] = httpx.AsyncClient(
+            limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+        )
+    if litellm.aclient_session is not client:
+        litellm.aclient_session = client
+
+
+async def aclose_http_client() -> None:
+    """Close the running loop's pooled client (app shutdown)."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        if litellm.aclient_session is client:
+            litellm.aclient_session = None
+        await client.aclose()
+
 
 class LLMClient:
     """Unified LLM client wrapping LiteLLM."""
@@ -41,6 +84,8 @@ class LLMClient:
         tools: list[dict[str, Any]] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        stream: bool = False,
+        cache: bool = False,
     ) -> LLMResponse:
         """Send a chat completion request to any LLM provider.
 
@@ -52,6 +97,11 @@ class LLMClient:
             tools: Tool definitions in OpenAI function calling format
             temperature: Sampling temperature
             max_tokens: Maximum output tokens
+            stream: Receive the completion as it is generated and assemble it
+                    chunk by chunk; the returned response has the same shape
+            cache: Replay an identical earlier completion from Redis. Only for
+                   calls whose output should not vary (judges); needs
+                   settings.llm_cache_enabled as well
 
         Returns:
             Normalized LLMResponse regardless of provider
@@ -77,61 +127,161 @@ class LLMClient:
         if model.startswith("ollama/"):
             kwargs["api_base"] = settings.ollama_base_url
 
+        cache_key = _cache_key(kwargs) if cache and settings.llm_cache_enabled else None
+        if cache_key is not None:
+            cached = await _get_cached(cache_key)
+            if cached is not None:
+                logger.debug("llm_cache_hit", model=model)
+                return cached
+
         logger.debug(
             "llm_request",
             model=model,
             message_count=len(full_messages),
             has_tools=bool(tools),
+            stream=stream,
         )
 
-        response = await acompletion(**kwargs)
-
-        # Normalize response
-        message = response.choices[0].message
-        content = message.content or ""
-
-        # Extract tool calls if present
-        tool_calls: list[ToolCall] = []
-        if message.tool_calls:
-            for tc in message.tool_calls:
-                args = tc.function.arguments
-                # LiteLLM may return args as string or dict
-                if isinstance(args, str):
-                    import json
-                    try:
-                        args = json.loads(args)
-                    except json.JSONDecodeError:
-                        args = {"raw": args}
-
-                tool_calls.append(
-                    ToolCall(
-                        id=tc.id or f"call_{id(tc)}",
-                        name=tc.function.name,
-                        arguments=args,
-                    )
-                )
-
-        # Extract usage
-        usage = response.usage
-        input_tokens = usage.prompt_tokens if usage else 0
-        output_tokens = usage.completion_tokens if usage else 0
-
-        result = LLMResponse(
-            content=content,
-            tool_calls=tool_calls,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            model=response.model or model,
-            stop_reason=response.choices[0].finish_reason or "",
-        )
+        _install_http_client()
+        if stream:
+            # Usage only arrives on the final chunk, and only when asked for
+            chunks = await acompletion(
+                **kwargs, stream=True, stream_options={"include_usage": True}
+            )
+            result = await _from_stream(chunks, model)
+        else:
+            result = _from_completion(await acompletion(**kwargs), model)
 
         logger.debug(
             "llm_response",
             model=model,
-            content_length=len(content),
-            tool_call_count=len(tool_calls),
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
+            content_length=len(result.content),
+            tool_call_count=len(result.tool_calls),
+            input_tokens=result.input_tokens,
+            output_tokens=result.output_tokens,
         )
 
+        if cache_key is not None:
+            await _set_cached(cache_key, result)
         return result
+
+
+def _parse_arguments(args: Any) -> dict[str, Any]:
+    """Tool-call arguments as a dict; LiteLLM may return them as a JSON string."""
+    if isinstance(args, str):
+        try:
+            return orjson.loads(args)  # type: ignore[no-any-return]
+        except orjson.JSONDecodeError:
+            return {"raw": args}
+    return args  # type: ignore[no-any-return]
+
+
+def _from_completion(response: Any, model: str) -> LLMResponse:
+    """Normalize a complete (non-streamed) LiteLLM response."""
+    message = response.choices[0].message
+    tool_calls = [
+        ToolCall(
+            id=tc.id or f"call_{id(tc)}",
+            name=tc.function.name,
+            arguments=_parse_arguments(tc.function.arguments),
+        )
+        for tc in message.tool_calls or ()
+    ]
+    usage = response.usage
+    return LLMResponse(
+        content=message.content or "",
+        tool_calls=tool_calls,
+        input_tokens=usage.prompt_tokens if usage else 0,
+        output_tokens=usage.completion_tokens if usage else 0,
+        model=response.model or model,
+        stop_reason=response.choices[0].finish_reason or "",
+    )
+
+
+async def _from_stream(chunks: Any, model: str) -> LLMResponse:
+    """Assemble a streamed LiteLLM response into the same shape as _from_completion.
+
+    Content arrives as text deltas; each tool call arrives as fragments keyed by
+    its index, with the id and name up front and the JSON arguments split
+    across chunks.
+    """
+    content: list[str] = []
+    calls: dict[int, dict[str, Any]] = {}
+    usage = None
+    stop_reason = ""
+    response_model = ""
+
+    async for chunk in chunks:
+        response_model = chunk.model or response_model
+        usage = getattr(chunk, "usage", None) or usage
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        delta = choice.delta
+        if delta.content:
+            content.append(delta.content)
+        for tc in delta.tool_calls or ():
+            call = calls.setdefault(tc.index, {"id": "", "name": "", "arguments": []})
+            if tc.id:
+                call["id"] = tc.id
+            if tc.function.name:
+                call["name"] = tc.function.name
+            if tc.function.arguments:
+                call["arguments"].append(tc.function.arguments)
+        if choice.finish_reason:
+            stop_reason = choice.finish_reason
+
+    tool_calls = [
+        ToolCall(
+            id=call["id"] or f"call_{index}",
+            name=call["name"],
+            arguments=_parse_arguments("".join(call["arguments"]) or "{}"),
+        )
+        for index, call in sorted(calls.items())
+    ]
+    return LLMResponse(
+        content="".join(content),
+        tool_calls=tool_calls,
+        input_tokens=usage.prompt_tokens if usage else 0,
+        output_tokens=usage.completion_tokens if usage else 0,
+        model=response_model or model,
+        stop_reason=stop_reason,
+    )
+
+
+# Response cache helpers. Best-effort like the API response cache: a Redis
+# failure costs the hit, never the call
+def _cache_key(request: dict[str, Any]) -> str:
+    """Key over everything sent to the provider, so any difference is a miss."""
+    payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS, default=str)
+    return "llm:" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def _get_cached(key: str) -> LLMResponse | None:
+    try:
+        raw = await redis_pool.get(key)
+    except Exception as e:
+        logger.warning("llm_cache_get_failed", error=str(e))
+        return None
+    if raw is None:
+        return None
+    try:
+        data = orjson.loads(raw)
+        data["tool_calls"] = [ToolCall(**tc) for tc in data["tool_calls"]]
+        return LLMResponse(**data)
+    except Exception as e:
+        # Corrupt, or written before an LLMResponse/ToolCall field change: drop it so
+        # the next identical request refills it instead of failing until the TTL
+        logger.warning("llm_cache_decode_failed", error=str(e))
+        try:
+            await redis_pool.delete(key)
+        except Exception as delete_err:
+            logger.warning("llm_cache_delete_failed", error=str(delete_err))
+        return None
+
+
+async def _set_cached(key: str, response: LLMResponse) -> None:
+    try:
+        await redis_pool.set(key, orjson.dumps(asdict(response)), ex=settings.llm_cache_ttl_s)
+    except Exception as e:
+        logger.warning("llm_cache_set_failed", error=str(e))
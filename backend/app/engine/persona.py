@@ -6,10 +6,11 @@ Personas are pure data — no logic. Loaded from DB models (AgentConfig, Scenari
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPersona:
     """Configuration for the agent under test. Loaded from agent_configs table."""
 
@@ -41,8 +42,10 @@ class UserPersona:
     goal: str = "Get help with a task"
     model: str = "ollama/llama3:8b-instruct-q4_K_M"
 
-    @property
+    @cached_property
     def system_prompt(self) -> str:
+        # Read on every simulated user turn; formatted once since personas
+        # aren't modified after loading
         return f"""You are simulating a real user in a conversation with an AI assistant.
 
 Your persona:
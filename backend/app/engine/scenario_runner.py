@@ -13,12 +13,14 @@ Depends on protocols, not implementations — fully testable with mocks.
 
 from __future__ import annotations
 
+import asyncio
+import re
 import time
 from typing import Any
 
 import structlog
 
-from app.engine.adversarial import AdversarialStrategy, NoOpAdversarial
+from app.engine.adversarial import NO_ADVERSARIAL, AdversarialStrategy, NoOpAdversarial
 from app.engine.environment import SimulationEnvironment
 from app.engine.persona import AgentPersona, UserPersona
 from app.engine.tool_simulator import ToolSimulator
@@ -33,6 +35,12 @@ from app.engine.user_simulator import UserSimulator
 
 logger = structlog.get_logger()
 
+# Conversations run_scenarios keeps in flight unless told otherwise
+DEFAULT_CONCURRENCY = 10
+
+# User-simulator sentinels that end the conversation, found in one scan
+_SIGNAL_RE = re.compile(r"\[(GOAL_ACHIEVED|FRUSTRATED)\]")
+
 
 class ScenarioRunner:
     """Executes a multi-turn conversation between an agent and simulated user.
@@ -60,16 +68,24 @@ class ScenarioRunner:
         self.user_sim = user_simulator
         self.tool_sim = tool_simulator
         self.env = environment
-        self.adversarial = adversarial or NoOpAdversarial()
+        self.adversarial = adversarial or NO_ADVERSARIAL
+        # LLM-format history, extended as turns are recorded rather than
+        # rebuilt from the turn list before every agent call
+        self._messages: list[dict[str, Any]] = []
 
     async def run(self) -> ConversationResult:
         """Execute the full multi-turn conversation."""
         turns: list[Turn] = []
         total_input_tokens = 0
         total_output_tokens = 0
+        total_tokens = 0
         total_latency_ms = 0
+        turn_count = 0
         status = "completed"
         error_message: str | None = None
+        self._messages = []
+        # Decided once per run: without adversarial turns the per-turn check is skipped
+        adversarial = None if isinstance(self.adversarial, NoOpAdversarial) else self.adversarial
 
         logger.info(
             "scenario_run_started",
@@ -80,31 +96,35 @@ class ScenarioRunner:
         try:
             for turn_index in range(self.env.max_turns):
                 # === USER TURN ===
-                if self.adversarial.should_inject(turn_index):
-                    user_message = self.adversarial.generate_adversarial_input(turn_index)
+                if adversarial is not None and adversarial.should_inject(turn_index):
+                    user_message = adversarial.generate_adversarial_input(turn_index)
                     logger.debug("adversarial_injected", turn=turn_index)
                 else:
+                    # Not prefetched: the simulated user answers the agent's latest
+                    # reply, so this call can't start before the previous turn ends
                     user_message = await self.user_sim.generate(turns, turn_index)
 
                 user_turn = Turn(role="user", content=user_message)
-                turns.append(user_turn)
+                self._record(turns, user_turn)
+                turn_count += 1
 
                 # Check for goal/frustration signals
-                if "[GOAL_ACHIEVED]" in user_message:
-                    status = "goal_achieved"
-                    logger.info("goal_achieved", turn=turn_index)
-                    break
-                if "[FRUSTRATED]" in user_message:
-                    status = "frustrated"
-                    logger.info("user_frustrated", turn=turn_index)
+                signal = _SIGNAL_RE.search(user_message)
+                if signal:
+                    if signal.group(1) == "GOAL_ACHIEVED":
+                        status = "goal_achieved"
+                        logger.info("goal_achieved", turn=turn_index)
+                    else:
+                        status = "frustrated"
+                        logger.info("user_frustrated", turn=turn_index)
                     break
 
                 # === AGENT TURN ===
-                start_time = time.perf_counter()
+                start_ns = time.perf_counter_ns()
 
-                agent_response = await self._agent_turn(turns)
+                agent_response = await self._agent_turn()
 
-                latency_ms = int((time.perf_counter() - start_time) * 1000)
+                latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                 # Handle tool calls if present
                 if agent_response.tool_calls:
@@ -120,16 +140,12 @@ class ScenarioRunner:
                         input_tokens=agent_response.input_tokens,
                         output_tokens=agent_response.output_tokens,
                     )
-                    turns.append(tool_turn)
+                    self._record(turns, tool_turn)
 
                     # Agent follow-up after tool results
-                    followup_start = time.perf_counter()
-                    followup = await self._agent_turn_with_tool_results(
-                        turns, tool_results
-                    )
-                    followup_latency = int(
-                        (time.perf_counter() - followup_start) * 1000
-                    )
+                    followup_start_ns = time.perf_counter_ns()
+                    followup = await self._agent_turn_with_tool_results(tool_results)
+                    followup_latency = (time.perf_counter_ns() - followup_start_ns) // 1_000_000
 
                     followup_turn = Turn(
                         role="assistant",
@@ -138,10 +154,10 @@ class ScenarioRunner:
                         input_tokens=followup.input_tokens,
                         output_tokens=followup.output_tokens,
                     )
-                    turns.append(followup_turn)
+                    self._record(turns, followup_turn)
 
-                    total_input_tokens += agent_response.input_tokens + followup.input_tokens
-                    total_output_tokens += agent_response.output_tokens + followup.output_tokens
+                    turn_input = agent_response.input_tokens + followup.input_tokens
+                    turn_output = agent_response.output_tokens + followup.output_tokens
                     total_latency_ms += latency_ms + followup_latency
                 else:
                     # No tool calls — straightforward response
@@ -152,14 +168,17 @@ class ScenarioRunner:
                         input_tokens=agent_response.input_tokens,
                         output_tokens=agent_response.output_tokens,
                     )
-                    turns.append(agent_turn)
+                    self._record(turns, agent_turn)
 
-                    total_input_tokens += agent_response.input_tokens
-                    total_output_tokens += agent_response.output_tokens
+                    turn_input = agent_response.input_tokens
+                    turn_output = agent_response.output_tokens
                     total_latency_ms += latency_ms
 
+                total_input_tokens += turn_input
+                total_output_tokens += turn_output
+                total_tokens += turn_input + turn_output
+
                 # Check token budget
-                total_tokens = total_input_tokens + total_output_tokens
                 if total_tokens >= self.env.max_total_tokens:
                     logger.info("token_budget_exceeded", total=total_tokens)
                     break
@@ -169,9 +188,6 @@ class ScenarioRunner:
             error_message = str(e)
             logger.error("scenario_run_failed", error=str(e))
 
-        total_tokens = total_input_tokens + total_output_tokens
-        turn_count = sum(1 for t in turns if t.role == "user")
-
         logger.info(
             "scenario_run_completed",
             status=status,
@@ -191,10 +207,8 @@ class ScenarioRunner:
             error_message=error_message,
         )
 
-    async def _agent_turn(self, turns: list[Turn]) -> Any:
+    async def _agent_turn(self) -> Any:
         """Single agent LLM call."""
-        messages = self._turns_to_messages(turns)
-
         # Build tools in OpenAI format if agent has tools
         tools = None
         if self.agent.tools:
@@ -208,65 +222,94 @@ class ScenarioRunner:
 
         return await self.llm_client.chat(
             model=self.agent.model,
-            messages=messages,
+            messages=self._messages,
             system=self.agent.system_prompt,
             tools=tools,
             temperature=self.agent.temperature,
             max_tokens=self.agent.max_tokens,
         )
 
-    async def _agent_turn_with_tool_results(
-        self,
-        turns: list[Turn],
-        tool_results: list[ToolResult],
-    ) -> Any:
+    async def _agent_turn_with_tool_results(self, tool_results: list[ToolResult]) -> Any:
         """Agent follow-up call after receiving tool results."""
-        messages = self._turns_to_messages(turns)
-
-        # Append tool results as tool messages
-        for result in tool_results:
-            messages.append({
+        # Tool results stay in the history, answering the assistant's tool_calls
+        # for every later agent call too
+        self._messages.extend(
+            {
                 "role": "tool",
                 "tool_call_id": result.tool_call_id,
                 "content": result.content,
-            })
+            }
+            for result in tool_results
+        )
 
         return await self.llm_client.chat(
             model=self.agent.model,
-            messages=messages,
+            messages=self._messages,
             system=self.agent.system_prompt,
             temperature=self.agent.temperature,
             max_tokens=self.agent.max_tokens,
         )
 
     async def _handle_tool_calls(self, tool_calls: list[ToolCall]) -> list[ToolResult]:
-        """Execute all tool calls through the simulator."""
-        results = []
-        for tc in tool_calls:
-            result = await self.tool_sim.execute(tc)
-            results.append(result)
-        return results
-
-    @staticmethod
-    def _turns_to_messages(turns: list[Turn]) -> list[dict[str, Any]]:
-        """Convert internal Turn objects to LLM message format."""
-        messages: list[dict[str, Any]] = []
-        for turn in turns:
-            if turn.role == "user":
-                messages.append({"role": "user", "content": turn.content})
-            elif turn.role == "assistant":
-                msg: dict[str, Any] = {"role": "assistant", "content": turn.content}
-                if turn.tool_calls:
-                    msg["tool_calls"] = [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": tc.arguments,
-                            },
-                        }
-                        for tc in turn.tool_calls
-                    ]
-                messages.append(msg)
-        return messages
+        """Execute all tool calls through the simulator, concurrently.
+
+        Calls are independent, so the batch costs the slowest call's latency
+        rather than the sum; gather keeps results in tool_calls order.
+        """
+        return list(await asyncio.gather(*(self.tool_sim.execute(tc) for tc in tool_calls)))
+
+    def _record(self, turns: list[Turn], turn: Turn) -> None:
+        """Append a turn and its LLM message form to the running history."""
+        turns.append(turn)
+        if turn.role == "user":
+            self._messages.append({"role": "user", "content": turn.content})
+        elif turn.role == "assistant":
+            msg: dict[str, Any] = {"role": "assistant", "content": turn.content}
+            if turn.tool_calls:
+                msg["tool_calls"] = [
+                    {
+                        "id": tc.id,
+                        "type": "function",
+                        "function": {
+                            "name": tc.name,
+                            "arguments": tc.arguments,
+                        },
+                    }
+                    for tc in turn.tool_calls
+                ]
+            self._messages.append(msg)
+
+
+async def run_scenarios(
+    runners: list[ScenarioRunner],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[ConversationResult]:
+    """Run several conversations at once, at most `concurrency` in flight.
+
+    Results come back in runner order. A runner that raises yields a failed
+    result instead of cancelling the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(runner: ScenarioRunner) -> ConversationResult:
+        async with semaphore:
+            return await runner.run()
+
+    outcomes = await asyncio.gather(*(_one(r) for r in runners), return_exceptions=True)
+
+    results: list[ConversationResult] = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("scenario_batch_item_failed", index=index, error=str(outcome))
+            outcome = ConversationResult(
+                turns=[],
+                turn_count=0,
+                total_tokens=0,
+                total_input_tokens=0,
+                total_output_tokens=0,
+                total_latency_ms=0,
+                status="failed",
+                error_message=str(outcome),
+            )
+        results.append(outcome)
+    return results
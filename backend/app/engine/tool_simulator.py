@@ -29,6 +29,14 @@ DEFAULT_TOOL_RESPONSES: dict[str, str] = {
 }
 
 
+def _partial_order(responses: dict[str, str]) -> tuple[tuple[str, str], ...]:
+    """Responses for substring matching, most specific (longest) key first."""
+    return tuple(sorted(responses.items(), key=lambda kv: -len(kv[0])))
+
+
+_DEFAULT_PARTIAL = _partial_order(DEFAULT_TOOL_RESPONSES)
+
+
 class ToolSimulator:
     """Simulates tool execution with configurable behavior.
 
@@ -42,9 +50,17 @@ class ToolSimulator:
         self,
         environment: SimulationEnvironment,
         custom_responses: dict[str, str] | None = None,
+        rng: random.Random | None = None,
     ) -> None:
         self.env = environment
-        self.responses = {**DEFAULT_TOOL_RESPONSES, **(custom_responses or {})}
+        self._rng = rng or random.Random(environment.seed)
+        # Read-only after construction, so the defaults are shared rather than copied
+        if custom_responses:
+            self.responses = {**DEFAULT_TOOL_RESPONSES, **custom_responses}
+            self._partial = _partial_order(self.responses)
+        else:
+            self.responses = DEFAULT_TOOL_RESPONSES
+            self._partial = _DEFAULT_PARTIAL
 
     async def execute(self, tool_call: ToolCall) -> ToolResult:
         """Simulate a tool call, applying environment conditions."""
@@ -60,7 +76,7 @@ class ToolSimulator:
             await asyncio.sleep(self.env.tool_latency_ms / 1000.0)
 
         # Simulate failure based on failure rate
-        if self.env.tool_failure_rate > 0 and random.random() < self.env.tool_failure_rate:
+        if self.env.tool_failure_rate > 0 and self._rng.random() < self.env.tool_failure_rate:
             logger.debug("tool_simulator_injected_failure", tool_name=tool_call.name)
             return ToolResult(
                 tool_call_id=tool_call.id,
@@ -86,9 +102,9 @@ class ToolSimulator:
             return self.responses[tool_call.name]
 
         # Check for partial match (e.g., "search_docs" matches "search")
-        for key, response in self.responses.items():
-            if key in tool_call.name:
-                return response
+        response = next((r for key, r in self._partial if key in tool_call.name), None)
+        if response is not None:
+            return response
 
         # Default: return the arguments back as acknowledgment
         return json.dumps({
@@ -15,7 +15,7 @@ from typing import Any, Protocol
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """A single turn in a conversation."""
 
@@ -28,7 +28,7 @@ class Turn:
     output_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """An agent's request to call a tool."""
 
@@ -37,7 +37,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from a tool execution (real or simulated)."""
 
@@ -46,7 +46,7 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Normalized response from any LLM provider."""
 
@@ -58,7 +58,7 @@ class LLMResponse:
     stop_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationResult:
     """Complete result of a multi-turn simulation."""
 
@@ -88,6 +88,7 @@ class LLMClientProtocol(Protocol):
         tools: list[dict[str, Any]] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache: bool = False,
     ) -> LLMResponse: ...
 
 
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-import statistics
-from dataclasses import dataclass
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+# Per-value advance of the P-square desired marker positions for p = 0.5
+_P2_MEDIAN_STEPS = (0.0, 0.25, 0.5, 0.75, 1.0)
 
 
 @dataclass
@@ -18,9 +24,23 @@ class AggregatedMetric:
     max_val: float
     sample_count: int
 
+    def rounded(self, ndigits: int = 4) -> AggregatedMetric:
+        """Copy with the statistics rounded for publishing."""
+        return replace(
+            self,
+            mean=round(self.mean, ndigits),
+            median=round(self.median, ndigits),
+            std_dev=round(self.std_dev, ndigits),
+            min_val=round(self.min_val, ndigits),
+            max_val=round(self.max_val, ndigits),
+        )
+
 
 def aggregate_metric_values(name: str, values: list[float]) -> AggregatedMetric:
-    """Compute descriptive statistics for a list of metric values."""
+    """Compute descriptive statistics for a list of metric values.
+
+    Statistics are kept at full precision; use rounded() for display.
+    """
     if not values:
         return AggregatedMetric(
             metric_name=name,
@@ -32,22 +52,121 @@ def aggregate_metric_values(name: str, values: list[float]) -> AggregatedMetric:
             sample_count=0,
         )
 
-    n = len(values)
-    mean = statistics.mean(values)
-    median = statistics.median(values)
-    std_dev = statistics.stdev(values) if n >= 2 else 0.0
+    # One float64 array instead of a pass per statistic (and statistics.stdev's
+    # exact-fraction arithmetic)
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+    std_dev = float(arr.std(ddof=1)) if n >= 2 else 0.0
 
     return AggregatedMetric(
         metric_name=name,
-        mean=round(mean, 4),
-        median=round(median, 4),
-        std_dev=round(std_dev, 4),
-        min_val=round(min(values), 4),
-        max_val=round(max(values), 4),
+        mean=float(arr.mean()),
+        median=float(np.median(arr)),
+        std_dev=std_dev,
+        min_val=float(arr.min()),
+        max_val=float(arr.max()),
         sample_count=n,
     )
 
 
+class StreamingAggregator:
+    """One-pass, constant-memory counterpart of aggregate_metric_values.
+
+    Count, mean and variance are updated online (Welford), alongside min and
+    max. The median is estimated with the P-square algorithm (Jain &
+    Chlamtac, 1985) from five markers; it is exact up to five values and
+    approximate after that. Use aggregate_metric_values when an exact median
+    matters and the values fit in memory.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min_val = math.inf
+        self.max_val = -math.inf
+        # P-square markers: heights, actual positions, desired positions
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def push(self, x: float) -> None:
+        """Fold one value into the running statistics."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min_val:
+            self.min_val = x
+        if x > self.max_val:
+            self.max_val = x
+        self._push_median(x)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Push every value from an iterable, without materializing it."""
+        push = self.push
+        for x in values:
+            push(x)
+
+    def finalize(self) -> AggregatedMetric:
+        """Summary of everything pushed so far."""
+        if self.count == 0:
+            return aggregate_metric_values(self.name, [])
+        std_dev = math.sqrt(self._m2 / (self.count - 1)) if self.count >= 2 else 0.0
+        # Up to five samples the marker heights are the samples themselves
+        median = float(np.median(self._heights)) if self.count <= 5 else self._heights[2]
+        return AggregatedMetric(
+            metric_name=self.name,
+            mean=self.mean,
+            median=median,
+            std_dev=std_dev,
+            min_val=self.min_val,
+            max_val=self.max_val,
+            sample_count=self.count,
+        )
+
+    def _push_median(self, x: float) -> None:
+        q = self._heights
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        n = self._positions
+        # Cell the value falls in; the outer markers track min and max
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._desired
+        for i, step in enumerate(_P2_MEDIAN_STEPS):
+            desired[i] += step
+
+        # Nudge the three inner markers towards their desired positions
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                parabolic = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] += s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                n[i] += s
+
+
 def z_score_calibrate(scores: list[float]) -> list[float]:
     """Normalize scores to z-scores (mean=0, std=1).
 
@@ -56,13 +175,15 @@ def z_score_calibrate(scores: list[float]) -> list[float]:
     if len(scores) < 2:
         return scores
 
-    mean = statistics.mean(scores)
-    std_dev = statistics.stdev(scores)
-
-    if std_dev == 0:
+    arr = np.asarray(scores, dtype=np.float64)
+    # Compared directly: float std of equal values can come out a hair above 0
+    if arr.min() == arr.max():
         return scores
+    std_dev = float(arr.std(ddof=1))
 
-    return [round((x - mean) / std_dev, 4) for x in scores]
+    # Unrounded: rounding is left to whoever displays the values
+    calibrated: list[float] = ((arr - arr.mean()) / std_dev).tolist()
+    return calibrated
 
 
 def weighted_dimension_average(
@@ -73,6 +194,7 @@ def weighted_dimension_average(
 
     Dimensions missing from scores are ignored.
     Weights are re-normalized to sum to 1.0 over present dimensions.
+    For many conversations scored against one rubric, use WeightedAverager.
     """
     total_weight = 0.0
     weighted_sum = 0.0
@@ -86,3 +208,31 @@ def weighted_dimension_average(
         return 0.0
 
     return round(weighted_sum / total_weight, 4)
+
+
+class WeightedAverager:
+    """weighted_dimension_average with the weights prepared once.
+
+    Build one per rubric and reuse it for every conversation scored against
+    it: the weight table is walked as a tuple instead of a dict lookup per
+    scored dimension.
+    """
+
+    def __init__(self, weights: dict[str, float]) -> None:
+        # Zero weights add nothing to either sum, so they are dropped up front
+        self._items = tuple((name, w) for name, w in weights.items() if w)
+
+    def compute(self, scores: dict[str, float]) -> float:
+        """Weighted average of one conversation's dimension scores."""
+        total_weight = 0.0
+        weighted_sum = 0.0
+        for name, w in self._items:
+            score = scores.get(name)
+            if score is not None:
+                weighted_sum += score * w
+                total_weight += w
+
+        if total_weight == 0:
+            return 0.0
+
+        return round(weighted_sum / total_weight, 4)
@@ -6,9 +6,10 @@ token counts, latency measurements, and tool usage patterns.
 
 from __future__ import annotations
 
-import statistics
 from typing import Any
 
+import numpy as np
+
 from app.evaluation.types import MetricValue
 
 
@@ -47,21 +48,34 @@ class AutomatedMetricsCalculator:
             unit="ratio",
         ))
 
+        # One pass over the turns; the tool metrics only need counts
+        latency_list: list[float] = []
+        tool_call_count = 0
+        tool_result_count = 0
+        tool_error_count = 0
+        for t in turns:
+            if t.get("role") == "assistant":
+                latency_list.append(t.get("latency_ms", 0))
+            if tool_calls := t.get("tool_calls"):
+                tool_call_count += len(tool_calls)
+            if tool_results := t.get("tool_results"):
+                tool_result_count += len(tool_results)
+                tool_error_count += sum(1 for r in tool_results if r.get("is_error", False))
+
         # Latency metrics
-        assistant_turns = [t for t in turns if t.get("role") == "assistant"]
-        latencies = [t.get("latency_ms", 0) for t in assistant_turns]
+        latencies = np.asarray(latency_list, dtype=np.float64)
 
-        avg_latency = statistics.mean(latencies) if latencies else 0.0
+        avg_latency = float(latencies.mean()) if latencies.size else 0.0
         metrics.append(MetricValue(
             name="avg_latency_ms",
             value=round(avg_latency, 2),
             unit="ms",
         ))
 
-        if latencies:
-            sorted_lat = sorted(latencies)
-            p95_idx = max(0, int(len(sorted_lat) * 0.95) - 1)
-            p95_latency = sorted_lat[p95_idx]
+        if latencies.size:
+            # Only the p95 order statistic is needed: partition, don't sort
+            p95_idx = max(0, int(latencies.size * 0.95) - 1)
+            p95_latency = float(np.partition(latencies, p95_idx)[p95_idx])
         else:
             p95_latency = 0.0
         metrics.append(MetricValue(
@@ -84,23 +98,14 @@ class AutomatedMetricsCalculator:
         ))
 
         # Tool usage metrics
-        all_tool_calls: list[dict[str, Any]] = []
-        all_tool_results: list[dict[str, Any]] = []
-        for t in turns:
-            if t.get("tool_calls"):
-                all_tool_calls.extend(t["tool_calls"])
-            if t.get("tool_results"):
-                all_tool_results.extend(t["tool_results"])
-
         metrics.append(MetricValue(
             name="tool_call_count",
-            value=float(len(all_tool_calls)),
+            value=float(tool_call_count),
             unit="count",
         ))
 
-        if all_tool_results:
-            successes = sum(1 for r in all_tool_results if not r.get("is_error", False))
-            tool_success_rate = successes / len(all_tool_results)
+        if tool_result_count:
+            tool_success_rate = (tool_result_count - tool_error_count) / tool_result_count
         else:
             tool_success_rate = 1.0  # No tools called = no failures
         metrics.append(MetricValue(
@@ -9,6 +9,9 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+
 
 @dataclass
 class CalibrationMetrics:
@@ -43,36 +46,53 @@ def calibration_metrics(
     if n < 2:
         raise ValueError(f"Need at least 2 paired observations, got {n}")
 
-    mae = sum(abs(h - m) for h, m in zip(human_scores, model_scores)) / n
-    rmse = math.sqrt(sum((h - m) ** 2 for h, m in zip(human_scores, model_scores)) / n)
-    bias = sum(m - h for h, m in zip(human_scores, model_scores)) / n
+    # Converted once; the error terms and both correlations share these arrays
+    h = np.asarray(human_scores, dtype=np.float64)
+    m = np.asarray(model_scores, dtype=np.float64)
+    diff = m - h
 
     return CalibrationMetrics(
-        pearson_r=round(pearson_r(human_scores, model_scores), 4),
-        spearman_rho=round(spearman_rho(human_scores, model_scores), 4),
-        mae=round(mae, 4),
-        rmse=round(rmse, 4),
-        bias=round(bias, 4),
+        pearson_r=round(pearson_r(h, m), 4),
+        spearman_rho=round(spearman_rho(h, m), 4),
+        mae=round(float(np.abs(diff).mean()), 4),
+        rmse=round(math.sqrt(float(diff @ diff) / n), 4),
+        bias=round(float(diff.mean()), 4),
         n=n,
     )
 
 
-def pearson_r(x: list[float], y: list[float]) -> float:
-    """Pearson correlation coefficient — pure Python."""
-    n = len(x)
-    if n < 2:
+def pearson_r(x: npt.ArrayLike, y: npt.ArrayLike, exact: bool = False) -> float:
+    """Pearson correlation coefficient.
+
+    Centres both series once; covariance and both sums of squares are then
+    dot products.  BLAS accumulates those in blocks, which is accurate
+    enough for score data.  With exact=True the means and sums go through
+    math.fsum instead (correctly rounded, several times slower), for
+    reference values in tests or very long series with near-zero mean.
+    """
+    xa = np.asarray(x, dtype=np.float64)
+    ya = np.asarray(y, dtype=np.float64)
+    if xa.size < 2:
         return 0.0
-    mx = sum(x) / n
-    my = sum(y) / n
-    cov = sum((xi - mx) * (yi - my) for xi, yi in zip(x, y))
-    sx = math.sqrt(sum((xi - mx) ** 2 for xi in x))
-    sy = math.sqrt(sum((yi - my) ** 2 for yi in y))
+    if exact:
+        n = xa.size
+        dx = xa - math.fsum(xa.tolist()) / n
+        dy = ya - math.fsum(ya.tolist()) / n
+        cov = math.fsum((dx * dy).tolist())
+        sx = math.sqrt(math.fsum((dx * dx).tolist()))
+        sy = math.sqrt(math.fsum((dy * dy).tolist()))
+    else:
+        dx = xa - xa.mean()
+        dy = ya - ya.mean()
+        cov = float(dx @ dy)
+        sx = math.sqrt(float(dx @ dx))
+        sy = math.sqrt(float(dy @ dy))
     if sx == 0 or sy == 0:
         return 0.0
     return cov / (sx * sy)
 
 
-def spearman_rho(x: list[float], y: list[float]) -> float:
+def spearman_rho(x: npt.ArrayLike, y: npt.ArrayLike) -> float:
     """Spearman rank correlation — converts to ranks then uses Pearson."""
     return pearson_r(_to_ranks(x), _to_ranks(y))
 
@@ -90,35 +110,36 @@ def calibration_curve(
     if not human_scores or not model_scores:
         return []
 
-    min_score = min(model_scores)
-    max_score = max(model_scores)
+    h = np.asarray(human_scores, dtype=np.float64)
+    m = np.asarray(model_scores, dtype=np.float64)
+    min_score = float(m.min())
+    max_score = float(m.max())
 
     if max_score == min_score:
         return [CalibrationBin(
             bin_center=round(min_score, 2),
-            avg_human=round(sum(human_scores) / len(human_scores), 4),
+            avg_human=round(float(h.sum()) / h.size, 4),
             avg_model=round(min_score, 4),
-            count=len(human_scores),
+            count=h.size,
         )]
 
     bin_width = (max_score - min_score) / num_bins
-    bins: dict[int, list[tuple[float, float]]] = {}
+    idx = np.minimum(((m - min_score) / bin_width).astype(np.int64), num_bins - 1)
 
-    for h, m in zip(human_scores, model_scores):
-        idx = min(int((m - min_score) / bin_width), num_bins - 1)
-        bins.setdefault(idx, []).append((h, m))
+    # Per-bin sums and counts in three C-level passes
+    sum_h = np.bincount(idx, weights=h, minlength=num_bins)
+    sum_m = np.bincount(idx, weights=m, minlength=num_bins)
+    counts = np.bincount(idx, minlength=num_bins)
 
     result = []
-    for idx in sorted(bins.keys()):
-        pairs = bins[idx]
-        center = min_score + (idx + 0.5) * bin_width
-        avg_h = sum(p[0] for p in pairs) / len(pairs)
-        avg_m = sum(p[1] for p in pairs) / len(pairs)
+    for i in np.flatnonzero(counts).tolist():
+        count = int(counts[i])
+        center = min_score + (i + 0.5) * bin_width
         result.append(CalibrationBin(
             bin_center=round(center, 2),
-            avg_human=round(avg_h, 4),
-            avg_model=round(avg_m, 4),
-            count=len(pairs),
+            avg_human=round(float(sum_h[i]) / count, 4),
+            avg_model=round(float(sum_m[i]) / count, 4),
+            count=count,
         ))
 
     return result
@@ -129,20 +150,21 @@ def calibration_curve(
 # ------------------------------------------------------------------
 
 
-def _to_ranks(values: list[float]) -> list[float]:
-    """Convert values to average ranks (handles ties)."""
-    n = len(values)
-    indexed = sorted(enumerate(values), key=lambda x: x[1])
-    ranks = [0.0] * n
+def _to_ranks(values: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Convert values to average ranks (handles ties).
+
+    A run of equal values occupying sorted positions i..j (0-based) all get
+    rank (i + j) / 2 + 1.
+    """
+    v = np.asarray(values, dtype=np.float64)
+    n = v.size
+    order = np.argsort(v, kind="stable")
+    sorted_v = v[order]
 
-    i = 0
-    while i < n:
-        j = i
-        while j < n - 1 and indexed[j + 1][1] == indexed[i][1]:
-            j += 1
-        avg_rank = (i + j) / 2.0 + 1.0  # 1-based
-        for k in range(i, j + 1):
-            ranks[indexed[k][0]] = avg_rank
-        i = j + 1
+    # Start of each run of equal values in sorted order, and the run lengths
+    starts = np.flatnonzero(np.concatenate(([True], sorted_v[1:] != sorted_v[:-1])))
+    counts = np.diff(np.append(starts, n))
 
+    ranks = np.empty(n, dtype=np.float64)
+    ranks[order] = np.repeat(starts + (counts + 1) / 2.0, counts)
     return ranks
@@ -0,0 +1,73 @@
+"""Longest common subsequence length over token lists.
+
+Pure math module, shared by the reference-based (ROUGE-L) and trajectory
+(tool-call order) evaluators.  Long inputs run on NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# The NumPy LCS costs a roughly fixed amount per anti-diagonal (m + n of them),
+# the Python one per cell (m * n); NumPy wins once cells outnumber diagonals
+# by about this factor (~32 tokens a side)
+_VECTOR_LCS_CELLS_PER_DIAGONAL = 16
+
+
+def lcs_length(a: list[str], e: list[str]) -> int:
+    """Length of the longest common subsequence of two token lists.
+
+    Short inputs run the row-by-row DP in Python; long ones the NumPy sweep.
+    """
+    m, n = len(a), len(e)
+    if m * n < _VECTOR_LCS_CELLS_PER_DIAGONAL * (m + n):
+        return _lcs_length_python(a, e)
+    return _lcs_length_numpy(a, e)
+
+
+def _lcs_length_python(a: list[str], e: list[str]) -> int:
+    """Row-by-row DP, keeping only the previous row."""
+    # The cell loop is pure interpreter work, so max is bound as a local
+    _max = max
+    prev = [0] * (len(e) + 1)
+    for token in a:
+        curr = [0] * (len(e) + 1)
+        for j, other in enumerate(e, 1):
+            if token == other:
+                curr[j] = prev[j - 1] + 1
+            else:
+                curr[j] = _max(prev[j], curr[j - 1])
+        prev = curr
+    return prev[-1]
+
+
+def _lcs_length_numpy(a: list[str], e: list[str]) -> int:
+    """The same DP swept one anti-diagonal at a time.
+
+    Cells on an anti-diagonal (i + j == d) depend only on the two previous
+    diagonals, so each diagonal is one vectorised step. Diagonals are
+    indexed by i, the row in the shorter sequence; cells with i == 0 or
+    j == 0 are the DP's zero border.
+    """
+    if len(a) > len(e):
+        a, e = e, a
+    m, n = len(a), len(e)
+
+    # Tokens as small ints; tokens only in e can never match
+    ids: dict[str, int] = {}
+    a_ids = np.fromiter((ids.setdefault(t, len(ids)) for t in a), dtype=np.int32, count=m)
+    e_ids = np.fromiter((ids.get(t, -1) for t in e), dtype=np.int32, count=n)
+    # Column-flipped, so each anti-diagonal of the match matrix is a .diagonal() view
+    anti_eq = (a_ids[:, None] == e_ids[None, :])[:, ::-1]
+
+    # Three rotating rows, written in place: the slots a diagonal reads outside
+    # the previous ones' [lo, hi] span are border cells no diagonal ever writes
+    prev2, prev, curr = np.zeros((3, m + 1), dtype=np.int32)
+    for d in range(2, m + n + 1):
+        lo = max(1, d - n)
+        hi = min(m, d - 1)
+        out = curr[lo:hi + 1]
+        np.maximum(prev[lo - 1:hi], prev[lo:hi + 1], out=out)  # max((i-1, j), (i, j-1))
+        np.copyto(out, prev2[lo - 1:hi] + 1, where=anti_eq.diagonal(n + 1 - d))  # (i-1, j-1) + 1
+        prev2, prev, curr = prev, curr, prev2
+    return int(prev[m])
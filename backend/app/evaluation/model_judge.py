@@ -7,8 +7,10 @@ Falls back to content parsing if the model doesn't return a tool call.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -19,6 +21,19 @@ from app.evaluation.types import EvaluationResult, RubricDimension
 
 logger = structlog.get_logger()
 
+# Judge calls evaluate_batch keeps in flight unless told otherwise
+DEFAULT_CONCURRENCY = 10
+
+# Everything the prompt and tool are built from; equal rubrics share cache entries
+_DimensionsKey = tuple[tuple[str, str, float, tuple[str, ...]], ...]
+
+# Transcript labels for the usual roles; anything else is upper-cased on the fly
+_ROLE_LABELS = {"user": "USER", "assistant": "ASSISTANT", "system": "SYSTEM", "tool": "TOOL"}
+
+# Same output as json.dumps() with default arguments, without its per-call
+# keyword dispatch
+_encode_json = json.JSONEncoder().encode
+
 
 class ModelJudgeEvaluator:
     """Evaluates conversations using an LLM as a judge."""
@@ -38,97 +53,88 @@ class ModelJudgeEvaluator:
     ) -> EvaluationResult:
         """Evaluate a conversation transcript against rubric dimensions."""
         system_prompt = self._build_system_prompt(rubric_dimensions)
-        messages = self._build_messages(conversation_turns)
         tools = [self._build_scoring_tool(rubric_dimensions)]
+        return await self._judge(conversation_turns, rubric_dimensions, system_prompt, tools)
+
+    async def evaluate_batch(
+        self,
+        conversations: list[list[dict[str, Any]]],
+        rubric_dimensions: list[RubricDimension],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[EvaluationResult | BaseException]:
+        """Evaluate several transcripts against one rubric, concurrently.
+
+        At most `concurrency` judge calls are in flight. Results come back in
+        input order; a conversation whose judge call fails yields its exception
+        instead of cancelling the rest.
+        """
+        system_prompt = self._build_system_prompt(rubric_dimensions)
+        tools = [self._build_scoring_tool(rubric_dimensions)]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(turns: list[dict[str, Any]]) -> EvaluationResult:
+            async with semaphore:
+                return await self._judge(turns, rubric_dimensions, system_prompt, tools)
 
+        return await asyncio.gather(*(_one(t) for t in conversations), return_exceptions=True)
+
+    async def _judge(
+        self,
+        conversation_turns: list[dict[str, Any]],
+        rubric_dimensions: list[RubricDimension],
+        system_prompt: str,
+        tools: list[dict[str, Any]],
+    ) -> EvaluationResult:
+        """One judge call with a prompt and tool already built for the rubric."""
         response = await self.llm_client.chat(
             model=self.model,
-            messages=messages,
+            messages=self._build_messages(conversation_turns),
             system=system_prompt,
             tools=tools,
             temperature=0.1,  # Low temperature for consistent evaluation
             max_tokens=2048,
+            cache=True,
         )
 
         return self._parse_response(response, rubric_dimensions)
 
     def _build_system_prompt(self, dimensions: list[RubricDimension]) -> str:
         """Build the system prompt that instructs the judge."""
-        dimension_text = "\n".join(
-            f"- **{d.name}** (weight={d.weight}): {d.description}\n"
-            f"  Criteria: {', '.join(d.criteria)}"
-            for d in dimensions
-        )
-
-        return (
-            "You are an expert conversation evaluator. Your task is to evaluate "
-            "an AI assistant's performance in a multi-turn conversation.\n\n"
-            "Score each dimension on a 0-10 scale:\n"
-            "  0-2: Very poor\n"
-            "  3-4: Below average\n"
-            "  5-6: Average\n"
-            "  7-8: Good\n"
-            "  9-10: Excellent\n\n"
-            f"Dimensions to evaluate:\n{dimension_text}\n\n"
-            "Use the submit_evaluation tool to report your scores. "
-            "Provide a brief reasoning for each score."
-        )
+        return _system_prompt(_dimensions_key(dimensions))
 
     def _build_messages(self, turns: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Format conversation turns as a transcript for the judge."""
         lines: list[str] = ["## Conversation Transcript\n"]
+        append = lines.append
         for i, turn in enumerate(turns):
-            role = turn.get("role", "unknown").upper()
-            content = turn.get("content", "")
-            lines.append(f"[Turn {i}] {role}: {content}")
-
-            if turn.get("tool_calls"):
-                for tc in turn["tool_calls"]:
+            get = turn.get
+            role = get("role", "unknown")
+            label = _ROLE_LABELS.get(role) or role.upper()
+            append(f"[Turn {i}] {label}: {get('content', '')}")
+
+            tool_calls = get("tool_calls")
+            if tool_calls:
+                for tc in tool_calls:
                     name = tc.get("name", "unknown")
-                    args = tc.get("arguments", {})
-                    lines.append(f"  → TOOL_CALL: {name}({json.dumps(args)})")
+                    args = _encode_json(tc.get("arguments", {}))
+                    append(f"  → TOOL_CALL: {name}({args})")
 
-            if turn.get("tool_results"):
-                for tr in turn["tool_results"]:
-                    result_content = tr.get("content", "")
-                    is_error = tr.get("is_error", False)
-                    status = "ERROR" if is_error else "OK"
-                    lines.append(f"  ← TOOL_RESULT [{status}]: {result_content[:200]}")
+            tool_results = get("tool_results")
+            if tool_results:
+                for tr in tool_results:
+                    status = "ERROR" if tr.get("is_error", False) else "OK"
+                    append(f"  ← TOOL_RESULT [{status}]: {tr.get('content', '')[:200]}")
 
         return [{"role": "user", "content": "\n".join(lines)}]
 
     def _build_scoring_tool(
         self, dimensions: list[RubricDimension],
     ) -> dict[str, Any]:
-        """Build an OpenAI-format tool definition for structured scoring output."""
-        properties: dict[str, Any] = {}
-        required: list[str] = []
+        """Build an OpenAI-format tool definition for structured scoring output.
 
-        for dim in dimensions:
-            properties[f"{dim.name}_score"] = {
-                "type": "number",
-                "description": f"Score for {dim.name} (0-10): {dim.description}",
-                "minimum": 0,
-                "maximum": 10,
-            }
-            properties[f"{dim.name}_reasoning"] = {
-                "type": "string",
-                "description": f"Brief reasoning for {dim.name} score",
-            }
-            required.extend([f"{dim.name}_score", f"{dim.name}_reasoning"])
-
-        return {
-            "type": "function",
-            "function": {
-                "name": "submit_evaluation",
-                "description": "Submit evaluation scores for all dimensions",
-                "parameters": {
-                    "type": "object",
-                    "properties": properties,
-                    "required": required,
-                },
-            },
-        }
+        The dict is cached and shared across evaluations; treat it as read-only.
+        """
+        return _scoring_tool(_dimensions_key(dimensions))
 
     def _parse_response(
         self,
@@ -185,13 +191,19 @@ class ModelJudgeEvaluator:
         """Try to extract scores from free-text content."""
         scores: dict[str, float] = {}
         reasoning: list[str] = []
+        if not dimensions:
+            return scores, reasoning
+
+        # One scan for every dimension; the first mention of each name wins
+        pattern = _fallback_pattern(tuple(d.name for d in dimensions))
+        found: dict[str, str] = {}
+        for match in pattern.finditer(content):
+            found.setdefault(match.group(1).lower(), match.group(2))
 
         for dim in dimensions:
-            # Look for patterns like "helpfulness: 7" or "helpfulness: 7/10"
-            pattern = rf"(?i){re.escape(dim.name)}\s*[:=]\s*(\d+(?:\.\d+)?)"
-            match = re.search(pattern, content)
-            if match:
-                score = min(10.0, max(0.0, float(match.group(1))))
+            raw = found.get(dim.name.lower())
+            if raw is not None:
+                score = min(10.0, max(0.0, float(raw)))
                 scores[dim.name] = score
                 reasoning.append(f"{dim.name}: {score:.1f}/10 — parsed from content")
 
@@ -215,3 +227,79 @@ class ModelJudgeEvaluator:
             return 0.0
 
         return round(weighted_sum / total_weight, 2)
+
+
+# ------------------------------------------------------------------
+# Rubric-derived prompt pieces, built once per distinct rubric
+# ------------------------------------------------------------------
+
+
+def _dimensions_key(dimensions: list[RubricDimension]) -> _DimensionsKey:
+    return tuple((d.name, d.description, d.weight, tuple(d.criteria)) for d in dimensions)
+
+
+@lru_cache(maxsize=128)
+def _system_prompt(key: _DimensionsKey) -> str:
+    dimension_text = "\n".join(
+        f"- **{name}** (weight={weight}): {description}\n"
+        f"  Criteria: {', '.join(criteria)}"
+        for name, description, weight, criteria in key
+    )
+
+    return (
+        "You are an expert conversation evaluator. Your task is to evaluate "
+        "an AI assistant's performance in a multi-turn conversation.\n\n"
+        "Score each dimension on a 0-10 scale:\n"
+        "  0-2: Very poor\n"
+        "  3-4: Below average\n"
+        "  5-6: Average\n"
+        "  7-8: Good\n"
+        "  9-10: Excellent\n\n"
+        f"Dimensions to evaluate:\n{dimension_text}\n\n"
+        "Use the submit_evaluation tool to report your scores. "
+        "Provide a brief reasoning for each score."
+    )
+
+
+@lru_cache(maxsize=128)
+def _scoring_tool(key: _DimensionsKey) -> dict[str, Any]:
+    properties: dict[str, Any] = {}
+    required: list[str] = []
+
+    for name, description, _, _ in key:
+        properties[f"{name}_score"] = {
+            "type": "number",
+            "description": f"Score for {name} (0-10): {description}",
+            "minimum": 0,
+            "maximum": 10,
+        }
+        properties[f"{name}_reasoning"] = {
+            "type": "string",
+            "description": f"Brief reasoning for {name} score",
+        }
+        required.extend([f"{name}_score", f"{name}_reasoning"])
+
+    return {
+        "type": "function",
+        "function": {
+            "name": "submit_evaluation",
+            "description": "Submit evaluation scores for all dimensions",
+            "parameters": {
+                "type": "object",
+                "properties": properties,
+                "required": required,
+            },
+        },
+    }
+
+
+@lru_cache(maxsize=128)
+def _fallback_pattern(names: tuple[str, ...]) -> re.Pattern[str]:
+    """Matches "name: 7" / "name = 7.5" for any of the names, case-insensitively.
+
+    The lookahead consumes nothing, so a name inside a longer one
+    ("accuracy" in "factual_accuracy: 8") is still found, as it was when
+    each dimension was searched separately.
+    """
+    alternation = "|".join(re.escape(name) for name in names)
+    return re.compile(rf"(?i)(?=({alternation})\s*[:=]\s*(\d+(?:\.\d+)?))")
@@ -7,11 +7,12 @@ Randomly swaps A/B position to mitigate position bias.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import random
 from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 import structlog
 from uuid_extensions import uuid7
 
@@ -75,6 +76,7 @@ class PairwiseJudgeEvaluator:
             tools=tools,
             temperature=0.1,
             max_tokens=2048,
+            cache=True,
         )
 
         result = self._parse_comparison_response(response, rubric_dimensions)
@@ -89,6 +91,59 @@ class PairwiseJudgeEvaluator:
 
         return result
 
+    async def compare_batch(
+        self,
+        pairs: list[tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+        rubric_dimensions: list[RubricDimension],
+        batch_size: int = 5,
+    ) -> list[PairwiseResult]:
+        """Compare many (turns_a, turns_b) pairs, packing batch_size pairs per LLM call.
+
+        Each pair is swapped independently, as in compare(). Results come back
+        in input order; a pair the judge skipped is scored as a low-confidence draw.
+        """
+        chunks = [pairs[i:i + batch_size] for i in range(0, len(pairs), batch_size)]
+        chunk_results = await asyncio.gather(
+            *(self._compare_chunk(chunk, rubric_dimensions) for chunk in chunks)
+        )
+        return [result for results in chunk_results for result in results]
+
+    async def _compare_chunk(
+        self,
+        pairs: list[tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+        rubric_dimensions: list[RubricDimension],
+    ) -> list[PairwiseResult]:
+        """Judge one packed prompt of pairs and de-shuffle each verdict."""
+        swaps = [random.choice([True, False]) for _ in pairs]
+        presented = [
+            (turns_b, turns_a) if swapped else (turns_a, turns_b)
+            for (turns_a, turns_b), swapped in zip(pairs, swaps, strict=True)
+        ]
+
+        system_prompt, messages = self._build_batch_prompt(presented, rubric_dimensions)
+        tools = [self._build_batch_tool(rubric_dimensions)]
+
+        response = await self.llm_client.chat(
+            model=self.model,
+            messages=messages,
+            system=system_prompt,
+            tools=tools,
+            temperature=0.1,
+            max_tokens=2048 * len(pairs),
+            cache=True,
+        )
+
+        results = self._parse_batch_response(response, rubric_dimensions, len(pairs))
+        for result, swapped in zip(results, swaps, strict=True):
+            if swapped:
+                self._unswap(result)
+            result.match_id = str(uuid7())
+            result.metadata["model"] = self.model
+            result.metadata["swapped"] = swapped
+            result.metadata["batch_size"] = len(pairs)
+
+        return results
+
     # ------------------------------------------------------------------
     # Builders
     # ------------------------------------------------------------------
@@ -171,6 +226,79 @@ class PairwiseJudgeEvaluator:
             },
         }
 
+    def _build_batch_prompt(
+        self,
+        pairs: list[tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+        dimensions: list[RubricDimension],
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Build system prompt and messages for several numbered comparisons."""
+        dim_text = "\n".join(
+            f"- **{d.name}** (weight={d.weight}): {d.description}"
+            for d in dimensions
+        )
+
+        system = (
+            "You are an expert evaluator comparing pairs of AI assistants. "
+            f"You will see {len(pairs)} numbered pairs of conversations, each with "
+            "an Agent A and an Agent B responding to the same scenario. "
+            "Judge every pair independently.\n\n"
+            "For each dimension, state your preference (a, b, or draw). "
+            "Then give an overall winner.\n\n"
+            f"Dimensions:\n{dim_text}\n\n"
+            "Use the submit_comparisons tool to report one judgment per pair."
+        )
+
+        # A conversation in several pairs (round-robin batches) is rendered once;
+        # `pairs` keeps every turn list alive, so id() is a safe key here
+        bodies: dict[int, str] = {}
+
+        def body(turns: list[dict[str, Any]]) -> str:
+            rendered = bodies.get(id(turns))
+            if rendered is None:
+                rendered = bodies[id(turns)] = self._transcript_body(turns)
+            return rendered
+
+        sections = [
+            f"# Pair {i}\n\n"
+            f"{_labeled('Agent A', body(turns_a))}\n\n---\n\n"
+            f"{_labeled('Agent B', body(turns_b))}"
+            for i, (turns_a, turns_b) in enumerate(pairs, start=1)
+        ]
+
+        messages = [{
+            "role": "user",
+            "content": "\n\n===\n\n".join(sections),
+        }]
+
+        return system, messages
+
+    def _build_batch_tool(
+        self,
+        dimensions: list[RubricDimension],
+    ) -> dict[str, Any]:
+        """Build tool schema for an array of comparisons keyed by pair number."""
+        item = self._build_comparison_tool(dimensions)["function"]["parameters"]
+        item["properties"] = {
+            "pair": {"type": "integer", "minimum": 1, "description": "Pair number"},
+            **item["properties"],
+        }
+        item["required"] = ["pair", *item["required"]]
+
+        return {
+            "type": "function",
+            "function": {
+                "name": "submit_comparisons",
+                "description": "Submit one pairwise comparison judgment per pair",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "comparisons": {"type": "array", "items": item},
+                    },
+                    "required": ["comparisons"],
+                },
+            },
+        }
+
     # ------------------------------------------------------------------
     # Parsers
     # ------------------------------------------------------------------
@@ -211,6 +339,45 @@ class PairwiseJudgeEvaluator:
             confidence=confidence,
         )
 
+    def _parse_batch_response(
+        self,
+        response: Any,
+        dimensions: list[RubricDimension],
+        n_pairs: int,
+    ) -> list[PairwiseResult]:
+        """Parse a submit_comparisons call into one PairwiseResult per pair, in order."""
+        by_pair: dict[int, dict[str, Any]] = {}
+        for tc in response.tool_calls or []:
+            if tc.name == "submit_comparisons":
+                for entry in tc.arguments.get("comparisons", []):
+                    try:
+                        by_pair.setdefault(int(entry["pair"]), entry)
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                break
+
+        results = []
+        for i in range(1, n_pairs + 1):
+            args = by_pair.get(i, {})
+            try:
+                confidence = min(1.0, max(0.0, float(args.get("confidence", 0.5))))
+            except (TypeError, ValueError):
+                confidence = 0.5
+            results.append(PairwiseResult(
+                match_id="",  # Will be set by caller
+                winner=args.get("winner", "draw"),
+                reasoning=args.get("reasoning", ""),
+                dimension_preferences={
+                    dim.name: args.get(f"{dim.name}_preference", "draw") for dim in dimensions
+                },
+                confidence=confidence,
+            ))
+
+        if len(by_pair) < n_pairs:
+            logger.warning("pairwise_batch_incomplete", expected=n_pairs, received=len(by_pair))
+
+        return results
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -218,22 +385,28 @@ class PairwiseJudgeEvaluator:
     @staticmethod
     def _format_transcript(turns: list[dict[str, Any]], label: str) -> str:
         """Format conversation turns as a labeled transcript."""
-        lines = [f"## {label}\n"]
+        return _labeled(label, PairwiseJudgeEvaluator._transcript_body(turns))
+
+    @staticmethod
+    def _transcript_body(turns: list[dict[str, Any]]) -> str:
+        """Transcript lines for the turns, without the label heading."""
+        lines: list[str] = []
+        append = lines.append
         for i, turn in enumerate(turns):
             role = turn.get("role", "unknown").upper()
-            content = turn.get("content", "")
-            lines.append(f"[Turn {i}] {role}: {content}")
+            append(f"[Turn {i}] {role}: {turn.get('content', '')}")
 
             if turn.get("tool_calls"):
                 for tc in turn["tool_calls"]:
-                    name = tc.get("name", "unknown")
-                    args = tc.get("arguments", {})
-                    lines.append(f"  → TOOL_CALL: {name}({json.dumps(args)})")
+                    # Compact orjson rather than json.dumps: several times faster,
+                    # and the judge reads the arguments either way
+                    args = orjson.dumps(tc.get("arguments", {})).decode()
+                    append(f"  → TOOL_CALL: {tc.get('name', 'unknown')}({args})")
 
             if turn.get("tool_results"):
                 for tr in turn["tool_results"]:
                     status = "ERROR" if tr.get("is_error") else "OK"
-                    lines.append(f"  ← TOOL_RESULT [{status}]: {tr.get('content', '')[:200]}")
+                    append(f"  ← TOOL_RESULT [{status}]: {tr.get('content', '')[:200]}")
 
         return "\n".join(lines)
 
@@ -246,3 +419,8 @@ class PairwiseJudgeEvaluator:
             k: flip.get(v, v) for k, v in result.dimension_preferences.items()
         }
         return result
+
+
+def _labeled(label: str, body: str) -> str:
+    """Put the agent heading above a transcript body (empty for no turns)."""
+    return f"## {label}\n\n{body}" if body else f"## {label}\n"
@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from app.evaluation.lcs import lcs_length
 from app.evaluation.types import EvaluationResult, RubricDimension
 
 
@@ -32,9 +33,12 @@ class ReferenceEvaluator:
 
         overlaps, lcs_ratios, exacts = [], [], []
         for actual, expected in pairs:
-            overlaps.append(self._token_overlap(actual, expected))
-            lcs_ratios.append(self._lcs_ratio(actual, expected))
-            exacts.append(self._exact_match(actual, expected))
+            # Tokenized once per pair; all three metrics work from the tokens
+            a_tokens = self._tokenize(actual)
+            e_tokens = self._tokenize(expected)
+            overlaps.append(self._token_overlap_tokens(a_tokens, e_tokens))
+            lcs_ratios.append(self._lcs_ratio_tokens(a_tokens, e_tokens))
+            exacts.append(1.0 if a_tokens == e_tokens else 0.0)
 
         avg_overlap = sum(overlaps) / len(overlaps)
         avg_lcs = sum(lcs_ratios) / len(lcs_ratios)
@@ -87,13 +91,21 @@ class ReferenceEvaluator:
 
     @staticmethod
     def _tokenize(text: str) -> list[str]:
-        return ReferenceEvaluator._normalize(text).split()
+        # str.split() already splits on runs of whitespace and drops the ends,
+        # so this is _normalize(text).split() without the regex pass
+        return text.lower().split()
 
     @staticmethod
     def _token_overlap(actual: str, expected: str) -> float:
         """ROUGE-1 F1 approximation (unigram set overlap)."""
-        actual_tokens = set(ReferenceEvaluator._tokenize(actual))
-        expected_tokens = set(ReferenceEvaluator._tokenize(expected))
+        return ReferenceEvaluator._token_overlap_tokens(
+            ReferenceEvaluator._tokenize(actual), ReferenceEvaluator._tokenize(expected),
+        )
+
+    @staticmethod
+    def _token_overlap_tokens(a_tokens: list[str], e_tokens: list[str]) -> float:
+        actual_tokens = set(a_tokens)
+        expected_tokens = set(e_tokens)
 
         if not actual_tokens or not expected_tokens:
             return 0.0
@@ -109,24 +121,16 @@ class ReferenceEvaluator:
     @staticmethod
     def _lcs_ratio(actual: str, expected: str) -> float:
         """ROUGE-L approximation via longest common subsequence of tokens."""
-        a_tokens = ReferenceEvaluator._tokenize(actual)
-        e_tokens = ReferenceEvaluator._tokenize(expected)
+        return ReferenceEvaluator._lcs_ratio_tokens(
+            ReferenceEvaluator._tokenize(actual), ReferenceEvaluator._tokenize(expected),
+        )
 
+    @staticmethod
+    def _lcs_ratio_tokens(a_tokens: list[str], e_tokens: list[str]) -> float:
         if not a_tokens or not e_tokens:
             return 0.0
 
-        m, n = len(a_tokens), len(e_tokens)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if a_tokens[i - 1] == e_tokens[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-
-        lcs_len = dp[m][n]
-        return lcs_len / max(m, n)
+        return lcs_length(a_tokens, e_tokens) / max(len(a_tokens), len(e_tokens))
 
     @staticmethod
     def _exact_match(actual: str, expected: str) -> float:
@@ -1,15 +1,17 @@
 """Interrater reliability — Krippendorff's alpha for interval data.
 
 Pure math module.  Measures agreement among multiple human evaluators
-scoring the same conversations.
+scoring the same conversations.  Alphas are computed with NumPy.
 """
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass, field
 from itertools import combinations
 
+import numpy as np
+import numpy.typing as npt
+
 
 @dataclass
 class ReliabilityResult:
@@ -43,38 +45,14 @@ def krippendorffs_alpha(
     if not ratings_matrix:
         return 0.0
 
-    # Collect observed pairs within items
-    observed_diffs_sq: list[float] = []
-    all_values: list[float] = []
-
-    for row in ratings_matrix:
-        values = [v for v in row if v is not None]
-        all_values.extend(values)
-        if len(values) < 2:
-            continue
-        for a, b in combinations(values, 2):
-            observed_diffs_sq.append((a - b) ** 2)
-
-    if not observed_diffs_sq or len(all_values) < 2:
-        return 0.0
-
-    # Observed disagreement
-    d_o = sum(observed_diffs_sq) / len(observed_diffs_sq)
-
-    # Expected disagreement: all possible pairs across the entire dataset
-    expected_diffs_sq: list[float] = []
-    for a, b in combinations(all_values, 2):
-        expected_diffs_sq.append((a - b) ** 2)
-
-    if not expected_diffs_sq:
+    # Ragged rows are padded; NaN marks a missing rating
+    width = max(len(row) for row in ratings_matrix)
+    if width == 0:
         return 0.0
-
-    d_e = sum(expected_diffs_sq) / len(expected_diffs_sq)
-
-    if d_e == 0:
-        return 1.0  # No variance → perfect agreement
-
-    return round(1.0 - d_o / d_e, 4)
+    ratings = np.full((len(ratings_matrix), width, 1), np.nan)
+    for i, row in enumerate(ratings_matrix):
+        ratings[i, : len(row), 0] = [np.nan if v is None else v for v in row]
+    return _alpha_per_column(ratings)[0]
 
 
 def compute_reliability(
@@ -97,46 +75,71 @@ def compute_reliability(
     if max_raters < 2:
         return ReliabilityResult(alpha=0.0, num_items=len(conv_ids), num_raters=max_raters)
 
-    # Overall alpha: use overall_score if present, else average across dimensions
-    overall_matrix: list[list[float | None]] = []
-    for cid in conv_ids:
-        evals = evaluations_by_conversation[cid]
-        row: list[float | None] = []
-        for i in range(max_raters):
-            if i < len(evals):
-                scores = evals[i]
-                # Use mean of all dimensions as overall
-                vals = [scores.get(d, 0.0) for d in dimensions if d in scores]
-                row.append(sum(vals) / len(vals) if vals else None)
-            else:
-                row.append(None)
-        overall_matrix.append(row)
-
-    overall_alpha = krippendorffs_alpha(overall_matrix)
-
-    # Per-dimension alpha
-    per_dim: dict[str, float] = {}
-    for dim in dimensions:
-        dim_matrix: list[list[float | None]] = []
-        for cid in conv_ids:
-            evals = evaluations_by_conversation[cid]
-            row: list[float | None] = []
-            for i in range(max_raters):
-                if i < len(evals) and dim in evals[i]:
-                    row.append(evals[i][dim])
-                else:
-                    row.append(None)
-            dim_matrix.append(row)
-        per_dim[dim] = krippendorffs_alpha(dim_matrix)
+    # items x raters x dimensions, NaN where a rater skipped an item or dimension
+    scores = np.full((len(conv_ids), max_raters, len(dimensions)), np.nan)
+    for i, cid in enumerate(conv_ids):
+        for r, evals in enumerate(evaluations_by_conversation[cid]):
+            scores[i, r] = [evals.get(d, np.nan) for d in dimensions]
+
+    # Overall: each rating is the mean of the dimensions its rater scored
+    rated = ~np.isnan(scores)
+    counts = rated.sum(axis=2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        overall = np.where(rated, scores, 0.0).sum(axis=2) / counts
+
+    # The overall matrix rides along as column 0; every alpha in one pass
+    alphas = _alpha_per_column(np.concatenate((overall[:, :, None], scores), axis=2))
 
     return ReliabilityResult(
-        alpha=overall_alpha,
+        alpha=alphas[0],
         num_items=len(conv_ids),
         num_raters=max_raters,
-        per_dimension_alpha=per_dim,
+        per_dimension_alpha=dict(zip(dimensions, alphas[1:])),
     )
 
 
+def _alpha_per_column(ratings: npt.NDArray[np.float64]) -> list[float]:
+    """krippendorffs_alpha for each ratings[:, :, c] matrix (NaN = missing).
+
+    Pairs are never enumerated: over the C(k, 2) pairs of k values,
+    sum((a - b)^2) = k * sum((x - mean)^2), so both disagreements are
+    linear in the number of ratings.
+    """
+    valid = ~np.isnan(ratings)
+    filled = np.where(valid, ratings, 0.0)
+
+    # Observed: within each item (row), over its k ratings
+    k = valid.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        item_mean = filled.sum(axis=1) / k
+    item_dev = np.where(valid, ratings - item_mean[:, None, :], 0.0)
+    observed_sq = (k * (item_dev * item_dev).sum(axis=1)).sum(axis=0)
+    observed_pairs = (k * (k - 1) // 2).sum(axis=0)
+
+    # Expected: over every rating in the column
+    n = k.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = filled.sum(axis=(0, 1)) / n
+    dev = np.where(valid, ratings - mean, 0.0)
+    expected_sq = n * (dev * dev).sum(axis=(0, 1))
+    # Equal values are caught up front: their float mean can be off by an ulp,
+    # leaving a tiny non-zero spread where every difference is exactly 0
+    lowest = np.where(valid, ratings, np.inf).min(axis=(0, 1))
+    highest = np.where(valid, ratings, -np.inf).max(axis=(0, 1))
+
+    alphas: list[float] = []
+    for c in range(ratings.shape[2]):
+        if not observed_pairs[c] or n[c] < 2:
+            alphas.append(0.0)
+        elif lowest[c] == highest[c]:
+            alphas.append(1.0)  # No variance → perfect agreement
+        else:
+            d_o = observed_sq[c] / observed_pairs[c]
+            d_e = expected_sq[c] / (n[c] * (n[c] - 1) // 2)
+            alphas.append(round(1.0 - float(d_o / d_e), 4))
+    return alphas
+
+
 def pairwise_correlations(
     evaluations_by_conversation: dict[str, list[dict[str, float]]],
     dimension: str,
@@ -145,38 +148,42 @@ def pairwise_correlations(
 
     Returns list of {rater_a: int, rater_b: int, pearson_r: float, n: int}.
     """
-    conv_ids = list(evaluations_by_conversation.keys())
     max_raters = max((len(v) for v in evaluations_by_conversation.values()), default=0)
+    if max_raters < 2:
+        return []
+
+    # raters x items, NaN where a rater didn't score the dimension
+    scores = np.full((max_raters, len(evaluations_by_conversation)), np.nan)
+    for i, evals in enumerate(evaluations_by_conversation.values()):
+        for r, ev in enumerate(evals):
+            value = ev.get(dimension)
+            if value is not None:
+                scores[r, i] = value
+
+    # Every rater pair at once over raters x raters x items. Each pair only
+    # uses the items both rated, so its means are taken over that overlap
+    valid = ~np.isnan(scores)
+    both = valid[:, None, :] & valid[None, :, :]
+    n = both.sum(axis=2)
+    x = np.where(both, scores[:, None, :], 0.0)  # rater a's side of pair (a, b)
+    y = np.where(both, scores[None, :, :], 0.0)  # rater b's side
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dx = np.where(both, x - (x.sum(axis=2) / n)[:, :, None], 0.0)
+        dy = np.where(both, y - (y.sum(axis=2) / n)[:, :, None], 0.0)
+    cov = (dx * dy).sum(axis=2)
+    sx = np.sqrt((dx * dx).sum(axis=2))
+    sy = np.sqrt((dy * dy).sum(axis=2))
 
     results = []
     for ra, rb in combinations(range(max_raters), 2):
-        xs, ys = [], []
-        for cid in conv_ids:
-            evals = evaluations_by_conversation[cid]
-            if ra < len(evals) and rb < len(evals):
-                va = evals[ra].get(dimension)
-                vb = evals[rb].get(dimension)
-                if va is not None and vb is not None:
-                    xs.append(va)
-                    ys.append(vb)
-
-        if len(xs) >= 2:
-            r = _pearson(xs, ys)
-            results.append({"rater_a": ra, "rater_b": rb, "pearson_r": round(r, 4), "n": len(xs)})
+        count = int(n[ra, rb])
+        if count >= 2:
+            if sx[ra, rb] == 0 or sy[ra, rb] == 0:
+                corr = 0.0
+            else:
+                corr = float(cov[ra, rb] / (sx[ra, rb] * sy[ra, rb]))
+            results.append(
+                {"rater_a": ra, "rater_b": rb, "pearson_r": round(corr, 4), "n": count}
+            )
 
     return results
-
-
-def _pearson(x: list[float], y: list[float]) -> float:
-    """Pearson correlation — pure Python."""
-    n = len(x)
-    if n < 2:
-        return 0.0
-    mx = sum(x) / n
-    my = sum(y) / n
-    cov = sum((xi - mx) * (yi - my) for xi, yi in zip(x, y))
-    sx = math.sqrt(sum((xi - mx) ** 2 for xi in x))
-    sy = math.sqrt(sum((yi - my) ** 2 for yi in y))
-    if sx == 0 or sy == 0:
-        return 0.0
-    return cov / (sx * sy)
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.evaluation.lcs import lcs_length
 from app.evaluation.types import EvaluationResult, RubricDimension
 
 
@@ -81,25 +82,12 @@ class TrajectoryEvaluator:
                     tools.append(name)
         return tools
 
-    @staticmethod
-    def _lcs_length(seq_a: list[str], seq_b: list[str]) -> int:
-        """Longest common subsequence length via DP."""
-        m, n = len(seq_a), len(seq_b)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if seq_a[i - 1] == seq_b[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-        return dp[m][n]
-
     @staticmethod
     def _sequence_match_ratio(actual: list[str], expected: list[str]) -> float:
         """LCS length / len(expected). 1.0 = all expected tools called in order."""
         if not expected:
             return 1.0
-        return TrajectoryEvaluator._lcs_length(actual, expected) / len(expected)
+        return lcs_length(actual, expected) / len(expected)
 
     @staticmethod
     def _precision(actual: list[str], expected: list[str]) -> float:
@@ -135,12 +123,13 @@ class TrajectoryEvaluator:
         rank_map = {t: i for i, t in enumerate(expected)}
         ranks = [rank_map.get(t, 0) for t in shared]
 
+        # Every pair is counted, so the total is known up front
+        k = len(ranks)
+        total = k * (k - 1) // 2
         concordant = 0
-        total = 0
-        for i in range(len(ranks)):
-            for j in range(i + 1, len(ranks)):
-                total += 1
-                if ranks[i] < ranks[j]:
+        for i, rank in enumerate(ranks):
+            for later in ranks[i + 1:]:
+                if rank < later:
                     concordant += 1
 
         return concordant / total if total > 0 else 1.0
@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 
+import anyio.to_thread
 import structlog
 from fastapi import FastAPI, HTTPException
 from starlette.middleware.cors import CORSMiddleware
@@ -10,6 +11,8 @@ from app.config import settings
 from app.core.exceptions import AgentProbeError, agentprobe_error_handler, http_exception_handler
 from app.core.logging import setup_logging
 from app.core.middleware import RequestIdMiddleware, TimingMiddleware
+from app.db.redis_client import aclose_redis
+from app.engine.llm_client import aclose_http_client
 
 logger = structlog.get_logger()
 
@@ -17,11 +20,33 @@ logger = structlog.get_logger()
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging(debug=settings.debug)
-    logger.info("starting_agentprobe", app_name=settings.app_name, debug=settings.debug)
+    # AnyIO's default of 40 threads would cap sync dependencies and validators below the DB pool
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.threadpool_tokens or max(settings.postgres_pool_size * 2, 100)
+    logger.info(
+        "starting_agentprobe",
+        app_name=settings.app_name,
+        debug=settings.debug,
+        threadpool_tokens=limiter.total_tokens,
+    )
+    await _warm_chromadb()
     yield
+    await aclose_http_client()
+    await aclose_redis()
     logger.info("shutting_down_agentprobe")
 
 
+async def _warm_chromadb() -> None:
+    """Connect to ChromaDB at startup so the first request doesn't pay for it."""
+    try:
+        # Imported here so a missing chromadb install only costs the warm-up
+        from app.db.chromadb_client import ChromaDBClient
+
+        await anyio.to_thread.run_sync(ChromaDBClient.get_conversations_collection)
+    except Exception as e:
+        logger.warning("chromadb_warmup_failed", error=str(e))
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="AgentProbe API",
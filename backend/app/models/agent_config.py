@@ -27,4 +27,5 @@ class AgentConfig(Base):
     # Relationships
     eval_runs: Mapped[list["EvalRun"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="agent_config",
+        lazy="raise",
     )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import MetaData, func
+from sqlalchemy import DateTime, MetaData, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from uuid_extensions import uuid7
@@ -17,6 +17,9 @@ convention = {
 
 class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=convention)
+    # Every timestamp column is timestamptz in the migrations; binding aware datetimes
+    # as plain TIMESTAMP parameters is rejected by asyncpg
+    type_annotation_map = {datetime: DateTime(timezone=True)}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
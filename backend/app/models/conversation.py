@@ -32,12 +32,15 @@ class Conversation(Base):
     # Relationships
     eval_run: Mapped["EvalRun"] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="conversations",
+        lazy="raise",
     )
     evaluations: Mapped[list["Evaluation"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="conversation",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
     metrics: Mapped[list["Metric"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="conversation",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
@@ -45,12 +45,15 @@ class EvalRun(Base):
     # Relationships
     agent_config: Mapped["AgentConfig"] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="eval_runs",
+        lazy="raise",
     )
     scenario: Mapped["Scenario"] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="eval_runs",
+        lazy="raise",
     )
-    rubric: Mapped["Rubric | None"] = relationship()  # type: ignore[name-defined]  # noqa: F821
+    rubric: Mapped["Rubric | None"] = relationship(lazy="raise")  # type: ignore[name-defined]  # noqa: F821
     conversations: Mapped[list["Conversation"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="eval_run",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
@@ -7,11 +7,13 @@ from app.models.base import Base
 
 class Evaluation(Base):
     __tablename__ = "evaluations"
+    __table_args__ = {"postgresql_partition_by": "HASH (conversation_id)"}
 
     conversation_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey("conversations.id", ondelete="CASCADE"),
-        nullable=False,
+        # Partition key, so part of the primary key (migration 006)
+        primary_key=True,
         index=True,
     )
     evaluator_type: Mapped[str] = mapped_column(
@@ -34,4 +36,5 @@ class Evaluation(Base):
     # Relationships
     conversation: Mapped["Conversation"] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="evaluations",
+        lazy="raise",
     )
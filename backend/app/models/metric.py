@@ -9,12 +9,14 @@ class Metric(Base):
     __tablename__ = "metrics"
     __table_args__ = (
         UniqueConstraint("conversation_id", "metric_name", name="uq_metrics_conv_name"),
+        {"postgresql_partition_by": "HASH (conversation_id)"},
     )
 
     conversation_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey("conversations.id", ondelete="CASCADE"),
-        nullable=False,
+        # Partition key, so part of the primary key (migration 006)
+        primary_key=True,
         index=True,
     )
     metric_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
@@ -25,4 +27,5 @@ class Metric(Base):
     # Relationships
     conversation: Mapped["Conversation"] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="metrics",
+        lazy="raise",
     )
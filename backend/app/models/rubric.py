@@ -22,4 +22,5 @@ class Rubric(Base):
     # Relationships
     parent: Mapped["Rubric | None"] = relationship(
         remote_side="Rubric.id",
+        lazy="raise",
     )
@@ -96,7 +96,7 @@ class EvaluationCompletedConsumer(BaseConsumer):
             try:
                 producer = KafkaProducer()
                 for name, values in metric_groups.items():
-                    agg = aggregate_metric_values(name, values)
+                    agg = aggregate_metric_values(name, values).rounded()
                     event = MetricsAggregatedEvent(
                         eval_run_id=eval_run_id,
                         metric_name=agg.metric_name,
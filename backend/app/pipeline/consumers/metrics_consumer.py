@@ -7,6 +7,8 @@ import asyncio
 import structlog
 from sqlalchemy import select
 
+from app.db.redis_client import aclose_redis
+from app.db.response_cache import cache_key, invalidate
 from app.db.session import async_session_factory
 from app.models.eval_run import EvalRun
 from app.pipeline.consumers.base import BaseConsumer
@@ -33,7 +35,16 @@ class MetricsAggregatedConsumer(BaseConsumer):
         asyncio.run(self._mark_completed(str(eval_run_id)))
 
     async def _mark_completed(self, eval_run_id: str) -> None:
-        """Set eval run status to completed."""
+        """Set eval run status to completed and drop its cached GET response."""
+        try:
+            if await self._set_completed(eval_run_id):
+                await invalidate(cache_key("evalrun", eval_run_id))
+        finally:
+            # Pooled Redis connections belong to this event's loop
+            await aclose_redis()
+
+    async def _set_completed(self, eval_run_id: str) -> bool:
+        """Set eval run status to completed; True if the status changed."""
         async with async_session_factory() as session:
             result = await session.execute(
                 select(EvalRun).where(EvalRun.id == eval_run_id)
@@ -41,9 +52,11 @@ class MetricsAggregatedConsumer(BaseConsumer):
             eval_run = result.scalar_one_or_none()
             if not eval_run:
                 logger.warning("eval_run_not_found", eval_run_id=eval_run_id)
-                return
-
-            if eval_run.status != "completed":
-                eval_run.status = "completed"
-                await session.commit()
-                logger.info("eval_run_completed", eval_run_id=eval_run_id)
+                return False
+
+            if eval_run.status == "completed":
+                return False
+            eval_run.status = "completed"
+            await session.commit()
+            logger.info("eval_run_completed", eval_run_id=eval_run_id)
+            return True
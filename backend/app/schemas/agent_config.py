@@ -3,6 +3,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import MetadataField
+
 
 class AgentConfigCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
@@ -12,7 +14,9 @@ class AgentConfigCreate(BaseModel):
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: int = Field(default=4096, ge=1, le=200000)
     tools: list[dict[str, Any]] = Field(default_factory=list)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata_: dict[str, Any] = Field(default_factory=dict, alias="metadata")
+
+    model_config = {"populate_by_name": True}
 
 
 class AgentConfigUpdate(BaseModel):
@@ -23,9 +27,11 @@ class AgentConfigUpdate(BaseModel):
     temperature: float | None = Field(default=None, ge=0.0, le=2.0)
     max_tokens: int | None = Field(default=None, ge=1, le=200000)
     tools: list[dict[str, Any]] | None = None
-    metadata: dict[str, Any] | None = None
+    metadata_: dict[str, Any] | None = Field(default=None, alias="metadata")
     is_active: bool | None = None
 
+    model_config = {"populate_by_name": True}
+
 
 class AgentConfigResponse(BaseModel):
     id: str
@@ -36,7 +42,7 @@ class AgentConfigResponse(BaseModel):
     temperature: float
     max_tokens: int
     tools: list[dict[str, Any]]
-    metadata: dict[str, Any]
+    metadata_: MetadataField
     is_active: bool
     created_at: datetime
     updated_at: datetime
@@ -45,7 +51,8 @@ class AgentConfigResponse(BaseModel):
 
 
 class AgentConfigListResponse(BaseModel):
-    total: int
+    total: int | None  # None on cursor pages, which skip the count
     offset: int
     limit: int
     items: list[AgentConfigResponse]
+    next_cursor: str | None = None
@@ -1,6 +1,17 @@
 from enum import Enum
-
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+
+from pydantic import AliasChoices, BaseModel, Field
+
+# ORM models expose the "metadata" column as `metadata_` (the bare name is reserved
+# by declarative classes); responses read that attribute and serialize it as "metadata"
+MetadataField = Annotated[
+    dict[str, Any],
+    Field(
+        validation_alias=AliasChoices("metadata_", "metadata"),
+        serialization_alias="metadata",
+    ),
+]
 
 
 class PaginationParams(BaseModel):
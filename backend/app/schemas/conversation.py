@@ -3,12 +3,14 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from app.schemas.common import MetadataField
+
 
 class ConversationResponse(BaseModel):
     id: str
     eval_run_id: str
     sequence_num: int
-    turns: list[dict[str, Any]]
+    turns: list[dict[str, Any]] | None = None  # only populated with ?include=turns
     turn_count: int
     total_tokens: int
     total_input_tokens: int
@@ -16,7 +18,7 @@ class ConversationResponse(BaseModel):
     total_latency_ms: int
     status: str
     error_message: str | None
-    metadata: dict[str, Any]
+    metadata_: MetadataField
     started_at: datetime | None
     completed_at: datetime | None
     created_at: datetime
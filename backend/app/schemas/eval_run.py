@@ -31,7 +31,8 @@ class EvalRunResponse(BaseModel):
 
 
 class EvalRunListResponse(BaseModel):
-    total: int
+    total: int | None  # None on cursor pages, which skip the count
     offset: int
     limit: int
     items: list[EvalRunResponse]
+    next_cursor: str | None = None
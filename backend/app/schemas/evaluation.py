@@ -3,6 +3,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import MetadataField
+
 
 class HumanEvaluationCreate(BaseModel):
     conversation_id: str
@@ -24,7 +26,7 @@ class EvaluationResponse(BaseModel):
     overall_score: float | None
     reasoning: str | None
     per_turn_scores: list[dict[str, Any]] | None
-    metadata: dict[str, Any]
+    metadata_: MetadataField
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -44,6 +46,18 @@ class PairwiseComparisonRequest(BaseModel):
     rubric_id: str | None = None
 
 
+class ConversationPair(BaseModel):
+    conversation_id_a: str
+    conversation_id_b: str
+
+
+class PairwiseBatchRequest(BaseModel):
+    pairs: list[ConversationPair] = Field(..., min_length=1, max_length=200)
+    rubric_id: str | None = None
+    # Pairs packed into each judge prompt
+    batch_size: int = Field(default=5, ge=1, le=10)
+
+
 class PairwiseComparisonResponse(BaseModel):
     match_id: str
     winner: str
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import Any
 
 from pydantic import BaseModel
 
+from app.schemas.common import MetadataField
+
 
 class MetricResponse(BaseModel):
     id: str
@@ -10,7 +11,7 @@ class MetricResponse(BaseModel):
     metric_name: str
     value: float
     unit: str | None
-    metadata: dict[str, Any]
+    metadata_: MetadataField
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -6,6 +6,7 @@ and stores results. This is the bridge between the API and the engine.
 
 from __future__ import annotations
 
+import random
 from dataclasses import asdict
 from datetime import datetime, timezone
 
@@ -13,11 +14,13 @@ import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.engine.adversarial import AdversarialStrategy, NoOpAdversarial
+from app.config import settings
+from app.db.response_cache import cache_key, invalidate
+from app.engine.adversarial import NO_ADVERSARIAL, AdversarialStrategy, NoOpAdversarial
 from app.engine.environment import SimulationEnvironment
 from app.engine.llm_client import LLMClient
 from app.engine.persona import AgentPersona, UserPersona
-from app.engine.scenario_runner import ScenarioRunner
+from app.engine.scenario_runner import ScenarioRunner, run_scenarios
 from app.engine.tool_simulator import ToolSimulator
 from app.engine.types import ConversationResult
 from app.engine.user_simulator import UserSimulator
@@ -28,6 +31,10 @@ from app.models.scenario import Scenario
 
 logger = structlog.get_logger()
 
+# Conversations are simulated and committed in batches of this size so a large run
+# neither holds one long transaction nor accumulates every row in the session
+COMMIT_BATCH_SIZE = 20
+
 
 class AgentSimulationService:
     """Orchestrates full evaluation run: load config → run N conversations → store results."""
@@ -87,15 +94,20 @@ class AgentSimulationService:
         )
 
         try:
-            for seq_num in range(eval_run.num_conversations):
-                await self._run_single_conversation(
+            for batch_start in range(0, eval_run.num_conversations, COMMIT_BATCH_SIZE):
+                batch_end = min(batch_start + COMMIT_BATCH_SIZE, eval_run.num_conversations)
+                await self._run_conversation_batch(
                     eval_run=eval_run,
                     agent_persona=agent_persona,
                     user_persona=user_persona,
                     environment=environment,
                     initial_message=initial_message,
-                    sequence_num=seq_num,
+                    sequence_nums=range(batch_start, batch_end),
                 )
+                await self.db.commit()
+                if batch_start == 0:
+                    # running_simulation became visible with this commit
+                    await invalidate(cache_key("evalrun", eval_run_id))
 
             eval_run.status = "running_evaluation"
             eval_run.completed_at = datetime.now(timezone.utc)
@@ -108,41 +120,74 @@ class AgentSimulationService:
 
         await self.db.flush()
 
-    async def _run_single_conversation(
+    async def _run_conversation_batch(
         self,
         eval_run: EvalRun,
         agent_persona: AgentPersona,
         user_persona: UserPersona,
         environment: SimulationEnvironment,
         initial_message: str,
-        sequence_num: int,
-    ) -> Conversation:
-        """Run a single multi-turn conversation and store it."""
-        # Create conversation record
-        conv = Conversation(
-            eval_run_id=eval_run.id,
-            sequence_num=sequence_num,
-            status="running",
-            started_at=datetime.now(timezone.utc),
-        )
-        self.db.add(conv)
+        sequence_nums: range,
+    ) -> None:
+        """Simulate a batch of conversations concurrently and store them."""
+        # Create conversation records
+        convs = [
+            Conversation(
+                eval_run_id=eval_run.id,
+                sequence_num=seq_num,
+                status="running",
+                started_at=datetime.now(timezone.utc),
+            )
+            for seq_num in sequence_nums
+        ]
+        self.db.add_all(convs)
+        await self.db.flush()
+
+        # The session is untouched while conversations run; rows are written after
+        runners = [
+            self._build_runner(
+                agent_persona, user_persona, environment, initial_message, conv.sequence_num
+            )
+            for conv in convs
+        ]
+        results = await run_scenarios(runners, concurrency=settings.simulation_concurrency)
+
+        for conv, conv_result in zip(convs, results, strict=True):
+            self._store_conversation(eval_run, conv, conv_result)
+        # One flush writes the whole batch
         await self.db.flush()
+        for conv in convs:
+            self.db.expunge(conv)
 
-        # Build components
+    def _build_runner(
+        self,
+        agent_persona: AgentPersona,
+        user_persona: UserPersona,
+        environment: SimulationEnvironment,
+        initial_message: str,
+        sequence_num: int,
+    ) -> ScenarioRunner:
+        """Fresh engine components for one conversation."""
+        # One generator per conversation: a seeded run replays each conversation's
+        # tool failures and adversarial picks regardless of how the batch interleaves
+        rng = (
+            random.Random(f"{environment.seed}:{sequence_num}")
+            if environment.seed is not None
+            else random.Random()
+        )
         user_sim = UserSimulator(
             llm_client=self.llm_client,
             persona=user_persona,
             initial_message=initial_message,
         )
-        tool_sim = ToolSimulator(environment=environment)
-
-        adversarial: AdversarialStrategy | NoOpAdversarial
-        if environment.adversarial_turns:
-            adversarial = AdversarialStrategy(environment)
-        else:
-            adversarial = NoOpAdversarial()
+        tool_sim = ToolSimulator(environment=environment, rng=rng)
+        adversarial: AdversarialStrategy | NoOpAdversarial = (
+            AdversarialStrategy(environment, rng=rng)
+            if environment.adversarial_turns
+            else NO_ADVERSARIAL
+        )
 
-        runner = ScenarioRunner(
+        return ScenarioRunner(
             llm_client=self.llm_client,
             agent_persona=agent_persona,
             user_simulator=user_sim,
@@ -151,10 +196,13 @@ class AgentSimulationService:
             adversarial=adversarial,
         )
 
-        # Run the conversation
-        conv_result: ConversationResult = await runner.run()
-
-        # Store results
+    def _store_conversation(
+        self,
+        eval_run: EvalRun,
+        conv: Conversation,
+        conv_result: ConversationResult,
+    ) -> None:
+        """Write a finished conversation's results and announce it."""
         conv.turns = [asdict(t) for t in conv_result.turns]
         conv.turn_count = conv_result.turn_count
         conv.total_tokens = conv_result.total_tokens
@@ -166,12 +214,10 @@ class AgentSimulationService:
         conv.completed_at = datetime.now(timezone.utc)
         conv.metadata_ = {"simulation_status": conv_result.status}
 
-        await self.db.flush()
-
         logger.info(
             "conversation_completed",
             conversation_id=conv.id,
-            sequence_num=sequence_num,
+            sequence_num=conv.sequence_num,
             turns=conv_result.turn_count,
             status=conv_result.status,
         )
@@ -194,5 +240,3 @@ class AgentSimulationService:
             producer.produce(CONVERSATION_COMPLETED, event.to_envelope(), key=conv.id)
         except Exception as kafka_err:
             logger.warning("kafka_event_failed", error=str(kafka_err))
-
-        return conv
@@ -5,6 +5,7 @@ Mirrors the AgentSimulationService pattern: load from DB → run evaluators →
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any
 
 import structlog
@@ -12,6 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.db.bulk import bulk_upsert
 from app.engine.llm_client import LLMClient
 from app.evaluation.automated_metrics import AutomatedMetricsCalculator
 from app.evaluation.model_judge import ModelJudgeEvaluator
@@ -257,16 +259,27 @@ class EvaluationService:
         metric_values: list[MetricValue],
     ) -> None:
         """Persist computed metrics to the database."""
-        for mv in metric_values:
-            metric = Metric(
-                conversation_id=conversation_id,
-                metric_name=mv.name,
-                value=mv.value,
-                unit=mv.unit,
-                metadata_=mv.metadata,
-            )
-            self.db.add(metric)
-        await self.db.flush()
+        # One client-side timestamp for the batch instead of a server now() per row
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "conversation_id": conversation_id,
+                "metric_name": mv.name,
+                "value": mv.value,
+                "unit": mv.unit,
+                "metadata": mv.metadata,
+                "created_at": now,
+            }
+            for mv in metric_values
+        ]
+        # Upsert on (conversation_id, metric_name) so a retried task overwrites
+        await bulk_upsert(
+            self.db,
+            Metric.__table__,  # type: ignore[arg-type]
+            rows,
+            conflict_columns=["conversation_id", "metric_name"],
+            update_columns=["value", "unit", "metadata"],
+        )
 
     # ------------------------------------------------------------------
     # Scenario helpers for reference + trajectory evaluators
@@ -6,7 +6,9 @@ import asyncio
 
 import structlog
 
+from app.db.redis_client import aclose_redis
 from app.db.session import async_session_factory
+from app.engine.llm_client import aclose_http_client
 from app.services.evaluation_service import EvaluationService
 from app.workers.celery_app import celery_app
 
@@ -22,10 +24,15 @@ def evaluate_conversation(self: object, conversation_id: str, rubric_id: str | N
     logger.info("evaluation_task_started", conversation_id=conversation_id)
 
     async def _run() -> None:
-        async with async_session_factory() as session:
-            service = EvaluationService(db=session)
-            await service.evaluate_conversation(conversation_id, rubric_id)
-            await session.commit()
+        try:
+            async with async_session_factory() as session:
+                service = EvaluationService(db=session)
+                await service.evaluate_conversation(conversation_id, rubric_id)
+                await session.commit()
+        finally:
+            # Pooled LLM and Redis connections belong to this task's loop
+            await aclose_http_client()
+            await aclose_redis()
 
     asyncio.run(_run())
 
@@ -43,18 +50,21 @@ def evaluate_all_conversations(self: object, eval_run_id: str, rubric_id: str |
 
     async def _dispatch() -> int:
         async with async_session_factory() as session:
-            result = await session.execute(
-                select(Conversation.id).where(
+            # Server-side cursor: ids are dispatched as they stream in, 500 per fetch
+            result = await session.stream_scalars(
+                select(Conversation.id)
+                .where(
                     Conversation.eval_run_id == eval_run_id,
                     Conversation.status == "completed",
                 )
+                .execution_options(yield_per=500)
             )
-            conv_ids = [row[0] for row in result.all()]
-
-            for conv_id in conv_ids:
+            count = 0
+            async for conv_id in result:
                 evaluate_conversation.delay(conv_id, rubric_id)
+                count += 1
 
-            return len(conv_ids)
+            return count
 
     count = asyncio.run(_dispatch())
 
@@ -6,7 +6,10 @@ import asyncio
 
 import structlog
 
+from app.db.redis_client import aclose_redis
+from app.db.response_cache import cache_key, invalidate
 from app.db.session import async_session_factory
+from app.engine.llm_client import aclose_http_client
 from app.services.agent_simulation import AgentSimulationService
 from app.workers.celery_app import celery_app
 
@@ -23,10 +26,17 @@ def run_simulation(self: object, eval_run_id: str) -> dict[str, str]:
     logger.info("simulation_task_started", eval_run_id=eval_run_id)
 
     async def _run() -> None:
-        async with async_session_factory() as session:
-            service = AgentSimulationService(db=session)
-            await service.run_eval(eval_run_id)
-            await session.commit()
+        try:
+            async with async_session_factory() as session:
+                service = AgentSimulationService(db=session)
+                await service.run_eval(eval_run_id)
+                await session.commit()
+            # The run's final status is committed; don't leave pollers on the cached one
+            await invalidate(cache_key("evalrun", eval_run_id))
+        finally:
+            # Pooled LLM and Redis connections belong to this task's loop
+            await aclose_http_client()
+            await aclose_redis()
 
     asyncio.run(_run())
 
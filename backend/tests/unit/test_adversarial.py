@@ -42,6 +42,14 @@ class TestAdversarialStrategy:
             msg = strategy.generate_adversarial_input(0)
             assert msg in all_messages
 
+    def test_seeded_strategies_pick_the_same_messages(self) -> None:
+        env = SimulationEnvironment(adversarial_turns=[0], seed=7)
+        first = AdversarialStrategy(env)
+        second = AdversarialStrategy(env)
+
+        picks = [first.generate_adversarial_input(0) for _ in range(20)]
+        assert picks == [second.generate_adversarial_input(0) for _ in range(20)]
+
 
 class TestNoOpAdversarial:
     def test_never_injects(self) -> None:
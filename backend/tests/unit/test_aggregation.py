@@ -1,6 +1,10 @@
 """Unit tests for metric aggregation, z-score calibration, weighted averaging."""
 
+import random
+
 from app.evaluation.aggregation import (
+    StreamingAggregator,
+    WeightedAverager,
     aggregate_metric_values,
     weighted_dimension_average,
     z_score_calibrate,
@@ -32,6 +36,49 @@ class TestAggregateMetricValues:
         assert agg.std_dev == 0.0
         assert agg.sample_count == 1
 
+    def test_rounded_copy(self) -> None:
+        agg = aggregate_metric_values("ratio", [1 / 3, 2 / 3])
+        assert agg.mean == 0.5
+        assert agg.min_val == 1 / 3
+        rounded = agg.rounded()
+        assert rounded.min_val == 0.3333
+        assert rounded.max_val == 0.6667
+        assert rounded.sample_count == 2
+
+
+class TestStreamingAggregator:
+
+    def test_matches_batch_statistics(self) -> None:
+        rng = random.Random(7)
+        values = [rng.gauss(50.0, 10.0) for _ in range(5000)]
+        agg = StreamingAggregator("latency")
+        agg.extend(iter(values))
+        streamed = agg.finalize()
+        exact = aggregate_metric_values("latency", values)
+
+        assert streamed.sample_count == exact.sample_count
+        assert abs(streamed.mean - exact.mean) < 1e-9
+        assert abs(streamed.std_dev - exact.std_dev) < 1e-9
+        assert streamed.min_val == exact.min_val
+        assert streamed.max_val == exact.max_val
+        # P-square estimate, not exact
+        assert abs(streamed.median - exact.median) < 0.5
+
+    def test_small_samples_exact(self) -> None:
+        agg = StreamingAggregator("x")
+        agg.extend([3.0, 1.0, 4.0, 2.0])
+        result = agg.finalize()
+        assert result.median == 2.5
+        assert result.mean == 2.5
+
+    def test_empty_and_single(self) -> None:
+        agg = StreamingAggregator("x")
+        assert agg.finalize().sample_count == 0
+        agg.push(42.0)
+        result = agg.finalize()
+        assert result.median == 42.0
+        assert result.std_dev == 0.0
+
 
 class TestZScoreCalibrate:
 
@@ -48,6 +95,16 @@ class TestZScoreCalibrate:
         result = z_score_calibrate(scores)
         assert result == scores  # std_dev = 0 → return originals
 
+    def test_identical_inexact_values_returns_originals(self) -> None:
+        scores = [0.1] * 7
+        assert z_score_calibrate(scores) == scores
+
+    def test_unit_variance_unrounded(self) -> None:
+        z_scores = z_score_calibrate([1.0, 2.0, 4.0])
+        mean = sum(z_scores) / 3
+        variance = sum((z - mean) ** 2 for z in z_scores) / 2
+        assert abs(variance - 1.0) < 1e-12
+
     def test_single_value_returns_original(self) -> None:
         assert z_score_calibrate([7.0]) == [7.0]
 
@@ -73,3 +130,12 @@ class TestWeightedDimensionAverage:
 
     def test_empty_scores(self) -> None:
         assert weighted_dimension_average({}, {"a": 0.5}) == 0.0
+
+    def test_averager_reused_across_conversations(self) -> None:
+        weights = {"helpfulness": 0.6, "safety": 0.4, "tone": 0.0}
+        averager = WeightedAverager(weights)
+        # The same averager serves every conversation; tone's zero weight never counts
+        assert abs(averager.compute({"helpfulness": 8.0, "safety": 10.0}) - 8.8) < 0.01
+        assert abs(averager.compute({"safety": 3.0}) - 3.0) < 0.01
+        assert averager.compute({"tone": 9.0}) == 0.0
+        assert averager.compute({}) == 0.0
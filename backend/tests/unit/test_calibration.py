@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from app.evaluation.calibration import (
@@ -28,6 +29,13 @@ class TestPearsonR:
         r = pearson_r([1, 2, 3, 4], [1, 3, 2, 4])
         assert -1 <= r <= 1
 
+    def test_exact_agrees_with_default(self):
+        rng = np.random.default_rng(3)
+        x = rng.normal(0.0, 1e-3, 100_000)
+        y = 0.5 * x + rng.normal(0.0, 1e-3, 100_000)
+        assert pearson_r(x, y, exact=True) == pytest.approx(pearson_r(x, y), abs=1e-12)
+        assert pearson_r([5, 5, 5], [1, 2, 3], exact=True) == 0.0
+
 
 class TestSpearmanRho:
     def test_perfect_rank_correlation(self):
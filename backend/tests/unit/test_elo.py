@@ -26,6 +26,11 @@ class TestExpectedScore:
         b = expected_score(1400, 1600)
         assert round(a + b, 6) == 1.0
 
+    def test_matches_power_form(self):
+        for diff in range(-1200, 1201, 7):
+            reference = 1.0 / (1.0 + 10.0 ** (diff / 400.0))
+            assert abs(expected_score(1500.0, 1500.0 + diff) - reference) < 1e-12
+
 
 class TestUpdateRatings:
     def test_winner_gains_loser_loses(self):
@@ -86,3 +91,28 @@ class TestComputeRankings:
         matches = [{"agent_config_id_a": "a", "agent_config_id_b": "b", "result": "b_wins"}]
         ratings = compute_rankings(matches)
         assert ratings["b"] > ratings["a"]
+
+    def test_matches_sequential_replay(self):
+        """Wave-batched updates must equal applying update_ratings match by match."""
+        agents = [f"agent-{i}" for i in range(40)]
+        outcomes = ["a_wins", "b_wins", "draw"]
+        matches = [
+            {"agent_config_id_a": a, "agent_config_id_b": b, "result": outcomes[(i + j) % 3]}
+            for i, a in enumerate(agents)
+            for j, b in enumerate(agents)
+            if i < j
+        ]
+
+        expected: dict[str, float] = {}
+        for m in matches:
+            a, b = m["agent_config_id_a"], m["agent_config_id_b"]
+            expected.setdefault(a, DEFAULT_RATING)
+            expected.setdefault(b, DEFAULT_RATING)
+            if m["result"] == "b_wins":
+                elo = update_ratings(expected[b], expected[a])
+                expected[b], expected[a] = elo.winner_new_rating, elo.loser_new_rating
+            else:
+                elo = update_ratings(expected[a], expected[b], draw=m["result"] == "draw")
+                expected[a], expected[b] = elo.winner_new_rating, elo.loser_new_rating
+
+        assert compute_rankings(matches) == expected
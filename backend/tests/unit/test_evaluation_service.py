@@ -90,7 +90,7 @@ class TestEvaluationService:
 
     @pytest.mark.asyncio
     async def test_metrics_stored(self) -> None:
-        """Automated metrics should be stored via db.add()."""
+        """Automated metrics should be stored in one batched insert."""
         mock_db = AsyncMock()
         mock_conv = _make_mock_conversation()
 
@@ -107,5 +107,9 @@ class TestEvaluationService:
 
             await service.evaluate_conversation("conv-test-123")
 
-        # db.add should be called for: 2 evaluations + 8 metrics = 10 times
-        assert mock_db.add.call_count == 10
+        # db.add covers the 2 evaluations; the 8 metrics go through one executemany
+        assert mock_db.add.call_count == 2
+        batches = [c.args[1] for c in mock_db.execute.call_args_list if len(c.args) > 1]
+        assert len(batches) == 1
+        assert len(batches[0]) == 8
+        assert all(row["conversation_id"] == "conv-test-123" for row in batches[0])
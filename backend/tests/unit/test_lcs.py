@@ -0,0 +1,20 @@
+"""Tests for the shared LCS kernels."""
+
+import random
+
+from app.evaluation.lcs import _lcs_length_numpy, _lcs_length_python, lcs_length
+
+
+class TestLCSLength:
+    def test_known_lengths(self):
+        assert lcs_length(["a", "b", "c", "d"], ["a", "c", "e"]) == 2
+        assert lcs_length(["a", "b"], ["x", "y"]) == 0
+        assert lcs_length([], ["a"]) == 0
+
+    def test_numpy_kernel_matches_python(self):
+        rng = random.Random(11)
+        words = ["the", "cat", "sat", "on", "a", "mat", "dog"]
+        for m, n in [(1, 1), (3, 200), (40, 40), (120, 75)]:
+            a = [rng.choice(words) for _ in range(m)]
+            e = [rng.choice(words) for _ in range(n)]
+            assert _lcs_length_numpy(a, e) == _lcs_length_python(a, e)
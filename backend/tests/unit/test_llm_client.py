@@ -0,0 +1,72 @@
+"""Unit tests for the LLM client's Redis response cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from app.engine import llm_client
+from app.engine.types import LLMResponse
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    fake = AsyncMock()
+    monkeypatch.setattr(llm_client, "redis_pool", fake)
+    return fake
+
+
+@pytest.fixture
+def completion(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    message = SimpleNamespace(content="ok", tool_calls=None)
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        usage=None,
+        model="m",
+    )
+    fake = AsyncMock(return_value=response)
+    monkeypatch.setattr(llm_client, "acompletion", fake)
+    monkeypatch.setattr(llm_client, "_install_http_client", lambda: None)
+    monkeypatch.setattr(llm_client.settings, "llm_cache_enabled", True)
+    return fake
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, redis: AsyncMock) -> None:
+        response = LLMResponse(content="hi", input_tokens=3, output_tokens=1, model="m")
+        await llm_client._set_cached("llm:k", response)
+        redis.get.return_value = redis.set.call_args.args[1]
+
+        assert await llm_client._get_cached("llm:k") == response
+
+    @pytest.mark.asyncio
+    async def test_undecodable_entry_is_dropped(self, redis: AsyncMock) -> None:
+        redis.get.return_value = b"not json"
+
+        assert await llm_client._get_cached("llm:k") is None
+        redis.delete.assert_awaited_once_with("llm:k")
+
+    @pytest.mark.asyncio
+    async def test_stale_schema_entry_is_dropped(self, redis: AsyncMock) -> None:
+        redis.get.return_value = orjson.dumps({"content": "hi", "tool_calls": [], "gone": 1})
+
+        assert await llm_client._get_cached("llm:k") is None
+        redis.delete.assert_awaited_once_with("llm:k")
+
+    @pytest.mark.asyncio
+    async def test_calls_opt_in_per_request(self, redis: AsyncMock, completion: AsyncMock) -> None:
+        redis.get.return_value = None
+        client = llm_client.LLMClient()
+        messages = [{"role": "user", "content": "hi"}]
+
+        await client.chat(model="m", messages=messages)
+        redis.get.assert_not_called()
+        redis.set.assert_not_called()
+
+        await client.chat(model="m", messages=messages, cache=True)
+        redis.get.assert_awaited_once()
+        redis.set.assert_awaited_once()
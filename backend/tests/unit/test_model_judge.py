@@ -8,7 +8,7 @@ import pytest
 
 from app.engine.types import LLMResponse, ToolCall
 from app.evaluation.model_judge import ModelJudgeEvaluator
-from app.evaluation.types import DEFAULT_DIMENSIONS
+from app.evaluation.types import DEFAULT_DIMENSIONS, RubricDimension
 
 
 def _make_judge_tool_response(dimensions: list) -> LLMResponse:
@@ -87,3 +87,38 @@ class TestModelJudge:
         judge = ModelJudgeEvaluator(llm_client=mock_llm, model="test-model")
         result = await judge.evaluate(_make_conversation(), DEFAULT_DIMENSIONS)
         assert result.evaluator_type == "model_judge"
+
+    @pytest.mark.asyncio
+    async def test_content_fallback_parses_overlapping_names(self) -> None:
+        """Free-text scores are found per dimension, even when one name contains another."""
+        dims = [
+            RubricDimension(name="accuracy", description="", weight=1.0, criteria=[]),
+            RubricDimension(name="factual_accuracy", description="", weight=1.0, criteria=[]),
+        ]
+        judge = ModelJudgeEvaluator(llm_client=AsyncMock(), model="test-model")
+        scores, _ = judge._parse_content_fallback("Factual_Accuracy: 8\nmissing: 2", dims)
+
+        assert scores == {"accuracy": 8.0, "factual_accuracy": 8.0}
+
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_keeps_order_and_isolates_failures(self) -> None:
+        """One failed judge call doesn't sink the batch; results stay in input order."""
+        mock_llm = AsyncMock()
+        mock_llm.chat = AsyncMock(
+            side_effect=[
+                _make_judge_tool_response(DEFAULT_DIMENSIONS),
+                RuntimeError("provider down"),
+                _make_judge_tool_response(DEFAULT_DIMENSIONS),
+            ]
+        )
+
+        judge = ModelJudgeEvaluator(llm_client=mock_llm, model="test-model")
+        results = await judge.evaluate_batch(
+            [_make_conversation()] * 3, DEFAULT_DIMENSIONS, concurrency=1,
+        )
+
+        assert len(results) == 3
+        assert isinstance(results[1], RuntimeError)
+        for result in (results[0], results[2]):
+            assert not isinstance(result, BaseException)
+            assert abs(result.overall_score - 7.5) < 0.01
@@ -96,3 +96,96 @@ class TestPairwiseJudge:
         assert "helpfulness_preference" in props
         assert "accuracy_preference" in props
         assert props["winner"]["enum"] == ["a", "b", "draw"]
+
+
+def _make_batch_response(entries: list[dict]) -> LLMResponse:
+    return LLMResponse(
+        content="",
+        tool_calls=[
+            ToolCall(id="tc1", name="submit_comparisons", arguments={"comparisons": entries})
+        ],
+    )
+
+
+def _batch_entry(pair: int, winner: str = "a") -> dict:
+    return {
+        "pair": pair,
+        "winner": winner,
+        "confidence": 0.8,
+        "reasoning": f"Pair {pair}",
+        "helpfulness_preference": winner,
+        "accuracy_preference": "draw",
+    }
+
+
+class TestPairwiseJudgeBatch:
+    @pytest.mark.asyncio
+    async def test_pairs_packed_per_call(self):
+        mock_client = AsyncMock()
+        mock_client.chat.side_effect = [
+            _make_batch_response([_batch_entry(1), _batch_entry(2)]),
+            _make_batch_response([_batch_entry(1), _batch_entry(2)]),
+            _make_batch_response([_batch_entry(1)]),
+        ]
+
+        evaluator = PairwiseJudgeEvaluator(llm_client=mock_client, model="test-model")
+        results = await evaluator.compare_batch([(TURNS_A, TURNS_B)] * 5, DIMENSIONS, batch_size=2)
+
+        assert mock_client.chat.call_count == 3
+        assert len(results) == 5
+        assert len({r.match_id for r in results}) == 5
+
+    @pytest.mark.asyncio
+    async def test_verdicts_unswapped_per_pair(self):
+        mock_client = AsyncMock()
+        mock_client.chat.return_value = _make_batch_response(
+            [_batch_entry(i, winner="a") for i in range(1, 5)]
+        )
+
+        evaluator = PairwiseJudgeEvaluator(llm_client=mock_client, model="test-model")
+        results = await evaluator.compare_batch([(TURNS_A, TURNS_B)] * 4, DIMENSIONS, batch_size=4)
+
+        # The judge always picked the presented "A"; that is B whenever the pair was swapped
+        for result in results:
+            expected = "b" if result.metadata["swapped"] else "a"
+            assert result.winner == expected
+            assert result.dimension_preferences["helpfulness"] == expected
+            assert result.metadata["batch_size"] == 4
+
+    @pytest.mark.asyncio
+    async def test_missing_pair_falls_back_to_draw(self):
+        mock_client = AsyncMock()
+        mock_client.chat.return_value = _make_batch_response([_batch_entry(2, winner="a")])
+
+        evaluator = PairwiseJudgeEvaluator(llm_client=mock_client, model="test-model")
+        results = await evaluator.compare_batch([(TURNS_A, TURNS_B)] * 2, DIMENSIONS)
+
+        assert results[0].winner == "draw"
+        assert results[0].confidence == 0.5
+        assert results[1].reasoning == "Pair 2"
+
+    def test_batch_tool_schema(self):
+        evaluator = PairwiseJudgeEvaluator(llm_client=MagicMock(), model="test")
+        tool = evaluator._build_batch_tool(DIMENSIONS)
+
+        items = tool["function"]["parameters"]["properties"]["comparisons"]["items"]
+        assert tool["function"]["name"] == "submit_comparisons"
+        assert items["required"][0] == "pair"
+        assert "helpfulness_preference" in items["properties"]
+
+    def test_batch_prompt_matches_single_transcripts(self):
+        evaluator = PairwiseJudgeEvaluator(llm_client=MagicMock(), model="test")
+        turns_c = [
+            {
+                "role": "assistant",
+                "content": "Looking it up.",
+                "tool_calls": [{"name": "search", "arguments": {"q": "refund"}}],
+            },
+        ]
+        _, messages = evaluator._build_batch_prompt([(TURNS_A, turns_c), (turns_c, [])], DIMENSIONS)
+
+        content = messages[0]["content"]
+        rendered_c = evaluator._format_transcript(turns_c, "Agent B")
+        assert rendered_c in content
+        assert '  → TOOL_CALL: search({"q":"refund"})' in rendered_c
+        assert content.endswith("---\n\n## Agent B\n")
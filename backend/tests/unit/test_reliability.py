@@ -1,5 +1,7 @@
 """Tests for interrater reliability (Krippendorff's alpha)."""
 
+from itertools import combinations
+
 import pytest
 
 from app.evaluation.reliability import (
@@ -66,6 +68,16 @@ class TestKrippendorffsAlpha:
         alpha = krippendorffs_alpha(matrix)
         assert alpha < 0.5
 
+    def test_matches_pairwise_definition(self):
+        """Closed-form sums agree with enumerating every pair."""
+        matrix = [[3.0, 4.0, None], [7.5, 6.0, 8.0], [2.0, None, 1.0], [9.0, 9.0, 5.5]]
+        rows = [[v for v in row if v is not None] for row in matrix]
+        values = [v for row in rows for v in row]
+        obs = [(a - b) ** 2 for row in rows for a, b in combinations(row, 2)]
+        exp = [(a - b) ** 2 for a, b in combinations(values, 2)]
+        expected = 1.0 - (sum(obs) / len(obs)) / (sum(exp) / len(exp))
+        assert krippendorffs_alpha(matrix) == pytest.approx(expected, abs=1e-4)
+
 
 class TestComputeReliability:
     def test_returns_result(self):
@@ -107,3 +119,20 @@ class TestPairwiseCorrelations:
         assert results[0]["rater_a"] == 0
         assert results[0]["rater_b"] == 1
         assert results[0]["pearson_r"] == 1.0  # Perfect linear
+
+    def test_pairs_use_only_shared_items(self):
+        # Rater 2 skips c2, so (0, 2) and (1, 2) are centred on c1, c3, c4 alone
+        evals = {
+            "c1": [{"h": 1.0}, {"h": 2.0}, {"h": 4.0}],
+            "c2": [{"h": 9.0}, {"h": 1.0}, {}],
+            "c3": [{"h": 3.0}, {"h": 5.0}, {"h": 2.0}],
+            "c4": [{"h": 2.0}, {"h": 3.0}, {"h": 3.0}],
+        }
+        results = pairwise_correlations(evals, "h")
+        assert [(r["rater_a"], r["rater_b"], r["n"]) for r in results] == [
+            (0, 1, 4),
+            (0, 2, 3),
+            (1, 2, 3),
+        ]
+        assert results[1]["pearson_r"] == -1.0
+        assert results[2]["pearson_r"] == pytest.approx(-0.9820, abs=1e-4)
@@ -6,6 +6,8 @@ Tests verify the orchestration logic, not the LLM output.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from unittest.mock import AsyncMock
 
 import pytest
@@ -13,7 +15,7 @@ import pytest
 from app.engine.adversarial import AdversarialStrategy, NoOpAdversarial
 from app.engine.environment import SimulationEnvironment
 from app.engine.persona import AgentPersona, UserPersona
-from app.engine.scenario_runner import ScenarioRunner
+from app.engine.scenario_runner import ScenarioRunner, run_scenarios
 from app.engine.tool_simulator import ToolSimulator
 from app.engine.types import LLMResponse, ToolCall
 from app.engine.user_simulator import UserSimulator
@@ -255,6 +257,53 @@ class TestToolCalls:
         assert not tool_turns[0].tool_results[0].is_error
 
 
+    @pytest.mark.asyncio
+    async def test_parallel_tool_calls_run_concurrently(
+        self, mock_llm_client: AsyncMock, agent_persona: AgentPersona,
+        user_persona: UserPersona,
+    ) -> None:
+        """Several tool calls in one turn cost one tool latency, results in call order."""
+        env = SimulationEnvironment(max_turns=1, tool_latency_ms=100)
+        runner = build_runner(mock_llm_client, agent_persona, user_persona, env)
+        calls = [ToolCall(id=f"call_{i}", name="search", arguments={}) for i in range(5)]
+
+        start = time.perf_counter()
+        results = await runner._handle_tool_calls(calls)
+        elapsed = time.perf_counter() - start
+
+        assert [r.tool_call_id for r in results] == [c.id for c in calls]
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_tool_results_stay_in_agent_history(
+        self, agent_persona: AgentPersona, user_persona: UserPersona,
+    ) -> None:
+        """Later agent calls see the tool call answered by its tool message."""
+        mock_llm = AsyncMock()
+        seen_roles: list[list[str]] = []
+
+        async def mock_chat(**kwargs: object) -> LLMResponse:
+            messages = kwargs["messages"]
+            assert isinstance(messages, list)
+            seen_roles.append([m["role"] for m in messages])
+            if len(seen_roles) == 1:
+                return make_llm_response(
+                    content="Searching.",
+                    tool_calls=[ToolCall(id="call_1", name="search", arguments={})],
+                )
+            return make_llm_response("Found it.")
+
+        mock_llm.chat = mock_chat
+
+        env = SimulationEnvironment(max_turns=2)
+        runner = build_runner(mock_llm, agent_persona, user_persona, env)
+        await runner.run()
+
+        # agent, follow-up, user sim, agent
+        assert seen_roles[1] == ["user", "assistant", "tool"]
+        assert seen_roles[3] == ["user", "assistant", "tool", "assistant", "user"]
+
+
 class TestAdversarialInjection:
     """Test adversarial message injection."""
 
@@ -309,3 +358,51 @@ class TestErrorHandling:
         assert result.status == "failed"
         assert result.error_message is not None
         assert "API connection failed" in result.error_message
+
+
+class TestRunScenarios:
+    """Batch entrypoint running several conversations concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(
+        self, agent_persona: AgentPersona, user_persona: UserPersona,
+        environment: SimulationEnvironment,
+    ) -> None:
+        """No more than `concurrency` conversations are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_chat(**kwargs: object) -> LLMResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_llm_response("OK")
+
+        mock_llm = AsyncMock()
+        mock_llm.chat = mock_chat
+        env = SimulationEnvironment(max_turns=1)
+        runners = [build_runner(mock_llm, agent_persona, user_persona, env) for _ in range(6)]
+
+        results = await run_scenarios(runners, concurrency=2)
+
+        assert len(results) == 6
+        assert all(r.status == "completed" for r in results)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_raising_runner_does_not_sink_batch(
+        self, mock_llm_client: AsyncMock, agent_persona: AgentPersona,
+        user_persona: UserPersona, environment: SimulationEnvironment,
+    ) -> None:
+        """A runner that raises becomes a failed result in its slot."""
+        good = build_runner(mock_llm_client, agent_persona, user_persona, environment)
+        bad = build_runner(mock_llm_client, agent_persona, user_persona, environment)
+        bad.run = AsyncMock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+
+        results = await run_scenarios([bad, good])
+
+        assert results[0].status == "failed"
+        assert results[0].error_message == "boom"
+        assert results[1].status == "completed"
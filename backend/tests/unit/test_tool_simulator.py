@@ -74,6 +74,20 @@ class TestToolSimulatorNormal:
         data = json.loads(result.content)
         assert data["custom"] is True
 
+    @pytest.mark.asyncio
+    async def test_partial_match_prefers_longest_key(
+        self, env_normal: SimulationEnvironment
+    ) -> None:
+        custom = {"docs_search": json.dumps({"docs": True})}
+        sim = ToolSimulator(environment=env_normal, custom_responses=custom)
+        call = ToolCall(id="call_5", name="docs_search_v2", arguments={})
+
+        result = await sim.execute(call)
+
+        # "search" matches too, but the more specific key wins
+        data = json.loads(result.content)
+        assert data["docs"] is True
+
 
 class TestToolSimulatorFailures:
     """Failing mode — tools return errors based on failure rate."""
@@ -99,6 +113,19 @@ class TestToolSimulatorFailures:
             result = await sim.execute(call)
             assert not result.is_error
 
+    @pytest.mark.asyncio
+    async def test_seeded_failures_replay(self) -> None:
+        env = SimulationEnvironment(tool_failure_rate=0.5, seed=42)
+        call = ToolCall(id="call_8", name="search", arguments={"query": "test"})
+
+        async def failure_pattern() -> list[bool]:
+            sim = ToolSimulator(environment=env)
+            return [(await sim.execute(call)).is_error for _ in range(30)]
+
+        pattern = await failure_pattern()
+        assert pattern == await failure_pattern()
+        assert any(pattern) and not all(pattern)
+
 
 class TestToolSimulatorDegraded:
     """Degraded mode — tools add latency."""
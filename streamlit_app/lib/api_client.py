@@ -115,7 +115,7 @@ class AgentProbeClient:
         return r.json()
 
     def get_conversation(self, conv_id: str) -> dict[str, Any]:
-        r = self.client.get(self._url(f"/conversations/{conv_id}"))
+        r = self.client.get(self._url(f"/conversations/{conv_id}"), params={"include": "turns"})
         r.raise_for_status()
         return r.json()
 